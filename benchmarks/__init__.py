@@ -0,0 +1 @@
+# benchmarks - Scripts de medición (ejecutar con: python -m benchmarks.<nombre>)
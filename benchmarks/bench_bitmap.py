@@ -0,0 +1,60 @@
+# benchmarks/bench_bitmap.py - FPS del render en mapa de bits (sin HTTP): dibujo, codificación y frames repetidos
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.synthetic_backend import SyntheticBackend
+from src.render import display_values, hardware_frame
+from src.monitors.window import TimeWindow
+from src.render.bitmap import BitmapCanvas, hardware_bitmap
+from src.render.widgets import BarGraph, Sparkline, graph_bitmap
+
+
+def _fps(frames: int, fn) -> float:
+    start = time.perf_counter()
+    for i in range(frames):
+        fn(i)
+    return frames / (time.perf_counter() - start)
+
+
+def run(frames: int = 20000):
+    backend = SyntheticBackend(seed=0)
+    backend.open()
+    samples = [display_values(backend.read()) for _ in range(256)]
+    canvas = BitmapCanvas()
+    hardware_bitmap(canvas, **samples[0]).frame()  # Calienta la caché del atlas
+
+    text = _fps(frames, lambda i: hardware_frame(**samples[i % 256]))
+    draw = _fps(frames, lambda i: hardware_bitmap(canvas, **samples[i % 256]))
+    full = _fps(frames, lambda i: hardware_bitmap(canvas, **samples[i % 256]).frame())
+    encoded, packed = canvas.encoded, canvas.rows_packed
+    same = _fps(frames, lambda i: hardware_bitmap(canvas, **samples[0]).frame())
+    unchanged = canvas.unchanged
+
+    # Modo gráfico: una muestra nueva por frame en cada ventana (desplazar + una columna)
+    windows = {metric: TimeWindow(5.0) for metric in ('cpu_usage', 'gpu_usage')}
+    graphs = {'cpu_usage': Sparkline(windows['cpu_usage'], 96, 18),
+              'gpu_usage': BarGraph(windows['gpu_usage'], 96, 18)}
+
+    def graph_frame(i):
+        values = samples[i % 256]
+        for metric, window in windows.items():
+            window.add(values[metric], i * 0.5)
+        return graph_bitmap(canvas, graphs, **values).frame()
+    graph = _fps(frames, graph_frame)
+
+    size = canvas.width * canvas.height // 8
+    print(f"🖼️  {canvas.width}x{canvas.height} ({size} bytes por frame), {frames} frames por prueba")
+    print(f"  frame de texto (referencia)   {text:>10,.0f} FPS")
+    print(f"  dibujo (atlas + barras)       {draw:>10,.0f} FPS")
+    print(f"  dibujo + codificación         {full:>10,.0f} FPS  "
+          f"({packed / max(encoded, 1):.1f} filas reempaquetadas por frame)")
+    print(f"  frame sin cambios             {same:>10,.0f} FPS  ({unchanged} sin recodificar)")
+    print(f"  gráficos CPU/GPU (96x18)      {graph:>10,.0f} FPS  "
+          f"({graphs['cpu_usage'].columns_drawn} columnas, {graphs['cpu_usage'].missed} perdidas)")
+    backend.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
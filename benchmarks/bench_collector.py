@@ -0,0 +1,81 @@
+# benchmarks/bench_collector.py - Proveedor colgado: backend en el hilo del monitor frente a proceso recolector
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.blocking_backend import BlockingBackend
+from src.monitors.backends import CollectorTimeout, ProcessBackend
+from src.monitors.hardware_monitor import HardwareMonitor
+
+
+def _max_gap(monitor: HardwareMonitor, seconds: float, step: float = 0.01):
+    """Mayor tiempo sin muestras nuevas mientras el monitor corre ``seconds``"""
+    monitor.start()
+    last_seq, last_change, gap = monitor.get_snapshot().seq, time.monotonic(), 0.0
+    end = last_change + seconds
+    while time.monotonic() < end:
+        time.sleep(step)
+        now, seq = time.monotonic(), monitor.get_snapshot().seq
+        if seq != last_seq:
+            last_seq, last_change = seq, now
+        gap = max(gap, now - last_change)
+    samples = monitor.get_snapshot().seq
+    started = time.monotonic()
+    monitor.stop()
+    return gap, samples, time.monotonic() - started
+
+
+def _wait_started(backend):
+    """Lee hasta que el recolector termina de arrancar; devuelve (intentos, lectura más larga)"""
+    attempts, longest = 0, 0.0
+    while True:
+        attempts += 1
+        start = time.perf_counter()
+        try:
+            backend.read()
+            return attempts, max(longest, time.perf_counter() - start)
+        except CollectorTimeout:
+            longest = max(longest, time.perf_counter() - start)
+
+
+def _read_us(backend, reads: int) -> float:
+    backend.open()
+    if isinstance(backend, ProcessBackend):
+        _wait_started(backend)
+    start = time.perf_counter()
+    for _ in range(reads):
+        backend.read()
+    elapsed = time.perf_counter() - start
+    backend.close()
+    return elapsed / reads * 1e6
+
+
+def run(seconds: float = 6.0, hang_every: int = 20, hang_seconds: float = 3.0, deadline: float = 0.5):
+    print(f"🛡️  Consulta colgada {hang_seconds:.0f}s cada {hang_every} lecturas, muestreo 0.1s ({seconds:.0f}s)")
+    kwargs = {'hang_every': hang_every, 'hang_seconds': hang_seconds}
+    for label, backend in (("en el hilo", BlockingBackend(**kwargs)),
+                           ("proceso recolector", ProcessBackend(BlockingBackend, kwargs=kwargs,
+                                                                 deadline=deadline))):
+        gap, samples, stop = _max_gap(HardwareMonitor(backend=backend, interval=0.1), seconds)
+        extra = ""
+        if isinstance(backend, ProcessBackend):
+            extra = f", {backend.timeouts} reinicios"
+        print(f"  {label:<20} {samples:>3} muestras, mayor hueco {gap:.2f}s, stop() {stop:.2f}s{extra}")
+
+    # Arranque lento (COM, primera enumeración): ninguna lectura debe bloquear más que el plazo
+    backend = ProcessBackend(BlockingBackend, kwargs={'hang_on_open': True, 'hang_seconds': 2.0},
+                             deadline=deadline)
+    backend.open()
+    attempts, longest = _wait_started(backend)
+    backend.close()
+    print(f"  arranque de 2s: {attempts} lecturas hasta estar listo, la más larga {longest:.2f}s, "
+          f"{backend.restarts} reinicios")
+    assert longest < deadline + 0.5 and backend.restarts == 0
+
+    print(f"  coste por lectura sin cuelgues: en el hilo {_read_us(BlockingBackend(), 2000):.1f} µs | "
+          f"por la tubería {_read_us(ProcessBackend(BlockingBackend), 2000):.1f} µs")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,76 @@
+# benchmarks/bench_frames.py - Frames repetidos con los periodos reales de la app: heartbeats y pantalla sin huecos
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import main
+from benchmarks.fake_clock import FakeClock
+from src.fakes.gamesense_server import FakeGameSenseServer
+from src.fakes.synthetic_backend import SyntheticBackend
+from src.gamesense import GameSenseClient
+from src.gamesense.frames import FrameCache
+from src.render import DISK_TEMPLATE, HARDWARE_TEMPLATE, disk_display_values, display_values
+
+DISK_STATS = {'disk_path': 'C:', 'disk_usage': 61.0, 'disk_used_gb': 290.0,
+              'disk_free_gb': 186.0, 'disk_total_gb': 476.0}
+
+
+def _simulate(server, interval: float, ticks: int, send, change_every: int):
+    """Envía ``ticks`` frames cada ``interval`` s (reloj simulado); devuelve (envíos, heartbeats, hueco máx.)"""
+    clock = FakeClock()
+    client = GameSenseClient(server.url, frame_cache=FrameCache(clock=clock))
+    main.setup_gg(client)
+    backend = SyntheticBackend(seed=0)
+    backend.open()
+    stats = backend.read()
+    shown_until, blank = None, 0.0
+    try:
+        for tick in range(ticks):
+            if tick % change_every == 0:
+                stats = backend.read()  # Un valor visible cambia de vez en cuando
+            if shown_until is not None:
+                blank = max(blank, clock.now - shown_until)
+            with server.lock:
+                before = len(server.requests)
+            send(client, stats)
+            with server.lock:
+                new = server.requests[before:]
+            for _, endpoint, body in new:
+                if endpoint == 'game_event':
+                    length = body['data'].get('length-millis')
+                    shown_until = clock.now + length / 1000 if length is not None else math.inf
+            clock.advance(interval)
+    finally:
+        backend.close()
+        client.close()
+    return client.frame_cache.sent, client.frame_cache.heartbeats, blank
+
+
+def run(ticks: int = 60, change_every: int = 5):
+    server = FakeGameSenseServer().start()
+    cases = (
+        ("hardware", main.HARDWARE_INTERVAL,
+         lambda client, stats: main.send_to_oled(client, display_values(stats), HARDWARE_TEMPLATE)),
+        ("disk", main.DISK_INTERVAL,
+         lambda client, stats: main.send_to_oled(client, disk_display_values(DISK_STATS), DISK_TEMPLATE)),
+        ("hardware, 800ms", main.HARDWARE_INTERVAL,
+         lambda client, stats: client.send_frame(HARDWARE_TEMPLATE.render(display_values(stats)),
+                                                 length_millis=800)),
+    )
+    print(f"🖼️  {ticks} ticks por modo, los valores cambian cada {change_every} ticks "
+          f"(length-millis de la app: {main.FRAME_LENGTH_MILLIS})")
+    try:
+        for label, interval, send in cases:
+            sent, heartbeats, blank = _simulate(server, interval, ticks, send, change_every)
+            print(f"  {label:<16} cada {interval:.0f}s: {sent:>3} game_event, {heartbeats:>3} heartbeats, "
+                  f"pantalla vacía hasta {blank:.1f}s entre ticks")
+            if label in ("hardware", "disk"):
+                # Los periodos y la duración reales de la app: repetidos -> heartbeat sin dejar el OLED en blanco
+                assert heartbeats > 0 and sent < ticks and blank == 0.0, (label, sent, heartbeats, blank)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    run()
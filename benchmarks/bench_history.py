@@ -0,0 +1,103 @@
+# benchmarks/bench_history.py - Historial en disco: coste por muestra, rollups y reconstrucción
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.history import HISTORY_COLUMNS, RingFile, RingReader, RollupEngine
+
+
+def run(days: float = 30.0):
+    samples = int(days * 86400)
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'history.ring')
+        raw = RingFile(path, capacity=samples)
+        rollups = RollupEngine(path)
+        values = [rng.uniform(0, 100) for _ in HISTORY_COLUMNS]
+        start_time = 1.7e9
+
+        # Solo ring file
+        ticks = min(samples, 200000)
+        start = time.perf_counter()
+        for i in range(ticks):
+            raw.append(start_time + i, values)
+        append_us = (time.perf_counter() - start) / ticks * 1e6
+
+        # Ring file + rollups incrementales (lo que hace HistoryRecorder)
+        start = time.perf_counter()
+        for i in range(ticks, 2 * ticks):
+            values[0] = 50 + 50 * math.sin(i / 300)
+            raw.append(start_time + i, values)
+            rollups.add(start_time + i, values)
+        rollup_us = (time.perf_counter() - start) / ticks * 1e6
+
+        for i in range(2 * ticks, samples):
+            raw.append(start_time + i, values)
+        print(f"📼 {samples} muestras ({days:.0f} días a 1 Hz) en {os.path.getsize(path) / 2**20:.1f} MB")
+        print(f"  append              {append_us:>8.2f} µs/muestra")
+        print(f"  append + rollups    {rollup_us:>8.2f} µs/muestra")
+
+        start = time.perf_counter()
+        rollups.rebuild()
+        rebuild = time.perf_counter() - start
+        print(f"  rebuild vectorizado {rebuild * 1e3:>8.0f} ms  {rollups.stats()}")
+
+        end_time = start_time + samples
+        for resolution in (1, 60, 3600):
+            start = time.perf_counter()
+            period, records = rollups.query(start_time, end_time, resolution)
+            mean = float(records[HISTORY_COLUMNS[0] + ('_mean' if period else '')].mean())
+            elapsed = time.perf_counter() - start
+            print(f"  consulta {days:.0f} días a {resolution:>4}s -> tramo {period:>3}s, "
+                  f"{len(records):>8} puntos, {elapsed * 1e3:>7.1f} ms (media {mean:.1f})")
+        del records
+        rollups.close()
+        raw.close()
+
+    check_rebuild_keeps_old_tiers()
+
+
+def check_rebuild_keeps_old_tiers(days: float = 3.0, raw_hours: float = 12.0):
+    """``rebuild`` con tramos más largos que el bruto: lo anterior al bruto no se pierde"""
+
+    rng = random.Random(1)
+    start_time = 1.7e9
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'history.ring')
+        raw = RingFile(path, capacity=int(raw_hours * 3600))
+        rollups = RollupEngine(path)
+        for i in range(0, int(days * 86400), 5):
+            values = [rng.uniform(0, 100) for _ in HISTORY_COLUMNS]
+            raw.append(start_time + i, values)
+            rollups.add(start_time + i, values)
+        raw.flush()
+        first = raw.record(0)[0]
+
+        def older(period):
+            tier = next(tier for tier in rollups.tiers if tier.period == period)
+            tier.ring.flush()
+            reader = RingReader(tier.ring.path)
+            records = reader.latest()
+            kept = records[records['timestamp'] < first - first % period].copy()
+            del records
+            reader.close()
+            return kept
+
+        before = {tier.period: older(tier.period) for tier in rollups.tiers}
+        rollups.rebuild()
+        for period, records in before.items():
+            after = older(period)
+            assert len(records) and records.tobytes() == after.tobytes(), period
+        print(f"  rebuild con {days:.0f} días en tramos y {raw_hours:.0f} h en bruto: "
+              f"{', '.join(f'{p}s={len(r)}' for p, r in before.items())} registros anteriores intactos")
+        rollups.close()
+        raw.close()
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 30.0)
@@ -0,0 +1,54 @@
+# benchmarks/bench_lhm_http.py - Backend HTTP de LHM contra un servidor data.json local
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.fake_wmi import synthetic_namespace
+from src.fakes.lhm_http_server import FakeLHMHTTPServer
+from src.monitors.backends import LHMHTTPBackend
+
+
+def run(ticks: int = 200, total_sensors: int = 2000, recorded: str = None):
+    if recorded:
+        server = FakeLHMHTTPServer.from_file(recorded).start()
+    else:
+        server = FakeLHMHTTPServer.from_namespace(synthetic_namespace(total_sensors)).start()
+    backend = LHMHTTPBackend(server.url)
+    backend.open()
+    try:
+        stats = backend.read()
+        print(f"📊 data.json de {len(server.payload) / 1024:.0f} KB -> {stats}")
+
+        # Cuerpo idéntico: no se vuelve a parsear
+        start = time.perf_counter()
+        for _ in range(ticks):
+            backend.read()
+        unchanged = (time.perf_counter() - start) / ticks
+
+        # Cuerpo distinto en cada tick: parse + recorrido de rutas indexadas
+        base = json.loads(server.payload)
+        bodies = []
+        for i in range(ticks):
+            base['Children'][0]['Value'] = str(i)
+            bodies.append(json.dumps(base).encode('utf-8'))
+        start = time.perf_counter()
+        for body in bodies:
+            server.payload = body
+            backend.read()
+        changed = (time.perf_counter() - start) / ticks
+
+        assert server.connection_count == 1, server.connection_count
+        assert backend.index_builds == 1, backend.index_builds
+        print(f"✅ {server.request_count} peticiones sobre {server.connection_count} conexión, "
+              f"{backend.index_builds} construcción de índice, {backend.parse_count} parseos")
+        print(f"  sin cambios   {unchanged * 1e6:>10.1f} µs/tick")
+        print(f"  con cambios   {changed * 1e6:>10.1f} µs/tick")
+    finally:
+        backend.close()
+        server.stop()
+
+
+if __name__ == "__main__":
+    run(recorded=sys.argv[1] if len(sys.argv) > 1 else None)
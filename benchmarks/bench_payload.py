@@ -0,0 +1,58 @@
+# benchmarks/bench_payload.py - Render + cuerpo de game_event: f-strings y json.dumps frente a plantilla y EventPayload
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.synthetic_backend import SyntheticBackend
+from src.gamesense import EVENT, GAME
+from src.gamesense.payload import EventPayload
+from src.render import HARDWARE_TEMPLATE, display_values
+
+
+def _old_body(values):
+    """Lo que se hacía antes en cada tick: f-strings y el diccionario entero a json"""
+    frame = {
+        "line1": f"CPU ⇾ {values['cpu_usage']:>2}%🌡{values['cpu_temp']:>2}°C",
+        "line2": f"GPU ⇾ {values['gpu_usage']:>2}%🌡{values['gpu_temp']:>2}°C",
+        "line3": f"RAM ⇾ {values['ram_used_gb']:.1f}/{values['ram_total_gb']:.0f}GB",
+    }
+    payload = {"game": GAME, "event": EVENT, "data": {"frame": frame, "length-millis": 800}}
+    return json.dumps(payload).encode('utf-8')  # Como requests con json=
+
+
+def _per_tick_us(ticks: int, fn, samples) -> float:
+    start = time.perf_counter()
+    for i in range(ticks):
+        fn(samples[i % len(samples)])
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def run(ticks: int = 200000):
+    backend = SyntheticBackend(seed=0)
+    backend.open()
+    samples = [display_values(backend.read()) for _ in range(1024)]
+    backend.close()
+    # Un sensor real cambia pocas líneas por tick: repetir cada muestra 3 veces
+    steady = [sample for sample in samples for _ in range(3)]
+
+    payload = EventPayload(GAME, EVENT, 800)
+
+    def new_body(values):
+        return payload.build(HARDWARE_TEMPLATE.render(values))
+
+    for values in samples[:32]:
+        assert json.loads(new_body(values)) == json.loads(_old_body(values))
+
+    print(f"🧾 Cuerpo de game_event ({ticks} ticks)")
+    for label, data in (("muestras distintas", samples), ("muestras repetidas x3", steady)):
+        old = _per_tick_us(ticks, _old_body, data)
+        new = _per_tick_us(ticks, new_body, data)
+        print(f"  {label:<22} f-string + json.dumps {old:>6.2f} µs | plantilla + EventPayload "
+              f"{new:>6.2f} µs ({old / new:.1f}x)")
+    print(f"  valores recodificados: {payload.encoded_values} de {payload.built * 3}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,253 @@
+# benchmarks/bench_pipeline.py - Pipeline completo: sensores -> ventanas -> frame -> GameSense
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.gamesense_server import FakeGameSenseServer
+from src.fakes.synthetic_backend import SyntheticBackend
+from src.gamesense import EVENT, GAME, GameSenseClient
+from src.gamesense.frames import FrameCache
+from src.monitors.backends import ReplayBackend, SensorBackend
+from src.monitors.hardware_monitor import HardwareMonitor
+from src.render import HARDWARE_TEMPLATE, display_values
+
+STAGES = ('collect', 'aggregate', 'render', 'http', 'total')
+
+
+class TimedBackend(SensorBackend):
+    """Envuelve un backend y anota la duración y el instante de cada lectura"""
+
+    def __init__(self, backend: SensorBackend):
+        self.backend = backend
+        self.name = backend.name
+        self.presmoothed = backend.presmoothed
+        self.elapsed = 0.0
+        self.read_at = 0.0
+
+    def open(self):
+        self.backend.open()
+
+    def read(self, groups=None) -> Dict[str, Any]:
+        start = time.perf_counter()
+        data = self.backend.read(groups)
+        self.read_at = time.perf_counter()
+        self.elapsed = self.read_at - start
+        return data
+
+    def close(self):
+        self.backend.close()
+
+    def get_topology(self):
+        return self.backend.get_topology()
+
+
+def rss_bytes() -> Optional[int]:
+    """Memoria residente actual (psutil, o el pico de getrusage si no está)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        return None
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Media, p50, p95, p99 y máximo en microsegundos"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e6
+
+    return {'mean_us': sum(ordered) / len(ordered) * 1e6, 'p50_us': pct(0.50),
+            'p95_us': pct(0.95), 'p99_us': pct(0.99), 'max_us': ordered[-1] * 1e6}
+
+
+def tick(monitor: HardwareMonitor, backend: TimedBackend, client: GameSenseClient,
+         timings: Dict[str, List[float]]) -> float:
+    """Un ciclo completo; devuelve el instante de la lectura de sensores"""
+    start = time.perf_counter()
+    data = monitor.sample()
+    sampled = time.perf_counter()
+    frame = HARDWARE_TEMPLATE.render(display_values(data))
+    rendered = time.perf_counter()
+    client.send_frame(frame, 800)
+    done = time.perf_counter()
+
+    timings['collect'].append(backend.elapsed)
+    timings['aggregate'].append(sampled - start - backend.elapsed)
+    timings['render'].append(rendered - sampled)
+    timings['http'].append(done - rendered)
+    timings['total'].append(done - start)
+    return backend.read_at
+
+
+def measure_allocations(monitor, backend, client, ticks: int) -> Dict[str, float]:
+    """Bloques y bytes asignados por tick con tracemalloc (pasada aparte: ralentiza)"""
+    scratch = {stage: [] for stage in STAGES}
+    tracemalloc.start()
+    try:
+        for _ in range(ticks):
+            tick(monitor, backend, client, scratch)
+        gc.collect()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        blocks_before = sys.getallocatedblocks()
+        for _ in range(ticks):
+            tick(monitor, backend, client, scratch)
+        blocks_after = sys.getallocatedblocks()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # El servidor vive en otro hilo del mismo proceso: sus asignaciones
+    # también cuentan, así que es una cota superior del coste del pipeline.
+    diff = after.compare_to(before, 'filename')
+    allocated = sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+    return {
+        'net_blocks_per_tick': (blocks_after - blocks_before) / ticks,
+        'net_bytes_per_tick': allocated / ticks,
+        'traced_peak_bytes': peak,
+    }
+
+
+def run(ticks: int = 500, interval: float = 0.0, latency: float = 0.0,
+        sensor_delay: float = 0.0, warmup: int = 20, alloc_ticks: int = 100,
+        output: Optional[str] = None, compare: Optional[str] = None,
+        replay: Optional[str] = None) -> Dict[str, Any]:
+    server = FakeGameSenseServer(latency=latency).start()
+    # max_staleness=0: todos los frames se envían, se mide el peor caso HTTP
+    client = GameSenseClient(server.url, frame_cache=FrameCache(max_staleness=0.0))
+    # Con replay se reproduce una grabación real (en bucle, sin esperas)
+    source = ReplayBackend(replay, speed=0, loop=True) if replay else SyntheticBackend(delay=sensor_delay)
+    backend = TimedBackend(source)
+    monitor = HardwareMonitor(backend=backend)
+    timings = {stage: [] for stage in STAGES}  # type: Dict[str, List[float]]
+    sampled_at = []
+
+    client.post("game_metadata", {"game": GAME, "game_display_name": "Bench"})
+    client.post("bind_game_event", {"game": GAME, "event": EVENT, "handlers": []})
+    backend.open()
+    try:
+        for _ in range(warmup):
+            tick(monitor, backend, client, {stage: [] for stage in STAGES})
+        with server.lock:
+            del server.frames[:]
+
+        rss_before = rss_bytes()
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        deadline = wall_start
+        for _ in range(ticks):
+            sampled_at.append(tick(monitor, backend, client, timings))
+            if interval:
+                deadline += interval
+                time.sleep(max(0.0, deadline - time.perf_counter()))
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        rss_after = rss_bytes()
+
+        with server.lock:
+            received = [at for at, _ in server.frames]
+        # Antigüedad del dato cuando GameSense recibe el frame (mismo reloj)
+        staleness = [at - sample for at, sample in zip(received, sampled_at)]
+
+        allocations = measure_allocations(monitor, backend, client, alloc_ticks)
+        results = {
+            'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                     'pid': os.getpid(), 'ticks': ticks, 'interval': interval,
+                     'latency': latency, 'sensor_delay': sensor_delay, 'replay': replay,
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'stages': {stage: summarize(values) for stage, values in timings.items()},
+            'staleness': summarize(staleness),
+            'frames_received': len(received),
+            'throughput_tps': ticks / wall if wall else None,
+            # thread_time: solo el hilo del pipeline, sin los hilos del servidor
+            'cpu_us_per_tick': cpu / ticks * 1e6,
+            'rss_bytes': rss_after,
+            'rss_growth_bytes': (rss_after - rss_before) if rss_before and rss_after else None,
+            'allocations': allocations,
+            'connections': client.connection_stats(),
+        }
+    finally:
+        backend.close()
+        client.close()
+        server.stop()
+
+    report(results)
+    if compare:
+        with open(compare) as f:
+            report_diff(json.load(f), results)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Resultados guardados en {output}")
+    return results
+
+
+def report(results: Dict[str, Any]):
+    print(f"📊 {results['meta']['ticks']} ticks, {results['throughput_tps']:.0f} ticks/s, "
+          f"{results['frames_received']} frames recibidos")
+    print(f"  {'etapa':<12}{'media':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'máx':>10}  (µs)")
+    rows = list(results['stages'].items()) + [('staleness', results['staleness'])]
+    for name, s in rows:
+        print(f"  {name:<12}" + "".join(f"{s[k]:>10.1f}" for k in
+                                        ('mean_us', 'p50_us', 'p95_us', 'p99_us', 'max_us')))
+    alloc = results['allocations']
+    rss = results['rss_bytes']
+    print(f"  CPU {results['cpu_us_per_tick']:.1f} µs/tick, RSS "
+          f"{rss / 2**20 if rss else float('nan'):.1f} MB, "
+          f"{alloc['net_blocks_per_tick']:+.2f} bloques y {alloc['net_bytes_per_tick']:.0f} B/tick")
+    conn = results['connections']
+    print(f"  {conn['requests']} peticiones sobre {conn['connections']} conexión(es)")
+
+
+def report_diff(old: Dict[str, Any], new: Dict[str, Any]):
+    """Compara la media y el p95 de cada etapa contra una ejecución guardada"""
+    print(f"🔍 Comparación con la ejecución del {old['meta'].get('time', '?')}")
+    rows = [(name, old['stages'].get(name, {}), s) for name, s in new['stages'].items()]
+    rows.append(('staleness', old.get('staleness', {}), new['staleness']))
+    for name, before, after in rows:
+        for key in ('mean_us', 'p95_us'):
+            if before.get(key):
+                change = (after[key] - before[key]) / before[key] * 100
+                print(f"  {name:<12}{key:<9}{before[key]:>10.1f} -> {after[key]:>10.1f}  ({change:+.1f}%)")
+    before, after = old.get('cpu_us_per_tick'), new['cpu_us_per_tick']
+    if before:
+        print(f"  {'cpu':<12}{'us/tick':<9}{before:>10.1f} -> {after:>10.1f}  "
+              f"({(after - before) / before * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de extremo a extremo del pipeline")
+    parser.add_argument('--ticks', type=int, default=500)
+    parser.add_argument('--interval', type=float, default=0.0, help="Periodo entre ticks (0 = sin pausa)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Latencia simulada de GameSense (s)")
+    parser.add_argument('--sensor-delay', type=float, default=0.0, help="Coste simulado de leer sensores (s)")
+    parser.add_argument('--alloc-ticks', type=int, default=100)
+    parser.add_argument('--output', '-o', help="Guarda los resultados en JSON")
+    parser.add_argument('--compare', '-c', help="JSON de una ejecución anterior")
+    parser.add_argument('--replay', '-r', help="Grabación (.ring o .jsonl) en lugar de sensores sintéticos")
+    args = parser.parse_args()
+    run(args.ticks, args.interval, args.latency, args.sensor_delay,
+        alloc_ticks=args.alloc_ticks, output=args.output, compare=args.compare, replay=args.replay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# benchmarks/bench_scheduler.py - Plazos del planificador con reloj simulado y despertares en reposo
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.fake_clock import FakeClock
+from src.scheduler import Scheduler
+
+
+def run(minutes: float = 1.0):
+    clock = FakeClock()
+    scheduler = Scheduler(clock=clock, wait=clock.wait)
+    runs = {'hardware': [], 'disk': []}
+    scheduler.add_job('hardware', 2.0, lambda: runs['hardware'].append(clock.now))
+    scheduler.add_job('disk', 5.0, lambda: runs['disk'].append(clock.now), enabled=False)
+
+    def switch_to_disk():
+        scheduler.set_enabled('hardware', False)
+        scheduler.set_enabled('disk', True)
+
+    # Hotkey de cambio de modo a mitad de un periodo, y parada al final
+    clock.events = [(7.3, switch_to_disk), (minutes * 60, scheduler.stop)]
+    scheduler.run()
+
+    assert runs['hardware'] == [0.0, 2.0, 4.0, 6.0], runs['hardware']
+    assert runs['disk'][:3] == [7.3, 12.3, 17.3], runs['disk']
+    print(f"✅ Hardware en {runs['hardware']}, disco desde {runs['disk'][0]}s (sin esperar al tick)")
+
+    expected = len(runs['hardware']) + len(runs['disk'])
+    print(f"⏰ {scheduler.wakeups / minutes:.0f} despertares/min para {expected / minutes:.0f} "
+          f"actualizaciones/min (bucle anterior: 60/min)")
+
+
+if __name__ == "__main__":
+    run()
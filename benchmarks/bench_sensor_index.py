@@ -0,0 +1,51 @@
+# benchmarks/bench_sensor_index.py - Escaneo completo de sensores vs índice precalculado
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.fake_wmi import synthetic_namespace
+from src.monitors.sensor_index import SensorIndex
+from src.monitors.topology import TopologyCache
+
+
+def legacy_scan(lhm_client, cpu_identifier, gpu_identifier):
+    """Ruta anterior: tres consultas SELECT * y recorrido lineal con lower()"""
+    temp_sensors = lhm_client.query("SELECT * FROM Sensor WHERE SensorType='Temperature'")
+    load_sensors = lhm_client.query("SELECT * FROM Sensor WHERE SensorType='Load'")
+    data_sensors = lhm_client.query("SELECT * FROM Sensor WHERE SensorType='Data'")
+    cpu_core_loads, gpu_load = [], None
+    for sensor in temp_sensors + load_sensors + data_sensors:
+        if sensor.Parent == cpu_identifier:
+            if sensor.SensorType == 'Load' and 'cpu core' in sensor.Name.lower():
+                cpu_core_loads.append(sensor.Value)
+        elif sensor.Parent == gpu_identifier:
+            if sensor.SensorType == 'Load' and 'gpu core' in sensor.Name.lower():
+                gpu_load = sensor.Value
+    return cpu_core_loads, gpu_load
+
+
+def bench(label, fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_tick = (time.perf_counter() - start) / iterations
+    print(f"  {label:<18} {per_tick * 1e6:>10.1f} µs/tick")
+    return per_tick
+
+
+def run(total_sensors: int = 2000, iterations: int = 200):
+    namespace = synthetic_namespace(total_sensors)
+    topology = TopologyCache(ttl=None).get(namespace)
+    index = SensorIndex()
+    index.build(namespace, topology)
+
+    print(f"📊 {len(namespace.sensors)} sensores, {len(index.roles)} seleccionados")
+    legacy = bench("escaneo completo", lambda: legacy_scan(
+        namespace, topology.cpu_identifier, topology.gpu_identifier), iterations)
+    indexed = bench("índice", lambda: index.fetch(namespace), iterations)
+    print(f"⚡ {legacy / indexed:.1f}x más rápido")
+
+
+if __name__ == "__main__":
+    run()
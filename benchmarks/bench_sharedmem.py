@@ -0,0 +1,80 @@
+# benchmarks/bench_sharedmem.py - Lectores en otros procesos del bloque compartido mientras el monitor publica
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.sharedmem import FIELDS, SharedStatsReader, SharedStatsWriter
+
+NAME = 'arctic_bench_stats'
+
+
+def _reader(name: str, seconds: float, results):
+    """Proceso lector: lee en bucle y comprueba que ninguna copia mezcla dos muestras"""
+    reader = SharedStatsReader(name)
+    reads = torn = empty = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        stats = reader.read()
+        if stats is None:
+            empty += 1
+            continue
+        reads += 1
+        # El escritor pone el mismo número en todos los campos y núcleos
+        expected = stats['cpu_usage']
+        if any(stats[field] != expected for field in FIELDS) or any(
+                load != expected for load in stats['cpu_core_loads']):
+            torn += 1
+    results.put((reads, torn, empty, reader.retried))
+    reader.close()
+
+
+def _writer(name: str, ready, stop, results):
+    """Proceso del monitor: publica sin pausa el mismo número en todos los campos y núcleos"""
+    writer = SharedStatsWriter(name)
+    ready.set()
+    i = 0
+    while not stop.is_set():
+        i += 1
+        value = float(i)
+        data = dict.fromkeys(FIELDS, value)
+        data['cpu_core_loads'] = (value,) * 16
+        writer(data)
+    results.put(writer.published)
+    writer.close()
+
+
+def run(readers: int = 4, seconds: float = 2.0):
+    # Escritor y lectores en procesos hijos: este proceso no abre el bloque, así cada
+    # uno tiene su propio resource_tracker como los consumidores reales
+    ready, stop = multiprocessing.Event(), multiprocessing.Event()
+    published, results = multiprocessing.Queue(), multiprocessing.Queue()
+    writer = multiprocessing.Process(target=_writer, args=(NAME, ready, stop, published))
+    writer.start()
+    ready.wait()
+    processes = [multiprocessing.Process(target=_reader, args=(NAME, seconds, results))
+                 for _ in range(readers)]
+    try:
+        for process in processes:
+            process.start()
+        totals = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        stop.set()
+    samples = published.get()
+    writer.join()
+
+    reads = sum(t[0] for t in totals)
+    torn = sum(t[1] for t in totals)
+    retried = sum(t[3] for t in totals)
+    print(f"🧩 Memoria compartida: {readers} procesos lectores, escritor sin pausa ({seconds:.0f}s)")
+    print(f"  {reads / seconds / readers / 1e3:>8.1f} k lecturas/s por lector ({reads} en total, "
+          f"{seconds / max(1, reads / readers) * 1e6:.2f} µs por lectura)")
+    print(f"  {samples} muestras publicadas, {retried} reintentos, {torn} lecturas inconsistentes")
+    assert torn == 0
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
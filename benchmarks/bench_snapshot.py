@@ -0,0 +1,99 @@
+# benchmarks/bench_snapshot.py - Lecturas concurrentes de get_quick_stats: lock + copia frente a Snapshot
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.fakes.synthetic_backend import SyntheticBackend
+from src.monitors.hardware_monitor import HardwareMonitor
+
+
+class LockedStats:
+    """Lo que hacía ``get_quick_stats`` antes: ``data_lock`` y copia del dict en cada lectura"""
+
+    def __init__(self):
+        self.current_data = {}
+        self.data_lock = threading.Lock()
+
+    def publish(self, data):
+        with self.data_lock:
+            self.current_data = dict(data)
+
+    def get_quick_stats(self):
+        with self.data_lock:
+            return self.current_data.copy()
+
+
+def _run_readers(read, readers: int, seconds: float, monitor: HardwareMonitor, write_interval: float):
+    """Lectores en bucle mientras un escritor publica; devuelve (lecturas, muestras, lecturas/s).
+
+    Cada hilo mira su propio plazo: con un solo núcleo y un lock disputado
+    el hilo principal podría no recuperar el GIL a tiempo para avisarles.
+    """
+    counts = [0] * readers
+    ready = threading.Barrier(readers + 2)
+    window = {}
+
+    def reader(slot: int):
+        ready.wait()
+        end = window['end']
+        n = 0
+        while time.perf_counter() < end:
+            for _ in range(100):
+                read().get('cpu_usage')
+            n += 100
+        counts[slot] = n
+
+    def writer():
+        ready.wait()
+        end = window['end']
+        while time.perf_counter() < end:
+            monitor.sample()
+            time.sleep(write_interval)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    seq = monitor.get_snapshot().seq
+    window['end'] = time.perf_counter() + seconds
+    ready.wait()
+    for thread in threads:
+        thread.join()
+    return sum(counts), monitor.get_snapshot().seq - seq, sum(counts) / seconds
+
+
+def run(readers: int = 16, seconds: float = 2.0, write_interval: float = 0.001):
+    monitor = HardwareMonitor(backend=SyntheticBackend(seed=0))
+    monitor.backend.open()
+    locked = LockedStats()
+    monitor.add_listener(locked.publish)
+    monitor.sample()
+
+    print(f"🔒 get_quick_stats con {readers} hilos lectores y un escritor cada {write_interval * 1000:.0f} ms "
+          f"({seconds:.0f}s por variante)")
+    results = {}
+    for label, read in (("lock + copia", locked.get_quick_stats), ("Snapshot", monitor.get_quick_stats)):
+        reads, samples, rate = _run_readers(read, readers, seconds, monitor, write_interval)
+        results[label] = rate
+        print(f"  {label:<14} {rate / 1e6:>6.2f} M lecturas/s ({reads} lecturas, {samples} muestras publicadas)")
+    print(f"  Snapshot {results['Snapshot'] / results['lock + copia']:.1f}x")
+
+    # Un consumidor que solo trabaja cuando hay datos nuevos: comparar seq en lugar del contenido
+    snapshot = monitor.get_snapshot()
+    start = time.perf_counter()
+    skipped = 0
+    for _ in range(1000000):
+        current = monitor.get_snapshot()
+        if current.seq == snapshot.seq:
+            skipped += 1
+            continue
+        snapshot = current
+    per_check = (time.perf_counter() - start) / 1000000 * 1e9
+    print(f"  ¿hay datos nuevos? (seq) {per_check:.0f} ns por comprobación, {skipped} sin cambios")
+    monitor.backend.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 16)
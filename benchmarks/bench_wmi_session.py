@@ -0,0 +1,59 @@
+# benchmarks/bench_wmi_session.py - Conexión WMI persistente vs reconexión por tick
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.fake_clock import FakeClock
+from src.fakes.fake_wmi import FakeCOMModule, FakeWMIModule
+from src.monitors.backends import WMIBackend
+from src.monitors.hardware_monitor import HardwareMonitor
+from src.monitors.wmi_session import WMISession
+
+
+def run(ticks: int = 200):
+    fake_wmi, fake_com, clock = FakeWMIModule(), FakeCOMModule(), FakeClock()
+    backend = WMIBackend(session_factory=lambda: WMISession(
+        wmi_module=fake_wmi, com_module=fake_com, clock=clock))
+    monitor = HardwareMonitor(backend)
+    backend.open()
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        monitor._collect_data()
+        clock.advance(1.0)
+    elapsed = time.perf_counter() - start
+
+    assert fake_wmi.connect_count == 1, fake_wmi.connect_count
+    assert fake_com.init_count == 1, fake_com.init_count
+    assert fake_wmi.namespace.hardware_count == 1, fake_wmi.namespace.hardware_count
+    print(f"✅ {ticks} ticks: {fake_wmi.connect_count} conexión, "
+          f"{fake_com.init_count} CoInitialize, {fake_wmi.namespace.hardware_count} enumeración, "
+          f"{elapsed / ticks * 1e6:.1f} µs/tick")
+
+    # LHM reiniciado: la consulta falla, se reconecta tras el backoff
+    fake_wmi.namespace.alive = False
+    try:
+        monitor._collect_data()
+    except ConnectionError:
+        pass
+    assert not backend.session.connected
+
+    try:
+        monitor._collect_data()  # Todavía dentro del backoff
+    except ConnectionError:
+        pass
+    assert fake_wmi.connect_count == 1
+
+    clock.advance(backend.session.initial_backoff)
+    monitor._collect_data()
+    assert fake_wmi.connect_count == 2
+    assert fake_wmi.namespace.hardware_count == 2  # Topología re-enumerada tras reconectar
+    print(f"✅ Reconexión tras reinicio de LHM: {fake_wmi.connect_count} conexiones")
+
+    backend.session.close()
+    assert fake_com.uninit_count == 1
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,30 @@
+# benchmarks/fake_clock.py - Reloj simulado compartido por los benchmarks deterministas
+from typing import Optional
+
+
+class FakeClock:
+    """Reloj que solo avanza a mano (``now``) o cuando el código medido duerme.
+
+    Se pasa como ``clock`` a lo que acepte uno (``time.monotonic`` en
+    producción). ``wait`` sirve de espera del ``Scheduler``: salta al
+    plazo pedido o al siguiente de ``events``, cuya acción ejecuta.
+    """
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.events = []  # [(instante, acción)] a inyectar durante la espera
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+    def wait(self, timeout: Optional[float]):
+        target = self.now + (timeout if timeout is not None else 3600.0)
+        while self.events and self.events[0][0] <= target:
+            at, action = self.events.pop(0)
+            self.now = max(self.now, at)
+            action()
+            return  # Un wake() corta la espera
+        self.now = target
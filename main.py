@@ -1,7 +1,7 @@
 # main_minimal.py - Versión Final Limpia y Completa
+import asyncio
+import multiprocessing
 import time
-import json
-import requests
 import sys
 import os
 import threading
@@ -9,7 +9,29 @@ from pathlib import Path
 
 # Import hardware monitor
 sys.path.insert(0, str(Path(__file__).parent))
+from src.monitors.backends import JsonlRecorder, ProcessBackend, create_default_backend
+from src.monitors.groups import ALL_GROUPS, DISK, LOAD, NO_GROUPS, SENSOR_GROUPS, groups_for
 from src.monitors.hardware_monitor import HardwareMonitor
+from src.async_runtime import ACTIVATION_FRAME, AsyncRuntime
+from src.gamesense import GameSenseClient, get_gg_url
+from src.history import HistoryRecorder, RingFile, RollupEngine
+from src.instrumentation import SamplingProfiler, instruments
+from src.metrics_exporter import OpenMetricsExporter
+from src.render import (DISK_TEMPLATE, HARDWARE_TEMPLATE, disk_display_values, disk_frame,
+                        display_values, load_template)
+from src.render.templates import (DISK_FIELDS, DISK_SAMPLE, HARDWARE_FIELD_METRICS, HARDWARE_FIELDS,
+                                  HARDWARE_SAMPLE)
+from src.render.bitmap import BITMAP_EVENT, NUMPY_AVAILABLE, BitmapCanvas, bitmap_handler, hardware_bitmap
+from src.render.widgets import graph_bitmap, usage_graphs
+from src.scheduler import Scheduler
+from src.sharedmem import DEFAULT_NAME as DEFAULT_SHARED_NAME, SharedStatsWriter
+from src.status_server import DEFAULT_STATUS_PORT, StatusServer
+
+HARDWARE_INTERVAL = 2.0  # Hardware (y bitmap/graph) cada 2 segundos
+DISK_INTERVAL = 5.0      # Disk cada 5 segundos
+# Sin length-millis: el frame queda en el OLED hasta el siguiente y los repetidos se
+# sustituyen por game_heartbeat (con 800ms caducaría antes del próximo tick)
+FRAME_LENGTH_MILLIS = None
 
 def resource_path(relative_path):
     """Obtiene la ruta correcta para recursos empaquetados con PyInstaller"""
@@ -20,24 +42,88 @@ def resource_path(relative_path):
         base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
-def get_gg_url():
-    """Obtiene URL de SteelSeries GG"""
+def cli_option(name, default=None):
+    """Valor de ``--opcion`` (True) o ``--opcion=valor`` en la línea de comandos"""
+    for arg in sys.argv[1:]:
+        if arg == name:
+            return True
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+def seconds_option(name, default=None):
+    """Segundos de ``--opcion=valor`` (``default`` si falta el valor); ValueError si no es > 0"""
+    value = cli_option(name)
+    if value is None:
+        return None
+    if value is True:
+        return default
     try:
-        with open("C:/ProgramData/SteelSeries/GG/coreProps.json", 'r') as f:
-            return f"http://{json.load(f)['address']}"
-    except:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError(f"{name} espera segundos, no {value!r}") from None
+    if not 0 < seconds < float('inf'):  # También rechaza nan
+        raise ValueError(f"{name} debe ser un número de segundos mayor que 0 (recibido {value!r})")
+    return seconds
+
+def port_option(name, default):
+    """Puerto TCP de ``--opcion[=puerto]`` (``default`` sin valor); ValueError si no es 1-65535"""
+    value = cli_option(name)
+    if value is None:
         return None
+    if value is True:
+        return default
+    try:
+        port = int(value)
+    except ValueError:
+        raise ValueError(f"{name} espera un puerto, no {value!r}") from None
+    if not 1 <= port <= 65535:
+        raise ValueError(f"{name} debe ser un puerto entre 1 y 65535 (recibido {value!r})")
+    return port
+
+def self_usage():
+    """CPU% y memoria del propio monitor para la línea de estado"""
+    usage = instruments.process_stats()
+    rss = usage.get('rss_bytes')
+    return f"SELF:{usage['cpu_percent']:.1f}%" + (f"/{rss / 2**20:.0f}MB" if rss else "")
+
+def default_history_path():
+    """history.ring en %LOCALAPPDATA%/ArcticMonitor (o ~/.arctic-monitor)"""
+    base = os.environ.get('LOCALAPPDATA')
+    folder = os.path.join(base, 'ArcticMonitor') if base else os.path.expanduser('~/.arctic-monitor')
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, 'history.ring')
+
+def display_groups(active, mode, template=HARDWARE_TEMPLATE):
+    """Grupos de sensores que necesita el display en ``mode`` (ninguno si está apagado)
+
+    Los campos de la plantilla se traducen a las métricas de las que salen
+    (``ram_percent`` -> ``ram_usage``...). ValueError si el modo activo no
+    necesitaría ningún sensor: el monitor se pararía y el OLED se congelaría.
+    """
+    if not active:
+        return NO_GROUPS
+    if mode == "disk":
+        return frozenset({DISK})
+    if mode == "graph":
+        return frozenset({LOAD})
+    if mode == "bitmap":
+        return SENSOR_GROUPS
+    groups = groups_for(HARDWARE_FIELD_METRICS[field] for field in template.fields)
+    if not groups:
+        raise ValueError(f"El modo {mode} no usa ningún sensor (campos: {', '.join(sorted(HARDWARE_FIELDS))})")
+    return groups
 
-def setup_gg(url):
+def setup_gg(client):
     """Configura SteelSeries GG"""
     try:
         # Register game
-        requests.post(f"{url}/game_metadata", json={
+        client.post("game_metadata", {
             "game": "ARCTIS_MIN", "game_display_name": "Arctic Min"
-        }, timeout=3).raise_for_status()
+        }).raise_for_status()
         
         # Setup display event
-        requests.post(f"{url}/bind_game_event", json={
+        client.post("bind_game_event", {
             "game": "ARCTIS_MIN", "event": "DISPLAY",
             "handlers": [{
                 "device-type": "screened", "zone": "one", "mode": "screen",
@@ -49,80 +135,96 @@ def setup_gg(url):
                 }]
             }],
             "value_optional": True
-        }, timeout=3).raise_for_status()
+        }).raise_for_status()
+        bind_bitmap_event(client)
         
         return True
-    except:
+    except Exception as e:
+        instruments.error('setup_gg', e)
         return False
 
-def send_to_oled(url, cpu_usage, cpu_temp, gpu_usage, gpu_temp, ram_used_gb, ram_total_gb, ram_percent, display_active=True):
+def bind_bitmap_event(client):
+    """Evento BITMAP para el modo de mapa de bits (solo con numpy)"""
+    if not NUMPY_AVAILABLE:
+        return
+    client.post("bind_game_event", {
+        "game": "ARCTIS_MIN", "event": BITMAP_EVENT,
+        "handlers": [bitmap_handler()],
+        "value_optional": True
+    }).raise_for_status()
+
+def send_to_oled(client, values, template=HARDWARE_TEMPLATE, display_active=True):
     """Envía datos a OLED con duración corta para no bloquear otras apps"""
     if not display_active:
         return True
     
     try:
-        frame_data = {
-            "line1": f"CPU ⇾ {cpu_usage:>2}%🌡{cpu_temp:>2}°C",
-            "line2": f"GPU ⇾ {gpu_usage:>2}%🌡{gpu_temp:>2}°C",
-            "line3": f"RAM ⇾ {ram_used_gb:.1f}/{ram_total_gb:.0f}GB"
-        }
+        with instruments.stage('render'):
+            frame_data = template.render(values)
         
-        requests.post(f"{url}/game_event", json={
-            "game": "ARCTIS_MIN", 
-            "event": "DISPLAY",
-            "data": {
-                "frame": frame_data,
-                "length-millis": 800  # Solo mostrar por 800ms, dar espacio a otras apps
-            }
-        }, timeout=0.5)
+        # Frames repetidos -> heartbeat (ver FRAME_LENGTH_MILLIS)
+        client.send_frame(frame_data, length_millis=FRAME_LENGTH_MILLIS)
         return True
-    except:
+    except Exception as e:
+        instruments.error('send_to_oled', e)
         return False
 
-def send_disk_info_to_oled(url):
-    """Envía información de discos a OLED"""
+def send_bitmap_to_oled(client, canvas, graphs=None, display_active=True, **values):
+    """Envía el modo hardware (o, con ``graphs``, las sparklines) como mapa de bits 128x40"""
+    if not display_active:
+        return True
+    
     try:
-        import psutil
-        
-        # Obtener info del disco principal (C:)
-        disk_c = psutil.disk_usage('C:')
-        used_gb = disk_c.used / (1024**3)
-        total_gb = disk_c.total / (1024**3)
-        free_gb = disk_c.free / (1024**3)
-        usage_percent = (disk_c.used / disk_c.total) * 100
+        with instruments.stage('render.bitmap'):
+            if graphs:
+                frame_data = graph_bitmap(canvas, graphs, **values).frame()
+            else:
+                frame_data = hardware_bitmap(canvas, **values).frame()
         
-        frame_data = {
-            "line1": f"DISK C: {usage_percent:.0f}%",
-            "line2": f"Used: {used_gb:.0f}GB",
-            "line3": f"Free: {free_gb:.0f}GB"
-        }
+        client.send_frame(frame_data, length_millis=FRAME_LENGTH_MILLIS, event=BITMAP_EVENT)
+        return True
+    except Exception as e:
+        instruments.error('send_bitmap_to_oled', e)
+        return False
+
+def send_disk_info_to_oled(client, monitor, template=DISK_TEMPLATE):
+    """Envía información de discos a OLED"""
+    try:
+        # Disco principal según la última lectura del monitor (grupo disk, cada 60s)
+        with instruments.stage('render.disk'):
+            values = disk_display_values(monitor.get_quick_stats())
+            if values is not None:
+                frame_data = template.render(values)
+            else:
+                # Recién suscrito y aún sin lectura: leerlo una vez aquí
+                frame_data = disk_frame(monitor.disk_path, template)
         
-        requests.post(f"{url}/game_event", json={
-            "game": "ARCTIS_MIN", 
-            "event": "DISPLAY",
-            "data": {
-                "frame": frame_data,
-                "length-millis": 800  # Misma duración que hardware para compartir
-            }
-        }, timeout=0.5)
+        client.send_frame(frame_data, length_millis=FRAME_LENGTH_MILLIS)
         return True
-    except:
+    except Exception as e:
+        instruments.error('send_disk_info_to_oled', e)
         return False
 
-def deactivate_display(url):
+def deactivate_display(client):
     """Desactiva display - vuelve a pantalla principal"""
     try:
-        requests.post(f"{url}/remove_game_event", json={
+        client.post("remove_game_event", {
             "game": "ARCTIS_MIN", "event": "DISPLAY"
-        }, timeout=2)
+        })
+        if NUMPY_AVAILABLE:
+            client.post("remove_game_event", {
+                "game": "ARCTIS_MIN", "event": BITMAP_EVENT
+            })
         return True
-    except:
+    except Exception as e:
+        instruments.error('deactivate_display', e)
         return False
 
-def reactivate_display(url):
+def reactivate_display(client):
     """Reactiva display"""
     try:
-        requests.post(f"{url}/bind_game_event", json={
+        client.frame_cache.reset()  # El siguiente frame debe enviarse completo
+        client.post("bind_game_event", {
             "game": "ARCTIS_MIN", "event": "DISPLAY",
             "handlers": [{
                 "device-type": "screened", "zone": "one", "mode": "screen",
@@ -134,33 +236,32 @@ def reactivate_display(url):
                 }]
             }],
             "value_optional": True
-        }, timeout=3).raise_for_status()
+        }).raise_for_status()
+        bind_bitmap_event(client)
         return True
-    except:
+    except Exception as e:
+        instruments.error('reactivate_display', e)
         return False
 
-def show_activation_message(url):
+def show_activation_message(client):
     """Muestra mensaje de activación"""
     try:
-        requests.post(f"{url}/game_event", json={
+        client.post("game_event", {
             "game": "ARCTIS_MIN", "event": "DISPLAY",
-            "data": {"frame": {
-                "line1": "",
-                "line2": "  ✅ MONITOR ON",
-                "line3": ""
-            }}
-        }, timeout=0.5)
+            "data": {"frame": ACTIVATION_FRAME}
+        })
         time.sleep(1.5)
         return True
-    except:
+    except Exception as e:
+        instruments.error('show_activation_message', e)
         return False
 
-def cleanup_gg(url):
+def cleanup_gg(client):
     """Limpia SteelSeries GG"""
     try:
-        requests.post(f"{url}/remove_game", json={"game": "ARCTIS_MIN"}, timeout=3)
-    except:
-        pass
+        client.post("remove_game", {"game": "ARCTIS_MIN"})
+    except Exception as e:
+        instruments.error('cleanup_gg', e)
 
 class KeybindListener:
     """Maneja Ctrl+F9 (inmediato) y F10 (3s hold) keybinds"""
@@ -168,6 +269,7 @@ class KeybindListener:
     def __init__(self):
         self.toggle_callback = None
         self.disk_callback = None
+        self.profile_callback = None
         self.keyboard_available = False
         
         # Estado para F10
@@ -190,7 +292,10 @@ class KeybindListener:
             keyboard.on_press_key('f10', self._on_f10_press)
             keyboard.on_release_key('f10', self._on_f10_release)
             
-            print("⌨️  Ctrl+F9 = Toggle Monitor | F10 (hold 3s) = Change Mode")
+            # Ctrl+F11 para el perfilador (diagnóstico)
+            keyboard.add_hotkey('ctrl+f11', self._execute_profile)
+            
+            print("⌨️  Ctrl+F9 = Toggle Monitor | F10 (hold 3s) = Change Mode | Ctrl+F11 = Profiler")
         except ImportError:
             print("⚠️  'keyboard' no disponible - instala con: pip install keyboard")
         except Exception as e:
@@ -202,6 +307,10 @@ class KeybindListener:
         if self.toggle_callback:
             self.toggle_callback()
     
+    def _execute_profile(self):
+        if self.profile_callback:
+            self.profile_callback()
+    
     def _on_f10_press(self, event):
         if not self.f10_pressed:
             self.f10_pressed = True
@@ -235,6 +344,9 @@ class KeybindListener:
     def set_disk_callback(self, callback):
         self.disk_callback = callback
     
+    def set_profile_callback(self, callback):
+        self.profile_callback = callback
+    
     def cleanup(self):
         # Cancelar timers activos
         if self.f10_timer and self.f10_timer.is_alive():
@@ -244,53 +356,260 @@ class KeybindListener:
             try:
                 import keyboard
                 keyboard.unhook_all()
-            except:
-                pass
+            except Exception as e:
+                instruments.error('keybinds.cleanup', e)
 
 def main():
     print("🎮 ARCTIC MONITOR - MINIMAL")
     print("=" * 30)
     
+    # Plantillas de las 3 líneas (--layout=fichero, --disk-layout=fichero), compiladas una vez
+    try:
+        layout_option, disk_layout_option = cli_option("--layout"), cli_option("--disk-layout")
+        hardware_template = (load_template(layout_option, HARDWARE_FIELDS, HARDWARE_SAMPLE)
+                             if isinstance(layout_option, str) else HARDWARE_TEMPLATE)
+        disk_template = (load_template(disk_layout_option, DISK_FIELDS, DISK_SAMPLE)
+                         if isinstance(disk_layout_option, str) else DISK_TEMPLATE)
+        display_groups(True, "hardware", hardware_template)  # Falla ya si no usa ningún sensor
+    except (OSError, ValueError) as e:
+        print(f"❌ Plantilla no válida: {e}")
+        return
+    
+    # Periodo de muestreo (--sample-interval=s), plazo del recolector (--isolate-sensors[=s])
+    # y puerto del endpoint de estado (--status[=puerto])
+    try:
+        sample_interval = seconds_option("--sample-interval")
+        isolate_deadline = seconds_option("--isolate-sensors", 2.0)
+        status_port = port_option("--status", DEFAULT_STATUS_PORT)
+    except ValueError as e:
+        print(f"❌ Opción no válida: {e}")
+        return
+    
     # Setup SteelSeries GG
     gg_url = get_gg_url()
-    if not gg_url or not setup_gg(gg_url):
+    if not gg_url:
         print("❌ SteelSeries GG setup failed")
         return
     
-    # Setup Hardware Monitor
-    hw_monitor = HardwareMonitor()
-    if not hw_monitor.start():
+    gg_client = GameSenseClient(gg_url)
+    if not setup_gg(gg_client):
+        print("❌ SteelSeries GG setup failed")
+        gg_client.close()
+        return
+    
+    # Setup Hardware Monitor (en modo --async lo muestrea el runtime asyncio)
+    use_async = "--async" in sys.argv
+    # ARCTIC_BACKEND=replay + ARCTIC_REPLAY=<.ring|.jsonl> reproduce una sesión grabada
+    # Cada grupo de sensores con su periodo (cargas 0.5s, temperaturas 2s, memoria 5s,
+    # disco 60s) salvo --sample-interval=segundos, que fija el mismo para todos
+    # --isolate-sensors[=segundos]: el backend corre en un proceso recolector que se
+    # mata y relanza si una consulta (WMI/COM colgado) supera el plazo (2s por defecto)
+    backend = None
+    if isolate_deadline is not None:
+        backend = ProcessBackend(create_default_backend, deadline=isolate_deadline)
+        print(f"🛡️  Sensores en proceso aparte (plazo {isolate_deadline:.1f}s por consulta)")
+    hw_monitor = HardwareMonitor(backend=backend, interval=sample_interval)
+    # Solo se leen los sensores que alguien muestra/exporta; con el display OFF y
+    # nada más suscrito el monitor no sondea nada
+    hw_monitor.subscribe("display", display_groups(True, "hardware", hardware_template))
+    runtime = AsyncRuntime(hw_monitor, gg_client, display_interval=HARDWARE_INTERVAL,
+                           disk_interval=DISK_INTERVAL, length_millis=FRAME_LENGTH_MILLIS,
+                           hardware_template=hardware_template,
+                           disk_template=disk_template) if use_async else None
+    
+    # Historial opcional en disco (--history[=ruta]): una semana a 1 Hz en ~12 MB,
+    # y tramos 10s/1m/15m con min/max/media junto a él
+    history = rollups = None
+    history_option = cli_option("--history")
+    if history_option:
+        try:
+            history = RingFile(default_history_path() if history_option is True else history_option)
+            rollups = RollupEngine(history.path)
+            hw_monitor.add_listener(HistoryRecorder(history, rollup=rollups))
+            hw_monitor.subscribe("history", groups_for(history.columns))
+            print(f"🗂️  Historial en {history.path} ({len(history)} muestras previas)")
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Historial desactivado: {e}")
+    
+    # Volcado JSONL de cada muestra (--record=ruta.jsonl) para reproducirlo después
+    recorder = None
+    record_option = cli_option("--record")
+    if isinstance(record_option, str):
+        recorder = JsonlRecorder(record_option)
+        hw_monitor.add_listener(recorder)
+        hw_monitor.subscribe("record", ALL_GROUPS)
+        print(f"⏺️  Grabando muestras en {record_option}")
+    
+    # Últimos valores en memoria compartida (--shared-memory[=nombre]) para overlay,
+    # logger, control de ventiladores... sin que cada uno consulte LHM por su cuenta
+    shared = None
+    shared_option = cli_option("--shared-memory")
+    if shared_option:
+        try:
+            shared = SharedStatsWriter(DEFAULT_SHARED_NAME if shared_option is True else shared_option)
+            hw_monitor.add_listener(shared)
+            hw_monitor.subscribe("shared", ALL_GROUPS)
+            print(f"🧩 Estadísticas compartidas en el bloque '{shared.name}' (python -m src.sharedmem)")
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Memoria compartida desactivada: {e}")
+    
+    if not use_async and not hw_monitor.start():
         print("❌ Hardware monitor failed")
         return
     
+    # Diagnóstico: perfilador por muestreo (--profile o Ctrl+F11) y endpoint de estado (--status[=puerto])
+    profiler = SamplingProfiler()
+    if cli_option("--profile"):
+        profiler.start()
+    status_server = None
+    
     # Setup Keybinds
     keybind_listener = KeybindListener()
     display_active = True
-    display_mode = "hardware"  # "hardware" o "disk"
+    display_mode = "hardware"  # "hardware", "disk", "bitmap" o "graph" (con numpy)
+    canvas = None  # BitmapCanvas de los modos bitmap y graph
+    graphs = None  # Sparklines de CPU/GPU sobre las ventanas del monitor
+    hardware_interval = HARDWARE_INTERVAL
+    disk_interval = DISK_INTERVAL
+    count = 0
+    
+    # Esperas acotadas a 5s para que Ctrl+C responda también en Windows
+    scheduler = Scheduler(max_wait=5.0)
+    
+    def update_hardware():
+        nonlocal count
+        # Get hardware data from LibreHardwareMonitor
+        values = display_values(hw_monitor.get_quick_stats())
+        cpu_usage, gpu_usage = values['cpu_usage'], values['gpu_usage']
+        ram_used_gb, ram_total_gb = values['ram_used_gb'], values['ram_total_gb']
+        
+        # Send hardware data to OLED
+        send_to_oled(gg_client, values, hardware_template, display_active=display_active)
+        count += 1
+        
+        # Console status
+        status_icon = "🟢"
+        print(f"\r{status_icon} [HW-{count}] CPU:{cpu_usage}% GPU:{gpu_usage}% RAM:{ram_used_gb:.1f}/{ram_total_gb:.0f}GB {self_usage()}", end='')
+    
+    def update_bitmap():
+        nonlocal count, canvas, graphs
+        if canvas is None:
+            canvas = BitmapCanvas()
+        if display_mode == "graph" and graphs is None:
+            graphs = usage_graphs(hw_monitor)
+        values = display_values(hw_monitor.get_quick_stats())
+        send_bitmap_to_oled(gg_client, canvas, graphs if display_mode == "graph" else None,
+                            display_active=display_active, **values)
+        count += 1
+        
+        # Console status
+        status_icon = "📈" if display_mode == "graph" else "🖼️"
+        print(f"\r{status_icon} [BMP-{count}] CPU:{values['cpu_usage']}% GPU:{values['gpu_usage']}% "
+              f"(recodificados {canvas.encoded}, sin cambios {canvas.unchanged}) {self_usage()}", end='')
+    
+    def update_disk():
+        nonlocal count
+        # Send disk data to OLED
+        send_disk_info_to_oled(gg_client, hw_monitor, disk_template)
+        count += 1
+        
+        # Console status
+        status_icon = "💽"
+        print(f"\r{status_icon} [DISK-{count}] Próxima actualización en {int(disk_interval)}s", end='')
+    
+    def sync_jobs():
+        """Activa solo el trabajo del modo visible (se ejecuta al instante)"""
+        hw_monitor.subscribe("display", display_groups(display_active, display_mode, hardware_template))
+        if runtime:
+            runtime.set_display(display_active, display_mode)
+        else:
+            scheduler.set_enabled("hardware", display_active and display_mode == "hardware")
+            scheduler.set_enabled("disk", display_active and display_mode == "disk")
+            scheduler.set_enabled("bitmap", display_active and display_mode in ("bitmap", "graph"))
+        if not display_active:
+            # Console status cuando display está OFF
+            status_icon = "🔴"
+            print(f"\r{status_icon} [OFF] Monitor desactivado - Ctrl+F9 para activar", end='')
+    
+    scheduler.add_job("hardware", hardware_interval, update_hardware)
+    scheduler.add_job("disk", disk_interval, update_disk, enabled=False)
+    scheduler.add_job("bitmap", hardware_interval, update_bitmap, enabled=False)
     
     def toggle_display():
         nonlocal display_active
         display_active = not display_active
         
         if display_active:
-            if reactivate_display(gg_url):
-                threading.Thread(target=lambda: show_activation_message(gg_url), daemon=True).start()
+            if reactivate_display(gg_client):
+                if runtime:
+                    runtime.notify(ACTIVATION_FRAME, hold=1.5)
+                else:
+                    threading.Thread(target=lambda: show_activation_message(gg_client), daemon=True).start()
         else:
-            deactivate_display(gg_url)
+            deactivate_display(gg_client)
         
         print(f"\n📺 Display: {'ON' if display_active else 'OFF'}")
+        sync_jobs()
     
     def toggle_disk_mode():
         nonlocal display_mode
         if display_mode == "hardware":
             display_mode = "disk"
             print(f"\n💽 Cambiado a modo DISCO (actualización cada 5s)")
+        elif display_mode == "disk" and NUMPY_AVAILABLE:
+            display_mode = "bitmap"
+            print(f"\n🖼️  Cambiado a modo BITMAP (actualización cada 2s)")
+        elif display_mode == "bitmap":
+            display_mode = "graph"
+            print(f"\n📈 Cambiado a modo GRÁFICO (historial de CPU/GPU, actualización cada 2s)")
         else:
             display_mode = "hardware"
             print(f"\n🔧 Cambiado a modo HARDWARE (actualización cada 2s)")
+        sync_jobs()
+    
+    def toggle_profiler():
+        if profiler.toggle():
+            print(f"\n🔬 Perfilador activo - Ctrl+F11 para detener y guardar")
+        else:
+            print(f"\n🔬 Perfil guardado en {profiler.dump()} ({profiler.sample_count} muestras)")
+    
+    def collect_status():
+        """Estado completo para /stats (solo lee contadores)"""
+        frames = gg_client.frame_cache
+        return {
+            'display': {'active': display_active, 'mode': display_mode},
+            'hardware': dict(hw_monitor.get_quick_stats()),
+            'monitor': {'seq': hw_monitor.get_snapshot().seq,
+                        'groups': sorted(hw_monitor.groups), 'paused': hw_monitor.paused_count,
+                        'periods': hw_monitor.periods, 'reads': hw_monitor.group_reads,
+                        'subscriptions': {str(k): sorted(v) for k, v in (hw_monitor.subscriptions or {}).items()}},
+            'process': instruments.process_stats(),
+            'instrumentation': instruments.snapshot(),
+            'gamesense': dict(gg_client.connection_stats(), frames_sent=frames.sent,
+                              heartbeats=frames.heartbeats, skipped=frames.skipped),
+            'runtime': runtime.get_stats() if runtime else None,
+            'profiler': {'running': profiler.running, 'samples': profiler.sample_count},
+            'bitmap': {'encoded': canvas.encoded, 'unchanged': canvas.unchanged,
+                       'rows_packed': canvas.rows_packed} if canvas else None,
+            'shared_memory': {'name': shared.name, 'published': shared.published} if shared else None,
+            'collector': hw_monitor.backend.stats() if isinstance(hw_monitor.backend, ProcessBackend) else None,
+        }
+    
+    if status_port is not None:
+        try:
+            status_server = StatusServer(status_port)
+            status_server.add_route("/stats", collect_status)
+            status_server.add_route("/profile", lambda: ("text/plain; charset=utf-8", profiler.collapsed().encode('utf-8')))
+            status_server.add_route("/metrics", OpenMetricsExporter(hw_monitor).route)
+            status_server.start()
+            hw_monitor.subscribe("status", ALL_GROUPS)  # /metrics y /stats muestran todo
+            print(f"📈 Estado en {status_server.url}/stats | OpenMetrics en {status_server.url}/metrics")
+        except OSError as e:
+            print(f"⚠️  No se pudo abrir el endpoint de estado: {e}")
     
     keybind_listener.set_toggle_callback(toggle_display)
     keybind_listener.set_disk_callback(toggle_disk_mode)
+    keybind_listener.set_profile_callback(toggle_profiler)
     
     controls_msg = "| Ctrl+F9 = Toggle | F10 (3s) = Mode |" if keybind_listener.keyboard_available else "|"
     print(f"✅ Ready {controls_msg} Press Ctrl+C to stop")
@@ -298,67 +617,42 @@ def main():
     print("⚡ Ctrl+F9 = Inmediato | ⏳ F10 = Hold 3s")
     
     try:
-        count = 0
-        last_hardware_update = 0
-        last_disk_update = 0
-        hardware_interval = 2.0  # Hardware cada 2 segundos
-        disk_interval = 5.0     # Disk cada 5 segundos
-        
-        while True:
-            current_time = time.time()
-            
-            if display_active:
-                if display_mode == "hardware":
-                    # Modo hardware: actualizar cada 2 segundos
-                    if current_time - last_hardware_update >= hardware_interval:
-                        # Get hardware data from LibreHardwareMonitor
-                        hw = hw_monitor.get_quick_stats()
-                        cpu_usage = int(hw.get('cpu_usage', 0) or 0)
-                        cpu_temp = int(hw.get('cpu_temp', 0) or 0) if hw.get('cpu_temp') else 0
-                        gpu_usage = int(hw.get('gpu_usage', 0) or 0)
-                        gpu_temp = int(hw.get('gpu_temp', 0) or 0) if hw.get('gpu_temp') else 0
-                        
-                        # RAM desde LibreHardwareMonitor
-                        ram_used_gb = hw.get('ram_used_gb', 0) or 0
-                        ram_total_gb = hw.get('ram_total_gb', 0) or 16
-                        ram_percent = hw.get('ram_usage', 0) or 0
-                        
-                        # Send hardware data to OLED
-                        send_to_oled(gg_url, cpu_usage, cpu_temp, gpu_usage, gpu_temp, ram_used_gb, ram_total_gb, ram_percent, display_active)
-                        
-                        last_hardware_update = current_time
-                        count += 1
-                        
-                        # Console status
-                        status_icon = "🟢"
-                        print(f"\r{status_icon} [HW-{count}] CPU:{cpu_usage}% GPU:{gpu_usage}% RAM:{ram_used_gb:.1f}/{ram_total_gb:.0f}GB", end='')
-                
-                elif display_mode == "disk":
-                    if current_time - last_disk_update >= disk_interval:
-                        # Send disk data to OLED
-                        send_disk_info_to_oled(gg_url)
-                        
-                        last_disk_update = current_time
-                        count += 1
-                        
-                        # Console status
-                        status_icon = "💽"
-                        next_update = int(disk_interval - (current_time - last_disk_update))
-                        print(f"\r{status_icon} [DISK-{count}] Próxima actualización en {max(0, next_update)}s", end='')
-            else:
-                # Console status cuando display está OFF
-                status_icon = "🔴"
-                print(f"\r{status_icon} [OFF] Monitor desactivado - Ctrl+F9 para activar", end='')
-            
-            time.sleep(1.0)  # Sleep de 1 segundo para Ctrl+F9/F10 responsivo
+        if runtime:
+            print("🔀 Runtime asyncio: recolección, render y envío desacoplados")
+            asyncio.run(runtime.run())
+        else:
+            # Duerme hasta el siguiente plazo; los hotkeys despiertan el bucle al momento
+            scheduler.run()
     
     except KeyboardInterrupt:
         print("\n🛑 Stopping...")
     finally:
         keybind_listener.cleanup()
         hw_monitor.stop()
-        cleanup_gg(gg_url)
+        if recorder:
+            recorder.close()
+        if shared:
+            shared.close()
+        if rollups:
+            rollups.close()
+        if history:
+            history.close()
+        if status_server:
+            status_server.stop()
+        if profiler.running:
+            profiler.stop()
+            print(f"🔬 Perfil guardado en {profiler.dump()} ({profiler.sample_count} muestras)")
+        cleanup_gg(gg_client)
+        stats = gg_client.connection_stats()
+        print(f"🔌 GameSense: {stats['requests']} peticiones, {stats['connections']} conexiones ({stats['reused']} reutilizadas)")
+        frames = gg_client.frame_cache
+        print(f"🖼️  Frames: {frames.sent} enviados, {frames.heartbeats} heartbeats, {frames.skipped} omitidos")
+        errors = instruments.snapshot()['errors']
+        if errors:
+            print("⚠️  Errores ignorados: " + ", ".join(f"{where}={n}" for where, n in sorted(errors.items())))
+        gg_client.close()
         print("👋 Done")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Proceso recolector (--isolate-sensors) en el .exe de PyInstaller
     main()
\ No newline at end of file
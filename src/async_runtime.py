@@ -0,0 +1,229 @@
+# src/async_runtime.py - Runtime asyncio: recolección, render y envío desacoplados
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from .gamesense import GameSenseClient
+from .gamesense.client import EVENT
+from .instrumentation import instruments
+from .monitors.hardware_monitor import HardwareMonitor
+from .render import DISK_TEMPLATE, HARDWARE_TEMPLATE, FrameTemplate, disk_display_values, display_values
+from .render.bitmap import BITMAP_EVENT, BitmapCanvas, hardware_bitmap
+from .render.widgets import graph_bitmap, usage_graphs
+
+ACTIVATION_FRAME = {"line1": "", "line2": "  ✅ MONITOR ON", "line3": ""}
+
+
+def _put_latest(queue: asyncio.Queue, item) -> bool:
+    """Encola descartando lo más viejo si la cola está llena"""
+    dropped = False
+    if queue.full():
+        queue.get_nowait()
+        dropped = True
+    queue.put_nowait(item)
+    return dropped
+
+
+class AsyncRuntime:
+    """Tres tareas asyncio unidas por colas acotadas (tamaño 1, gana el último).
+
+    - collect: llama a ``monitor.poll`` en un único hilo ejecutor (el
+      backend WMI/COM vive siempre en ese hilo) cada vez que vence algún
+      grupo de sensores; se detiene mientras el monitor no tenga grupos
+      suscritos.
+    - render: compone el frame del modo visible con la última muestra
+      (texto o, en modos ``bitmap``/``graph``, un ``image-data`` de ``BitmapCanvas``).
+    - deliver: envía los frames a GameSense en su propio hilo ejecutor.
+
+    Una respuesta lenta de GameSense no retrasa la siguiente muestra ni al
+    revés: cada etapa solo ve el elemento más reciente de la anterior.
+    """
+
+    def __init__(self, monitor: HardwareMonitor, client: GameSenseClient,
+                 sample_interval: Optional[float] = None, display_interval: float = 2.0,
+                 disk_interval: float = 5.0, length_millis: Optional[int] = None,
+                 hardware_template: Optional[FrameTemplate] = None,
+                 disk_template: Optional[FrameTemplate] = None):
+        self.monitor = monitor
+        self.client = client
+        if sample_interval is not None:
+            monitor.set_interval(sample_interval)  # Si no, el periodo propio de cada grupo
+        self.display_interval = display_interval
+        self.disk_interval = disk_interval
+        self.length_millis = length_millis
+        self.hardware_template = hardware_template or HARDWARE_TEMPLATE
+        self.disk_template = disk_template or DISK_TEMPLATE
+
+        self.display_active = True
+        self.display_mode = "hardware"
+
+        self._loop = None
+        self._stop = None
+        self._changed = None
+        self._samples = None
+        self._resume = None
+        self._frames = None
+        self._hold_until = 0.0
+        self._canvas = None  # BitmapCanvas, se crea al entrar en modo bitmap
+        self._graphs = None  # Sparklines del modo graph
+
+        self.stats = {'samples': 0, 'frames': 0, 'delivered': 0, 'dropped_samples': 0,
+                      'dropped_frames': 0, 'errors': 0, 'paused': 0, 'last_staleness': None}
+
+    # --- API thread-safe (hotkeys) ---
+
+    def set_display(self, active: bool, mode: str):
+        self._call(self._apply_display, active, mode)
+
+    def notify(self, frame: Dict[str, str], hold: float = 1.5):
+        """Muestra un frame puntual y pausa el render ``hold`` segundos"""
+        self._call(self._apply_notify, frame, hold)
+
+    def stop(self):
+        self._call(lambda: self._stop.set())
+
+    def _call(self, fn, *args):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def _apply_display(self, active: bool, mode: str):
+        self.display_active = active
+        self.display_mode = mode
+        self._changed.set()
+        self._resume.set()  # Las suscripciones del monitor cambian con el display
+
+    def _apply_notify(self, frame: Dict[str, str], hold: float):
+        now = self._loop.time()
+        self._hold_until = now + hold
+        if _put_latest(self._frames, (now, frame, None, EVENT)):
+            self.stats['dropped_frames'] += 1
+        self._changed.set()
+
+    # --- Tareas ---
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._resume = asyncio.Event()
+        self._samples = asyncio.Queue(maxsize=1)
+        self._frames = asyncio.Queue(maxsize=1)
+
+        sensors = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sensors')
+        http = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gamesense')
+        await self._loop.run_in_executor(sensors, self.monitor.backend.open)
+
+        tasks = [asyncio.ensure_future(coro) for coro in
+                 (self._collect(sensors), self._render(), self._deliver(http))]
+        try:
+            await self._stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._loop.run_in_executor(sensors, self.monitor.backend.close)
+            sensors.shutdown(wait=False)
+            http.shutdown(wait=False)
+
+    async def _sleep_or_change(self, timeout: Optional[float]):
+        """Duerme ``timeout`` segundos o hasta un cambio de modo/display"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    async def _collect(self, executor: ThreadPoolExecutor):
+        while True:
+            self._resume.clear()
+            try:
+                data = await self._loop.run_in_executor(executor, self.monitor.poll)
+                if data is not None:
+                    self.stats['samples'] += 1
+                    if _put_latest(self._samples, (self._loop.time(), data)):
+                        self.stats['dropped_samples'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1  # Continuar en caso de error
+                instruments.error('runtime.collect', e)
+
+            # Hasta el siguiente grupo vencido o un cambio de display (nuevas suscripciones)
+            delay = self.monitor.next_poll()
+            if delay is None:
+                self.stats['paused'] += 1
+            try:
+                await asyncio.wait_for(self._resume.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _latest_sample(self, previous):
+        """Última muestra disponible (espera la primera si aún no hay)"""
+        if previous is None or not self._samples.empty():
+            previous = await self._samples.get()
+            while not self._samples.empty():
+                previous = self._samples.get_nowait()
+        return previous
+
+    async def _render(self):
+        sample = None
+        while True:
+            hold = self._hold_until - self._loop.time()
+            if hold > 0:
+                await asyncio.sleep(hold)
+                continue
+            if not self.display_active:
+                await self._sleep_or_change(None)
+                continue
+
+            event = EVENT
+            if self.display_mode == "hardware":
+                sample = await self._latest_sample(sample)
+                with instruments.stage('render'):
+                    sampled_at, frame = sample[0], self.hardware_template.render(display_values(sample[1]))
+                interval = self.display_interval
+            elif self.display_mode in ("bitmap", "graph"):
+                sample = await self._latest_sample(sample)
+                with instruments.stage('render.bitmap'):
+                    if self._canvas is None:
+                        self._canvas = BitmapCanvas()
+                    sampled_at, values = sample[0], display_values(sample[1])
+                    if self.display_mode == "graph":
+                        if self._graphs is None:
+                            self._graphs = usage_graphs(self.monitor)
+                        frame = graph_bitmap(self._canvas, self._graphs, **values).frame()
+                    else:
+                        frame = hardware_bitmap(self._canvas, **values).frame()
+                event, interval = BITMAP_EVENT, self.display_interval
+            else:
+                # El disco lo lee el monitor (grupo ``disk``, cada 60 s): al entrar
+                # en el modo se espera a su primera lectura
+                sample = await self._latest_sample(sample)
+                values = disk_display_values(sample[1])
+                if values is None:
+                    sample = await self._samples.get()
+                    continue
+                with instruments.stage('render.disk'):
+                    sampled_at, frame = sample[0], self.disk_template.render(values)
+                interval = self.disk_interval
+
+            if frame is not None:
+                self.stats['frames'] += 1
+                if _put_latest(self._frames, (sampled_at, frame, self.length_millis, event)):
+                    self.stats['dropped_frames'] += 1
+            await self._sleep_or_change(interval)
+
+    async def _deliver(self, executor: ThreadPoolExecutor):
+        while True:
+            sampled_at, frame, length_millis, event = await self._frames.get()
+            if not self.display_active:
+                continue
+            try:
+                await self._loop.run_in_executor(executor, self.client.send_frame,
+                                                 frame, length_millis, event)
+                self.stats['delivered'] += 1
+                self.stats['last_staleness'] = self._loop.time() - sampled_at
+            except Exception as e:
+                self.stats['errors'] += 1
+                instruments.error('runtime.deliver', e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
@@ -0,0 +1 @@
+# src/fakes - Dobles de prueba para ejecutar el monitor sin Windows ni SteelSeries GG
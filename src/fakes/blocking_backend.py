@@ -0,0 +1,34 @@
+# src/fakes/blocking_backend.py - Backend sintético que se cuelga como un proveedor WMI atascado
+import time
+from typing import AbstractSet, Any, Dict, Optional
+
+from .synthetic_backend import SyntheticBackend
+
+
+class BlockingBackend(SyntheticBackend):
+    """``SyntheticBackend`` cuya lectura número ``hang_every`` (y sus múltiplos) se bloquea.
+
+    Simula una consulta WMI/COM a LibreHardwareMonitor que no vuelve:
+    ``time.sleep(hang_seconds)`` dentro de ``read``, sin forma de
+    interrumpirla desde otro hilo. ``hang_on_open`` bloquea ya al abrir.
+    """
+
+    name = 'blocking'
+
+    def __init__(self, hang_every: int = 0, hang_seconds: float = 3600.0,
+                 hang_on_open: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.hang_every = hang_every
+        self.hang_seconds = hang_seconds
+        self.hang_on_open = hang_on_open
+        self.calls = 0
+
+    def open(self):
+        if self.hang_on_open:
+            time.sleep(self.hang_seconds)
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        self.calls += 1
+        if self.hang_every and self.calls % self.hang_every == 0:
+            time.sleep(self.hang_seconds)
+        return super().read(groups)
@@ -0,0 +1,158 @@
+# src/fakes/fake_wmi.py - Módulos wmi/pythoncom falsos con un namespace LHM sintético
+import re
+from typing import List, Optional
+
+_SELECT_RE = re.compile(r"^\s*SELECT\s+(.+?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+))?\s*$", re.IGNORECASE)
+_ATOM_RE = re.compile(r"^\s*(\w+)\s*=\s*'([^']*)'\s*$")
+
+
+class FakeWMIObject:
+    """Instancia WMI con atributos planos"""
+
+    def __init__(self, **props):
+        self.__dict__.update(props)
+
+    def __getattr__(self, name):
+        # Como en wmi, los nombres de propiedad no distinguen mayúsculas
+        for key, value in self.__dict__.items():
+            if key.lower() == name.lower():
+                return value
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return f"<FakeWMIObject {self.__dict__}>"
+
+
+class FakeLHMNamespace:
+    """Namespace root\\LibreHardwareMonitor en memoria"""
+
+    def __init__(self, hardware: List[FakeWMIObject], sensors: List[FakeWMIObject]):
+        self.hardware = hardware
+        self.sensors = sensors
+        self.alive = True
+        self.query_count = 0
+        self.hardware_count = 0
+        self._key_cache = {}
+
+    def _check(self):
+        if not self.alive:
+            raise RuntimeError("RPC server unavailable")
+
+    def Hardware(self):
+        self._check()
+        self.hardware_count += 1
+        return list(self.hardware)
+
+    def Sensor(self):
+        self._check()
+        return list(self.sensors)
+
+    def _by_identifier(self, rows):
+        cached = self._key_cache.get(id(rows))
+        if cached is None or cached[0] != len(rows):
+            cached = (len(rows), {row.Identifier: row for row in rows})
+            self._key_cache[id(rows)] = cached
+        return cached[1]
+
+    def query(self, wql: str):
+        """Subconjunto de WQL: SELECT campos FROM Clase WHERE a='x' [AND|OR ...]"""
+        self._check()
+        self.query_count += 1
+
+        match = _SELECT_RE.match(wql)
+        if not match:
+            raise ValueError(f"WQL no soportado: {wql}")
+        fields, klass, where = match.groups()
+        rows = self.sensors if klass.lower() == 'sensor' else self.hardware
+
+        if where:
+            clauses = [
+                [_ATOM_RE.match(atom).groups() for atom in re.split(r"\s+AND\s+", term, flags=re.IGNORECASE)]
+                for term in re.split(r"\s+OR\s+", where, flags=re.IGNORECASE)
+            ]
+            if all(len(clause) == 1 and clause[0][0] == 'Identifier' for clause in clauses):
+                # Búsqueda por clave, como haría el proveedor WMI
+                by_id = self._by_identifier(rows)
+                rows = [by_id[v] for (_, v), in clauses if v in by_id]
+            else:
+                rows = [row for row in rows
+                        if any(all(str(getattr(row, k)) == v for k, v in clause) for clause in clauses)]
+
+        if fields.strip() == '*':
+            return list(rows)
+        names = [name.strip() for name in fields.split(',')]
+        return [FakeWMIObject(**{name: getattr(row, name) for name in names}) for row in rows]
+
+
+class FakeWMIModule:
+    """Sustituto del módulo ``wmi`` que cuenta conexiones"""
+
+    def __init__(self, namespace: Optional[FakeLHMNamespace] = None):
+        self.namespace = namespace or default_namespace()
+        self.connect_count = 0
+        self.available = True
+
+    def WMI(self, namespace: str = None):
+        if not self.available:
+            raise RuntimeError(f"Namespace {namespace} no disponible")
+        self.connect_count += 1
+        self.namespace.alive = True
+        return self.namespace
+
+
+class FakeCOMModule:
+    """Sustituto de ``pythoncom``"""
+
+    def __init__(self):
+        self.init_count = 0
+        self.uninit_count = 0
+
+    def CoInitialize(self):
+        self.init_count += 1
+
+    def CoUninitialize(self):
+        self.uninit_count += 1
+
+
+def _sensor(parent: str, kind: str, index: int, name: str, value: float) -> FakeWMIObject:
+    return FakeWMIObject(Identifier=f"{parent}/{kind.lower()}/{index}", Parent=parent,
+                         Name=name, SensorType=kind, Value=value)
+
+
+def default_namespace(cpu_cores: int = 8) -> FakeLHMNamespace:
+    """CPU AMD + GPU NVIDIA + memoria, con los nombres que publica LHM"""
+    hardware = [
+        FakeWMIObject(Identifier="/amdcpu/0", HardwareType="Cpu", Name="AMD Ryzen 7 5800X"),
+        FakeWMIObject(Identifier="/gpu-nvidia/0", HardwareType="GpuNvidia", Name="NVIDIA GeForce RTX 3070"),
+        FakeWMIObject(Identifier="/ram", HardwareType="Memory", Name="Generic Memory"),
+    ]
+    sensors = [_sensor("/amdcpu/0", "Load", 0, "CPU Total", 25.0)]
+    sensors += [_sensor("/amdcpu/0", "Load", i, f"CPU Core #{i}", 20.0 + i) for i in range(1, cpu_cores + 1)]
+    sensors += [
+        _sensor("/amdcpu/0", "Temperature", 2, "Core (Tctl/Tdie)", 55.0),
+        _sensor("/amdcpu/0", "Temperature", 3, "CCD1 (Tdie)", 53.0),
+        _sensor("/gpu-nvidia/0", "Load", 0, "GPU Core", 40.0),
+        _sensor("/gpu-nvidia/0", "Load", 1, "GPU Memory Controller", 10.0),
+        _sensor("/gpu-nvidia/0", "Temperature", 0, "GPU Core", 62.0),
+        _sensor("/gpu-nvidia/0", "Temperature", 2, "GPU Hot Spot", 71.0),
+        _sensor("/ram", "Data", 0, "Memory Used", 12.5),
+        _sensor("/ram", "Data", 1, "Memory Available", 19.5),
+        _sensor("/ram", "Load", 0, "Memory", 39.0),
+    ]
+    return FakeLHMNamespace(hardware, sensors)
+
+
+def synthetic_namespace(total_sensors: int = 2000, cpu_cores: int = 16) -> FakeLHMNamespace:
+    """Namespace por defecto relleno con sensores de placa/almacenamiento/ventiladores"""
+    namespace = default_namespace(cpu_cores)
+    kinds = ("Voltage", "Fan", "Temperature", "Load", "Data", "Clock")
+    board = 0
+    while len(namespace.sensors) < total_sensors:
+        parent = f"/lpc/board{board}"
+        namespace.hardware.append(FakeWMIObject(Identifier=parent, HardwareType="SuperIO", Name=f"Board {board}"))
+        for i in range(100):
+            kind = kinds[i % len(kinds)]
+            namespace.sensors.append(_sensor(parent, kind, i, f"{kind} #{i}", float(i)))
+        board += 1
+    del namespace.sensors[total_sensors:]
+    return namespace
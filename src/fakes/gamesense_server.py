@@ -0,0 +1,171 @@
+# src/fakes/gamesense_server.py - Servidor GameSense simulado para pruebas y benchmarks
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+ENDPOINTS = ('game_metadata', 'bind_game_event', 'register_game_event', 'game_event',
+             'game_heartbeat', 'remove_game_event', 'remove_game')
+
+
+class FakeGameSenseServer:
+    """Implementa los endpoints de GameSense que usa el monitor.
+
+    Registra cada petición con su instante (``time.perf_counter``) y
+    guarda los frames recibidos en ``game_event``. Permite inyectar
+    latencia (``latency`` global o por endpoint) y errores (``error_rate``
+    o ``fail_next`` con el código HTTP a devolver).
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0):
+        self.latency = latency
+        self.endpoint_latency = {}  # type: Dict[str, float]
+        self.error_rate = 0.0
+        self.error_status = 500
+        self._fail_next = 0
+
+        self.lock = threading.Lock()
+        self.requests = []  # (instante, endpoint, cuerpo)
+        self.frames = []    # (instante, frame)
+        self.games = {}     # game -> set(eventos)
+        self.connection_count = 0
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Cabeceras y cuerpo salen en dos escrituras: con Nagle activo el
+            # cuerpo espera al ACK retardado del cliente (~40 ms por petición)
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with fake.lock:
+                    fake.connection_count += 1
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, reply = fake._handle(self.path.strip('/'), body)
+                payload = json.dumps(reply).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def _handle(self, endpoint: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        received = time.perf_counter()
+        delay = self.endpoint_latency.get(endpoint, self.latency)
+        if delay:
+            time.sleep(delay)
+
+        if endpoint not in ENDPOINTS:
+            return 404, {"error": f"Unknown endpoint {endpoint}"}
+        try:
+            data = json.loads(body or b'{}')
+        except ValueError:
+            return 400, {"error": "Invalid JSON"}
+
+        with self.lock:
+            self.requests.append((received, endpoint, data))
+            if self._fail_next > 0 or (self.error_rate and random.random() < self.error_rate):
+                self._fail_next = max(0, self._fail_next - 1)
+                return self.error_status, {"error": "Injected failure"}
+
+            game, event = data.get('game'), data.get('event')
+            if not game:
+                return 400, {"error": "Missing game"}
+            if endpoint == 'game_metadata':
+                self.games.setdefault(game, set())
+            elif endpoint == 'remove_game':
+                self.games.pop(game, None)
+            elif game not in self.games:
+                return 400, {"error": f"Game {game} not registered"}
+            elif endpoint in ('bind_game_event', 'register_game_event'):
+                self.games[game].add(event)
+            elif endpoint == 'remove_game_event':
+                self.games[game].discard(event)
+            elif endpoint == 'game_event':
+                if event not in self.games[game]:
+                    return 400, {"error": f"Event {event} not bound"}
+                self.frames.append((received, data.get('data', {}).get('frame', {})))
+        return 200, {"game": game}
+
+    # --- Inyección de fallos ---
+
+    def fail_next(self, count: int = 1, status: int = 500):
+        """Las próximas ``count`` peticiones devuelven ``status``"""
+        self._fail_next = count
+        self.error_status = status
+
+    # --- Ciclo de vida ---
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.address}"
+
+    def write_core_props(self, path: str):
+        """Escribe un coreProps.json que apunta a este servidor"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({"address": self.address, "encrypted_address": ""}, f)
+
+    def start(self) -> 'FakeGameSenseServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count(self, endpoint: Optional[str] = None) -> int:
+        with self.lock:
+            return sum(1 for _, name, _ in self.requests if endpoint is None or name == endpoint)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor GameSense simulado")
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--core-props', help="Ruta del coreProps.json a escribir")
+    parser.add_argument('--latency', type=float, default=0.0, help="Latencia por petición (s)")
+    args = parser.parse_args()
+
+    server = FakeGameSenseServer(args.port, args.latency).start()
+    if args.core_props:
+        server.write_core_props(args.core_props)
+        print(f"📝 {args.core_props} -> {server.address} (export GAMESENSE_COREPROPS={args.core_props})")
+    print(f"🎮 GameSense simulado en {server.url} - Ctrl+C para salir")
+
+    shown = 0
+    try:
+        while True:
+            time.sleep(0.5)
+            with server.lock:
+                new = server.frames[shown:]
+            for _, frame in new:
+                print(" | ".join(str(frame.get(f"line{i}", "")) for i in range(1, 4)))
+            shown += len(new)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
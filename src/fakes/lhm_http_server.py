@@ -0,0 +1,100 @@
+# src/fakes/lhm_http_server.py - Servidor web de LibreHardwareMonitor simulado (data.json)
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .fake_wmi import FakeLHMNamespace, default_namespace
+
+_GROUP_TEXT = {'Load': 'Load', 'Temperature': 'Temperatures', 'Data': 'Data',
+               'Voltage': 'Voltages', 'Fan': 'Fans', 'Clock': 'Clocks'}
+_UNITS = {'Load': '%', 'Temperature': '°C', 'Data': 'GB', 'Voltage': 'V', 'Fan': 'RPM', 'Clock': 'MHz'}
+_ICONS = {'Cpu': 'cpu.png', 'GpuNvidia': 'nvidia.png', 'GpuAmd': 'ati.png', 'Memory': 'ram.png'}
+
+
+def namespace_to_tree(namespace: FakeLHMNamespace) -> dict:
+    """Construye el árbol de data.json con el formato del servidor web de LHM"""
+    counter = iter(range(1, 1_000_000))
+
+    def node(text, children=(), image='', value='', **extra):
+        return dict(id=next(counter), Text=text, Min=value, Value=value, Max=value,
+                    ImageURL=image, Children=list(children), **extra)
+
+    hardware_nodes = []
+    for hw in namespace.hardware:
+        groups = {}
+        for sensor in namespace.sensors:
+            if sensor.Parent != hw.Identifier:
+                continue
+            text = f"{sensor.Value:.1f} {_UNITS.get(sensor.SensorType, '')}".strip()
+            groups.setdefault(sensor.SensorType, []).append(node(
+                sensor.Name, image='images/transparent.png', value=text,
+                SensorId=sensor.Identifier, Type=sensor.SensorType))
+        children = [node(_GROUP_TEXT.get(kind, kind), sensors) for kind, sensors in groups.items()]
+        hardware_nodes.append(node(hw.Name, children, image=f"images_icon/{_ICONS.get(hw.HardwareType, 'chip.png')}",
+                                   HardwareId=hw.Identifier))
+
+    return dict(id=0, Text='Sensor', Min='Min', Value='Value', Max='Max', ImageURL='',
+                Children=[node('DESKTOP-ARCTIC', hardware_nodes, image='images_icon/computer.png')])
+
+
+class FakeLHMHTTPServer:
+    """Sirve un data.json fijo por HTTP/1.1 con keep-alive en 127.0.0.1"""
+
+    def __init__(self, payload: Optional[bytes] = None, port: int = 0):
+        self.payload = payload if payload is not None else json.dumps(
+            namespace_to_tree(default_namespace())).encode('utf-8')
+        self.request_count = 0
+        self.connection_count = 0
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                fake.connection_count += 1
+
+            def do_GET(self):
+                fake.request_count += 1
+                if self.path.split('?')[0] != '/data.json':
+                    self.send_error(404)
+                    return
+                body = fake.payload
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def from_file(cls, path: str, port: int = 0) -> 'FakeLHMHTTPServer':
+        """Sirve un data.json grabado de una instalación real"""
+        with open(path, 'rb') as f:
+            return cls(f.read(), port)
+
+    @classmethod
+    def from_namespace(cls, namespace: FakeLHMNamespace, port: int = 0) -> 'FakeLHMHTTPServer':
+        return cls(json.dumps(namespace_to_tree(namespace)).encode('utf-8'), port)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeLHMHTTPServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
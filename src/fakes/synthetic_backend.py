@@ -0,0 +1,49 @@
+# src/fakes/synthetic_backend.py - Backend de sensores sintético (paseo aleatorio)
+import random
+import time
+from typing import AbstractSet, Any, Dict, Optional
+
+from ..monitors.backends.base import SensorBackend
+from ..monitors.groups import LOAD, MEMORY, TEMPERATURE
+
+
+class SyntheticBackend(SensorBackend):
+    """Genera lecturas plausibles sin hardware; ``delay`` simula el coste de WMI"""
+
+    name = 'synthetic'
+
+    def __init__(self, seed: int = 0, delay: float = 0.0, ram_total_gb: float = 32.0,
+                 cores: int = 8):
+        self._random = random.Random(seed)
+        self.delay = delay
+        self.ram_total_gb = ram_total_gb
+        self._state = {'cpu_usage': 20.0, 'cpu_temp': 50.0, 'gpu_usage': 30.0,
+                       'gpu_temp': 55.0, 'ram_used_gb': ram_total_gb / 3}
+        self.cores = cores
+        self.read_count = 0
+
+    def _step(self, key: str, scale: float, low: float, high: float) -> float:
+        value = self._state[key] + self._random.uniform(-scale, scale)
+        self._state[key] = value = min(high, max(low, value))
+        return value
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        if self.delay:
+            time.sleep(self.delay)
+        self.read_count += 1
+        jitter = self._random.uniform
+        stats = {}
+        if groups is None or MEMORY in groups:
+            ram_used_gb = self._step('ram_used_gb', 0.2, 1.0, self.ram_total_gb)
+            stats.update(ram_used_gb=ram_used_gb, ram_total_gb=self.ram_total_gb,
+                         ram_usage=ram_used_gb / self.ram_total_gb * 100)
+        if groups is None or LOAD in groups:
+            cpu_usage = self._step('cpu_usage', 8.0, 0.0, 100.0)
+            stats['cpu_usage'] = cpu_usage
+            stats['cpu_core_loads'] = [min(100.0, max(0.0, cpu_usage + jitter(-15.0, 15.0)))
+                                       for _ in range(self.cores)]
+            stats['gpu_usage'] = self._step('gpu_usage', 10.0, 0.0, 100.0)
+        if groups is None or TEMPERATURE in groups:
+            stats['cpu_temp'] = self._step('cpu_temp', 1.5, 30.0, 95.0)
+            stats['gpu_temp'] = self._step('gpu_temp', 1.0, 30.0, 90.0)
+        return stats
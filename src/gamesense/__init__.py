@@ -0,0 +1,5 @@
+# src/gamesense - Comunicación con SteelSeries GG (GameSense)
+from .client import EVENT, GAME, GameSenseClient
+from .core_props import core_props_path, get_gg_url
+
+__all__ = ['GameSenseClient', 'GAME', 'EVENT', 'get_gg_url', 'core_props_path']
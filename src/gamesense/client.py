@@ -0,0 +1,89 @@
+# src/gamesense/client.py - Cliente HTTP persistente para SteelSeries GameSense
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..instrumentation import instruments
+from .frames import HEARTBEAT, SEND, FrameCache
+from .payload import EventPayload, heartbeat_body
+
+GAME = "ARCTIS_MIN"
+EVENT = "DISPLAY"
+
+# Timeouts por endpoint (segundos)
+DEFAULT_TIMEOUTS = {
+    'game_metadata': 3.0,
+    'bind_game_event': 3.0,
+    'game_event': 0.5,
+    'game_heartbeat': 0.5,
+    'remove_game_event': 2.0,
+    'remove_game': 3.0,
+}
+
+
+class GameSenseClient:
+    """Una sesión keep-alive contra la dirección de coreProps.json.
+
+    Todas las llamadas comparten un único socket, así los ``game_event``
+    de cada segundo no pagan el establecimiento de conexión TCP. Los
+    frames se envían con cuerpos preconstruidos (``EventPayload``) en lugar
+    de serializar el diccionario completo en cada tick.
+    """
+
+    def __init__(self, url: str, timeouts: Optional[Dict[str, float]] = None,
+                 frame_cache: Optional[FrameCache] = None):
+        self.url = url
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.frame_cache = frame_cache or FrameCache()
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+        self._payloads = {}  # (evento, length_millis) -> EventPayload
+        self._heartbeat = heartbeat_body(GAME)
+
+    def post(self, endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST JSON a un endpoint de GameSense con su timeout"""
+        with instruments.stage('gamesense.' + endpoint):
+            return self.session.post(f"{self.url}/{endpoint}", json=payload,
+                                     timeout=self.timeouts.get(endpoint, 3.0))
+
+    def post_raw(self, endpoint: str, body: bytes) -> requests.Response:
+        """POST de un cuerpo JSON ya codificado (sin pasar por ``json.dumps``)"""
+        with instruments.stage('gamesense.' + endpoint):
+            return self.session.post(f"{self.url}/{endpoint}", data=body,
+                                     headers={'Content-Type': 'application/json'},
+                                     timeout=self.timeouts.get(endpoint, 3.0))
+
+    def payload(self, event: str = EVENT, length_millis: Optional[int] = None) -> EventPayload:
+        """Constructor de cuerpos ``game_event`` para ``event`` (uno por combinación)"""
+        key = (event, length_millis)
+        builder = self._payloads.get(key)
+        if builder is None:
+            builder = self._payloads[key] = EventPayload(GAME, event, length_millis)
+        return builder
+
+    def send_frame(self, frame: Dict[str, Any], length_millis: Optional[int] = None,
+                   event: str = EVENT) -> str:
+        """Envía un frame al evento ``event`` (DISPLAY) salvo que sea igual al anterior.
+
+        Devuelve la acción tomada (``send``, ``heartbeat`` o ``skip``).
+        """
+        action = self.frame_cache.check(frame)
+        if action == SEND:
+            self.post_raw("game_event", self.payload(event, length_millis).build(frame)).raise_for_status()
+        elif action == HEARTBEAT:
+            self.post_raw("game_heartbeat", self._heartbeat).raise_for_status()
+        # Solo se registra si GG lo aceptó: un frame rechazado se reintenta
+        self.frame_cache.record(action, frame, length_millis)
+        return action
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Peticiones enviadas, conexiones abiertas y reutilizaciones del socket"""
+        pools = self.session.get_adapter(self.url).poolmanager.pools
+        pools = [pools[key] for key in pools.keys()]
+        sent = sum(pool.num_requests for pool in pools)
+        opened = sum(pool.num_connections for pool in pools)
+        return {'requests': sent, 'connections': opened, 'reused': max(0, sent - opened)}
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,21 @@
+# src/gamesense/core_props.py - Localización de la dirección de SteelSeries GG
+import json
+import os
+from typing import Optional
+
+DEFAULT_CORE_PROPS = "C:/ProgramData/SteelSeries/GG/coreProps.json"
+CORE_PROPS_ENV = "GAMESENSE_COREPROPS"
+
+
+def core_props_path(path: Optional[str] = None) -> str:
+    """Ruta explícita, o la de GAMESENSE_COREPROPS, o la de GG en Windows"""
+    return path or os.environ.get(CORE_PROPS_ENV) or DEFAULT_CORE_PROPS
+
+
+def get_gg_url(path: Optional[str] = None) -> Optional[str]:
+    """Obtiene URL de SteelSeries GG"""
+    try:
+        with open(core_props_path(path), 'r') as f:
+            return f"http://{json.load(f)['address']}"
+    except (OSError, ValueError, KeyError):
+        return None
@@ -0,0 +1,64 @@
+# src/gamesense/frames.py - Deduplicación de frames enviados al OLED
+import time
+from typing import Any, Callable, Dict, Optional
+
+SEND = 'send'
+HEARTBEAT = 'heartbeat'
+SKIP = 'skip'
+
+
+class FrameCache:
+    """Recuerda el último frame enviado para no repetirlo.
+
+    Un frame idéntico al anterior no se reenvía: se sustituye por un
+    ``game_heartbeat`` (``unchanged_action='heartbeat'``) o no se envía
+    nada (``'skip'``). Pasados ``max_staleness`` segundos desde el último
+    envío real se fuerza un ``game_event`` completo aunque no haya cambios,
+    y antes si el frame anterior se envió con ``length_millis`` y ya
+    caducó en la pantalla: un heartbeat no lo vuelve a mostrar. Por eso
+    la app envía sus frames sin ``length-millis`` (se quedan hasta el
+    siguiente); con una duración menor que el periodo de refresco nunca
+    habría heartbeats.
+    """
+
+    def __init__(self, max_staleness: Optional[float] = 10.0, unchanged_action: str = HEARTBEAT,
+                 clock: Callable[[], float] = time.monotonic):
+        if unchanged_action not in (HEARTBEAT, SKIP):
+            raise ValueError(f"Acción no válida para frames repetidos: {unchanged_action}")
+        self.max_staleness = max_staleness
+        self.unchanged_action = unchanged_action
+        self._clock = clock
+        self._last_frame = None
+        self._last_sent = 0.0
+        self._last_length = None  # Segundos que el OLED muestra el último frame enviado
+
+        self.sent = 0
+        self.heartbeats = 0
+        self.skipped = 0
+
+    def check(self, frame: Dict[str, Any]) -> str:
+        """Decide qué hacer con ``frame``: SEND, HEARTBEAT o SKIP"""
+        if frame != self._last_frame:
+            return SEND
+        staleness = self.max_staleness
+        if self._last_length is not None:
+            staleness = self._last_length if staleness is None else min(staleness, self._last_length)
+        if staleness is not None and self._clock() - self._last_sent >= staleness:
+            return SEND
+        return self.unchanged_action
+
+    def record(self, action: str, frame: Dict[str, Any], length_millis: Optional[int] = None):
+        """Registra lo que realmente se envió (``length_millis``: duración pedida al OLED)"""
+        if action == SEND:
+            self._last_frame = dict(frame)
+            self._last_sent = self._clock()
+            self._last_length = length_millis / 1000 if length_millis is not None else None
+            self.sent += 1
+        elif action == HEARTBEAT:
+            self.heartbeats += 1
+        else:
+            self.skipped += 1
+
+    def reset(self):
+        """Olvida el último frame (p.ej. tras reactivar el display)"""
+        self._last_frame = None
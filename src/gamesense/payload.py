@@ -0,0 +1,61 @@
+# src/gamesense/payload.py - Cuerpos JSON de game_event con las partes fijas ya codificadas
+import json
+from typing import Any, Dict, Optional
+
+
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+_encode_string = json.encoder.encode_basestring_ascii  # Implementación en C
+
+
+def _encode(value: Any) -> bytes:
+    if type(value) is str:
+        return _encode_string(value).encode('ascii')
+    return _ENCODER.encode(value).encode('ascii')
+
+
+class EventPayload:
+    """Construye el cuerpo de ``game_event`` para un juego/evento sin ``json.dumps`` por tick.
+
+    El prefijo (``{"game":...,"event":...,"data":{"frame":{``), el sufijo
+    con ``length-millis`` y cada ``"clave":`` se codifican una vez; de los
+    valores del frame solo se recodifica el que cambió desde el último
+    ``build`` (una línea de texto o un ``image-data`` nuevo), el resto se
+    reutiliza tal cual. El resultado es JSON equivalente al que genera
+    ``requests`` con ``json=``.
+    """
+
+    def __init__(self, game: str, event: str, length_millis: Optional[int] = None):
+        self.prefix = b'{"game":' + _encode(game) + b',"event":' + _encode(event) + b',"data":{"frame":{'
+        self.suffix = b'}' + (b',"length-millis":' + _encode(length_millis) if length_millis is not None else b'') + b'}}'
+        self._keys = {}  # type: Dict[str, bytes]
+        self._values = {}  # clave -> (valor, bytes)
+
+        self.built = 0
+        self.encoded_values = 0
+
+    def build(self, frame: Dict[str, Any]) -> bytes:
+        parts = [self.prefix]
+        keys, values = self._keys, self._values
+        for key, value in frame.items():
+            encoded_key = keys.get(key)
+            if encoded_key is None:
+                encoded_key = keys[key] = _encode(key) + b':'
+            cached = values.get(key)
+            if cached is not None and (cached[0] is value or cached[0] == value):
+                encoded = cached[1]
+            else:
+                encoded = _encode(value)
+                values[key] = (value, encoded)
+                self.encoded_values += 1
+            if len(parts) > 1:
+                parts.append(b',')
+            parts.append(encoded_key)
+            parts.append(encoded)
+        parts.append(self.suffix)
+        self.built += 1
+        return b''.join(parts)
+
+
+def heartbeat_body(game: str) -> bytes:
+    """Cuerpo fijo de ``game_heartbeat``"""
+    return b'{"game":' + _encode(game) + b'}'
@@ -0,0 +1,5 @@
+# src/history - Historial de muestras en disco
+from .ring_file import HISTORY_COLUMNS, HistoryRecorder, RingFile, RingReader
+from .rollup import TIERS, RollupEngine
+
+__all__ = ['RingFile', 'RingReader', 'HistoryRecorder', 'HISTORY_COLUMNS', 'RollupEngine', 'TIERS']
@@ -0,0 +1,282 @@
+# src/history/ring_file.py - Historial en disco: ring buffer de registros binarios sobre mmap
+import math
+import mmap
+import os
+import struct
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+MAGIC = b'ARCRING1'
+VERSION = 1
+
+# magic, versión, columnas, tamaño de registro, capacidad, registros escritos,
+# creado (epoch), formato de valores, offset de datos
+HEADER = struct.Struct('<8sHHIQQdc3xI')
+COUNT = struct.Struct('<Q')
+COUNT_OFFSET = 24
+COLUMN_NAME = struct.Struct('32s')
+DATA_ALIGN = 64
+
+# Columnas por defecto: lo que muestra el OLED
+HISTORY_COLUMNS = ('cpu_usage', 'cpu_temp', 'gpu_usage', 'gpu_temp', 'ram_used_gb', 'ram_usage')
+DEFAULT_CAPACITY = 7 * 24 * 3600  # Una semana a 1 Hz
+
+# 'e' = float16 (2 bytes, ~3 cifras significativas, máx 65504), 'f' = float32
+VALUE_FORMATS = {'e': 65504.0, 'f': 3.4e38}
+
+
+class RingFile:
+    """Fichero de tamaño fijo con registros ``timestamp + columnas`` empaquetados.
+
+    Cada registro es un ``float64`` (epoch) seguido de un valor por columna
+    en ``value_format``; con 6 columnas float16 ocupa 20 bytes, una semana a
+    1 Hz son ~12 MB. Al llenarse sobrescribe el registro más antiguo. El
+    fichero se escribe a través de un ``mmap`` con ``struct.pack_into``: ni
+    ``write`` ni ``fsync`` por muestra (el sistema vuelca las páginas), y
+    nada se retiene en objetos Python. Si el fichero existe se reabre y se
+    sigue escribiendo tras el último registro; con ``readonly`` solo se lee.
+    """
+
+    def __init__(self, path: str, columns: Optional[Sequence[str]] = None,
+                 capacity: int = DEFAULT_CAPACITY, value_format: str = 'e',
+                 readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        if readonly or (os.path.exists(path) and os.path.getsize(path) >= HEADER.size):
+            self._file = open(path, 'rb' if readonly else 'r+b')
+            self._mm = mmap.mmap(self._file.fileno(), 0,
+                                 access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+            self._load_header()
+            if columns is not None and tuple(columns) != self.columns:
+                self.close()
+                raise ValueError(f"{path} tiene columnas {self.columns}, no {tuple(columns)}")
+        else:
+            if value_format not in VALUE_FORMATS:
+                raise ValueError(f"Formato de valores no soportado: {value_format}")
+            self.columns = tuple(columns or HISTORY_COLUMNS)
+            self.capacity = capacity
+            self.value_format = value_format
+            self.created = time.time()
+            self._setup_layout()
+            self._file = open(path, 'w+b')
+            self._file.truncate(self.data_offset + self.capacity * self.record_size)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            self._count = 0
+            self._write_header()
+
+    def _setup_layout(self):
+        self._record = struct.Struct('<d' + self.value_format * len(self.columns))
+        self.record_size = self._record.size
+        header_size = HEADER.size + COLUMN_NAME.size * len(self.columns)
+        self.data_offset = -(-header_size // DATA_ALIGN) * DATA_ALIGN
+        self._limit = VALUE_FORMATS[self.value_format]
+
+    def _write_header(self):
+        HEADER.pack_into(self._mm, 0, MAGIC, VERSION, len(self.columns), self.record_size,
+                         self.capacity, self._count, self.created,
+                         self.value_format.encode('ascii'), self.data_offset)
+        for i, name in enumerate(self.columns):
+            COLUMN_NAME.pack_into(self._mm, HEADER.size + i * COLUMN_NAME.size, name.encode('utf-8'))
+
+    def _load_header(self):
+        header = read_header(self._mm)
+        self.columns = header['columns']
+        self.capacity = header['capacity']
+        self.value_format = header['value_format']
+        self.created = header['created']
+        self._count = header['count']
+        self._setup_layout()
+        if (self.record_size, self.data_offset) != (header['record_size'], header['data_offset']):
+            raise ValueError(f"{self.path}: cabecera inconsistente")
+
+    @property
+    def count(self) -> int:
+        """Registros escritos desde la creación (incluidos los ya sobrescritos)"""
+        if self.readonly:
+            # Otro proceso puede seguir escribiendo
+            self._count = COUNT.unpack_from(self._mm, COUNT_OFFSET)[0]
+        return self._count
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(self, timestamp: float, values: Sequence[float]):
+        """Escribe un registro; ``nan`` marca un valor ausente"""
+        offset = self.data_offset + (self._count % self.capacity) * self.record_size
+        try:
+            self._record.pack_into(self._mm, offset, timestamp, *values)
+        except OverflowError:
+            # Fuera de rango para float16: se satura en lugar de perder la muestra
+            limit = self._limit
+            self._record.pack_into(self._mm, offset, timestamp,
+                                   *[max(-limit, min(limit, v)) for v in values])
+        self._count += 1
+        COUNT.pack_into(self._mm, COUNT_OFFSET, self._count)
+
+    def record(self, index: int) -> Tuple[float, ...]:
+        """Registro ``index`` en orden cronológico (0 = el más antiguo conservado)"""
+        count = self._count
+        position = count - min(count, self.capacity) + index
+        return self._record.unpack_from(self._mm, self.data_offset + (position % self.capacity) * self.record_size)
+
+    def iter_records(self) -> Iterator[Tuple[float, ...]]:
+        """Registros en orden cronológico sin NumPy (copia cada uno)"""
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def append_array(self, records):
+        """Añade de golpe un array estructurado de ``record_dtype`` (requiere numpy)"""
+        import numpy as np
+        records = records[-self.capacity:]
+        view = np.frombuffer(self._mm, dtype=record_dtype(self.columns, self.value_format),
+                             count=self.capacity, offset=self.data_offset)
+        start = self._count % self.capacity
+        first = min(len(records), self.capacity - start)
+        view[start:start + first] = records[:first]
+        view[:len(records) - first] = records[first:]
+        del view  # Sin vistas vivas el mmap se puede cerrar
+        self._count += len(records)
+        COUNT.pack_into(self._mm, COUNT_OFFSET, self._count)
+
+    def flush(self):
+        """Vuelca las páginas sucias a disco (no se llama por muestra)"""
+        self._mm.flush()
+
+    def close(self):
+        if self._mm is not None:
+            if not self.readonly:
+                self._mm.flush()
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+
+
+def record_dtype(columns: Sequence[str], value_format: str):
+    """dtype estructurado de NumPy equivalente a un registro"""
+    import numpy as np
+    return np.dtype([('timestamp', '<f8')] + [(name, '<' + value_format) for name in columns])
+
+
+def read_header(buffer) -> Dict[str, Any]:
+    """Decodifica la cabecera de un fichero de historial"""
+    (magic, version, ncols, record_size, capacity, count, created,
+     value_format, data_offset) = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("No es un fichero de historial (o versión no soportada)")
+    columns = tuple(COLUMN_NAME.unpack_from(buffer, HEADER.size + i * COLUMN_NAME.size)[0]
+                    .rstrip(b'\0').decode('utf-8') for i in range(ncols))
+    return {'columns': columns, 'record_size': record_size, 'capacity': capacity,
+            'count': count, 'created': created, 'value_format': value_format.decode('ascii'),
+            'data_offset': data_offset}
+
+
+class HistoryRecorder:
+    """Listener de ``HardwareMonitor`` que añade cada muestra al ``RingFile``.
+
+    ``rollup`` (opcional, p.ej. ``RollupEngine``) recibe el mismo instante y
+    valores con ``add(timestamp, values)``. Se guarda como mucho una
+    muestra cada ``period`` segundos (en promedio, sin deriva), así la
+    capacidad del anillo no depende del periodo de muestreo del monitor.
+    """
+
+    def __init__(self, ring: RingFile, clock=time.time, rollup=None, period: float = 1.0):
+        self.ring = ring
+        self.rollup = rollup
+        self.period = period
+        self._clock = clock
+        self._columns = ring.columns
+        self._next = -math.inf
+
+    def __call__(self, data: Dict[str, Any]):
+        nan = math.nan
+        timestamp = self._clock()
+        if timestamp < self._next:
+            return
+        # Plazo fijo; tras un hueco largo se vuelve a contar desde ahora
+        self._next = (self._next if timestamp - self._next < self.period else timestamp) + self.period
+        values = [nan if value is None else value for value in map(data.get, self._columns)]
+        self.ring.append(timestamp, values)
+        if self.rollup is not None:
+            self.rollup.add(timestamp, values)
+
+
+class RingReader:
+    """Lectura con NumPy sin copias sobre el mismo fichero (requiere numpy).
+
+    ``records`` es un array estructurado sobre el mapeo en orden de anillo;
+    ``segments()`` lo parte en (como mucho) dos vistas cronológicas. Las
+    vistas son en vivo: el escritor puede sobrescribirlas, usar ``.copy()``
+    para congelar un resultado.
+    """
+
+    def __init__(self, path: str):
+        import numpy as np
+        self._np = np
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = read_header(self._mm)
+        self.columns = header['columns']
+        self.capacity = header['capacity']
+        self.created = header['created']
+        self.dtype = record_dtype(self.columns, header['value_format'])
+        if self.dtype.itemsize != header['record_size']:
+            raise ValueError(f"{path}: tamaño de registro inesperado")
+        self.records = np.frombuffer(self._mm, dtype=self.dtype, count=self.capacity,
+                                     offset=header['data_offset'])
+
+    @property
+    def count(self) -> int:
+        """Registros escritos hasta ahora (se relee del mapeo en cada acceso)"""
+        return COUNT.unpack_from(self._mm, COUNT_OFFSET)[0]
+
+    def segments(self) -> List[Any]:
+        """Vistas cronológicas (sin copia) de los registros válidos"""
+        count = self.count
+        if count <= self.capacity:
+            return [self.records[:count]]
+        start = count % self.capacity
+        return [self.records[start:], self.records[:start]] if start else [self.records]
+
+    def _join(self, parts: List[Any]):
+        if len(parts) == 1:
+            return parts[0]
+        return self._np.concatenate(parts) if parts else self.records[:0]
+
+    def latest(self, n: Optional[int] = None):
+        """Los ``n`` últimos registros; vista sin copia salvo si cruzan el final del anillo"""
+        segments = self.segments()
+        if n is not None:
+            skip = max(0, sum(len(segment) for segment in segments) - n)
+            trimmed = []
+            for segment in segments:
+                if skip >= len(segment):
+                    skip -= len(segment)
+                    continue
+                trimmed.append(segment[skip:])
+                skip = 0
+            segments = trimmed
+        return self._join(segments)
+
+    def between(self, start: float, end: float):
+        """Registros con ``start <= timestamp < end`` (sin copia si no cruzan el final)"""
+        np = self._np
+        parts = []
+        for segment in self.segments():
+            times = segment['timestamp']
+            lo, hi = np.searchsorted(times, start, 'left'), np.searchsorted(times, end, 'left')
+            if hi > lo:
+                parts.append(segment[lo:hi])
+        return self._join(parts)
+
+    def column(self, name: str, n: Optional[int] = None):
+        """Una columna (o ``timestamp``) de los ``n`` últimos registros"""
+        return self.latest(n)[name]
+
+    def close(self):
+        self.records = None
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # Aún quedan vistas vivas: el mapeo se libera con ellas
+        self._file.close()
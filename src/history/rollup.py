@@ -0,0 +1,245 @@
+# src/history/rollup.py - Agregados min/max/media por tramos (10s, 1m, 15m) del historial
+import math
+import os
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .ring_file import HISTORY_COLUMNS, RingFile, RingReader, record_dtype
+
+# Periodo del tramo (s) -> capacidad: 30 días a 10 s, 90 días a 1 min, un año a 15 min
+TIERS = {10: 30 * 8640, 60: 90 * 1440, 900: 365 * 96}
+STATS = ('min', 'max', 'mean')
+
+
+def tier_columns(columns: Sequence[str]) -> Tuple[str, ...]:
+    """cpu_usage -> cpu_usage_min, cpu_usage_max, cpu_usage_mean, ..."""
+    return tuple(f"{column}_{stat}" for column in columns for stat in STATS)
+
+
+def tier_path(raw_path: str, period: int) -> str:
+    """history.ring -> history.10s.ring"""
+    root, ext = os.path.splitext(raw_path)
+    return f"{root}.{period}s{ext or '.ring'}"
+
+
+def rollup_arrays(timestamps, values, period: float):
+    """Agregados por tramo de ``period`` segundos, vectorizados con NumPy.
+
+    ``timestamps`` (n,) en orden cronológico y ``values`` (n, columnas) con
+    ``nan`` para valores ausentes. Devuelve ``(inicios, cuentas, mins, maxs,
+    medias)``; un tramo sin valores válidos en una columna da ``nan`` en ella.
+    """
+    import numpy as np
+    buckets = np.floor(timestamps / period) * period
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid, starts, axis=0)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+    mins = np.minimum.reduceat(np.where(valid, values, np.inf), starts, axis=0)
+    maxs = np.maximum.reduceat(np.where(valid, values, -np.inf), starts, axis=0)
+    empty = counts == 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    for result in (mins, maxs, means):
+        result[empty] = np.nan
+    return buckets[starts], counts, mins, maxs, means
+
+
+class RollupTier:
+    """Acumulador del tramo en curso de un periodo, sobre ``array`` (sin objetos por muestra)"""
+
+    def __init__(self, period: int, ring: RingFile, width: int):
+        self.period = period
+        self.ring = ring
+        self.width = width
+        self.bucket = None
+        self._count = array('q', bytes(8 * width))
+        self._sum = array('d', bytes(8 * width))
+        self._min = array('d', [math.inf] * width)
+        self._max = array('d', [-math.inf] * width)
+
+    def add(self, timestamp: float, values: Sequence[float]):
+        bucket = timestamp - timestamp % self.period
+        if bucket != self.bucket:
+            self.flush()
+            self.bucket = bucket
+        count, total, low, high = self._count, self._sum, self._min, self._max
+        for i, value in enumerate(values):
+            if value == value:  # Descarta nan
+                count[i] += 1
+                total[i] += value
+                if value < low[i]:
+                    low[i] = value
+                if value > high[i]:
+                    high[i] = value
+
+    def flush(self):
+        """Escribe el tramo en curso (si tiene muestras) y reinicia los acumuladores"""
+        if self.bucket is None or not any(self._count):
+            return
+        nan = math.nan
+        row = []
+        for i in range(self.width):
+            n = self._count[i]
+            row += (self._min[i], self._max[i], self._sum[i] / n) if n else (nan, nan, nan)
+        self.ring.append(self.bucket, row)
+        self.reset()
+
+    def seed(self, bucket: float, counts, sums, mins, maxs):
+        """Retoma un tramo abierto con sus acumulados (tras ``rebuild``)"""
+        self.bucket = bucket
+        for i in range(self.width):
+            self._count[i] = int(counts[i])
+            self._sum[i] = float(sums[i])
+            self._min[i] = float(mins[i])
+            self._max[i] = float(maxs[i])
+
+    def reset(self):
+        for i in range(self.width):
+            self._count[i] = 0
+            self._sum[i] = 0.0
+            self._min[i] = math.inf
+            self._max[i] = -math.inf
+
+
+class RollupEngine:
+    """Tramos 10s/1m/15m mantenidos a medida que llegan muestras del historial.
+
+    Cada tramo es un ``RingFile`` junto al fichero en bruto
+    (``history.10s.ring``...) con columnas ``<métrica>_min/_max/_mean``.
+    ``add`` se llama por muestra (ver ``HistoryRecorder(rollup=...)``) y
+    solo toca acumuladores; un registro se escribe al cerrar cada tramo.
+    ``query`` elige el tramo más grueso que cumple la resolución pedida y
+    ``rebuild`` recalcula desde el fichero en bruto los tramos que este cubre.
+    """
+
+    def __init__(self, raw_path: str, columns: Sequence[str] = HISTORY_COLUMNS,
+                 tiers: Optional[Dict[int, int]] = None, value_format: str = 'e'):
+        self.raw_path = raw_path
+        self.columns = tuple(columns)
+        self.value_format = value_format
+        self.tier_capacity = dict(tiers or TIERS)
+        self.tiers = [self._open_tier(period) for period in sorted(self.tier_capacity)]
+        self._readers = {}  # ruta -> RingReader (se reutilizan entre consultas)
+
+    def _open_tier(self, period: int) -> RollupTier:
+        ring = RingFile(tier_path(self.raw_path, period), tier_columns(self.columns),
+                        self.tier_capacity[period], self.value_format)
+        return RollupTier(period, ring, len(self.columns))
+
+    def add(self, timestamp: float, values: Sequence[float]):
+        for tier in self.tiers:
+            tier.add(timestamp, values)
+
+    # --- Consulta ---
+
+    def choose_period(self, resolution: float) -> int:
+        """Periodo del tramo más grueso con ``periodo <= resolution`` (0 = datos en bruto)"""
+        chosen = 0
+        for tier in self.tiers:
+            if tier.period <= resolution:
+                chosen = tier.period
+        return chosen
+
+    def query(self, start: float, end: float, resolution: float) -> Tuple[int, Any]:
+        """Registros en [start, end) con la resolución pedida (segundos entre puntos).
+
+        Devuelve ``(periodo, registros)``: con periodo 0 son muestras en bruto
+        (columnas originales), si no registros del tramo (``<métrica>_mean``...).
+        Los datos se leen con NumPy sobre el mapeo, sin copia salvo que el rango
+        cruce el final del anillo.
+        """
+        period = self.choose_period(resolution)
+        if period:
+            path = next(tier.ring.path for tier in self.tiers if tier.period == period)
+        else:
+            path = self.raw_path
+        reader = self._readers.get(path)
+        if reader is None:
+            reader = self._readers[path] = RingReader(path)
+        return period, reader.between(start, end)
+
+    def _close_readers(self):
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    # --- Reconstrucción ---
+
+    def rebuild(self, raw_path: Optional[str] = None):
+        """Recalcula los tramos que cubre el historial en bruto (vectorizado).
+
+        El bruto solo guarda la última semana y los tramos mucho más: los
+        registros de cada tramo anteriores a la primera muestra en bruto se
+        conservan tal cual y solo se reescriben los tramos desde ahí.
+        """
+        import numpy as np
+        self._close_readers()
+        reader = RingReader(raw_path or self.raw_path)
+        try:
+            raw = reader.latest()
+            # Copias en float64: los tramos se reescriben en ficheros nuevos
+            timestamps = raw['timestamp'].astype(np.float64)
+            values = np.empty((len(raw), len(self.columns)))
+            for i, column in enumerate(self.columns):
+                values[:, i] = raw[column]
+            del raw
+        finally:
+            reader.close()
+        if not len(timestamps):
+            return  # Nada que recalcular: los tramos se quedan como están
+
+        first = float(timestamps[0])
+        for index, tier in enumerate(self.tiers):
+            path = tier.ring.path
+            tier.ring.close()
+            old_reader = RingReader(path)
+            try:
+                old = old_reader.latest()
+                # El tramo donde empieza el bruto puede tener muestras anteriores que
+                # ya no están en él: si existe, se conserva el registro antiguo
+                partial = first - first % tier.period
+                cutoff = partial
+                if first != partial and bool((old['timestamp'] == partial).any()):
+                    cutoff = partial + tier.period
+                kept = old[old['timestamp'] < cutoff].copy()
+                del old
+            finally:
+                old_reader.close()
+
+            os.remove(path)
+            self.tiers[index] = tier = self._open_tier(tier.period)
+            tier.ring.append_array(kept)
+            use = timestamps >= cutoff
+            if not use.any():
+                continue
+
+            starts, counts, mins, maxs, means = rollup_arrays(timestamps[use], values[use], tier.period)
+            records = np.empty(len(starts), dtype=record_dtype(tier.ring.columns, self.value_format))
+            records['timestamp'] = starts
+            for i, column in enumerate(self.columns):
+                records[f"{column}_min"] = mins[:, i]
+                records[f"{column}_max"] = maxs[:, i]
+                records[f"{column}_mean"] = means[:, i]
+            # El último tramo puede seguir abierto: queda en el acumulador
+            last = len(records) - 1
+            tier.ring.append_array(records[:last])
+            filled = counts[last] > 0
+            tier.seed(float(starts[last]), counts[last],
+                      np.where(filled, means[last] * counts[last], 0.0),
+                      np.where(filled, mins[last], math.inf), np.where(filled, maxs[last], -math.inf))
+
+    def flush(self):
+        for tier in self.tiers:
+            tier.ring.flush()
+
+    def close(self):
+        """Escribe los tramos en curso y cierra los ficheros"""
+        self._close_readers()
+        for tier in self.tiers:
+            tier.flush()
+            tier.ring.close()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [{'period': tier.period, 'records': len(tier.ring), 'capacity': tier.ring.capacity}
+                for tier in self.tiers]
@@ -0,0 +1,217 @@
+# src/instrumentation.py - Medición del propio monitor: etapas, errores, proceso y perfilado
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class StageStats:
+    """Acumulados de una etapa: número de ejecuciones, total, máximo y última"""
+
+    __slots__ = ('count', 'total', 'max', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {'count': self.count, 'total_ms': self.total * 1e3,
+                'mean_us': self.total / self.count * 1e6 if self.count else 0.0,
+                'max_us': self.max * 1e6, 'last_us': self.last * 1e6}
+
+
+class _Timing:
+    """Context manager de una medición (uno por uso: seguro entre hilos)"""
+
+    __slots__ = ('_owner', '_name', '_start')
+
+    def __init__(self, owner: 'Instrumentation', name: str):
+        self._owner = owner
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._owner.record(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class Instrumentation:
+    """Temporizadores por etapa, errores tragados y consumo del propio proceso.
+
+    ``stage(nombre)`` mide un bloque ``with``; ``error(lugar, exc)`` cuenta
+    una excepción que el llamador decide ignorar para que no desaparezca
+    sin rastro. Todo es thread-safe y barato (un lock por registro).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}  # type: Dict[str, StageStats]
+        self.errors = Counter()
+        self.last_errors = {}  # type: Dict[str, str]
+        self._process = psutil.Process() if PSUTIL_AVAILABLE else None
+        self._cpu_mark = (time.monotonic(), time.process_time())
+        self._cpu_percent = 0.0
+
+    def stage(self, name: str) -> _Timing:
+        return _Timing(self, name)
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.last = seconds
+            if seconds > stats.max:
+                stats.max = seconds
+
+    def error(self, where: str, exc: Optional[BaseException] = None):
+        """Cuenta un error ignorado en ``where``"""
+        with self._lock:
+            self.errors[where] += 1
+            if exc is not None:
+                self.last_errors[where] = f"{type(exc).__name__}: {exc}"
+
+    def process_stats(self) -> Dict[str, Any]:
+        """CPU% del proceso, memoria residente e hilos.
+
+        El CPU% se recalcula como mucho una vez por segundo, así la consola
+        y el endpoint de estado pueden consultarlo sin estropearse la medida.
+        """
+        now, cpu = time.monotonic(), time.process_time()
+        with self._lock:
+            wall = now - self._cpu_mark[0]
+            if wall >= 1.0:
+                self._cpu_percent = (cpu - self._cpu_mark[1]) / wall * 100
+                self._cpu_mark = (now, cpu)
+            cpu_percent = self._cpu_percent
+        stats = {'cpu_percent': cpu_percent,
+                 'cpu_seconds': cpu, 'threads': threading.active_count(), 'pid': os.getpid()}
+        if self._process is not None:
+            stats['rss_bytes'] = self._process.memory_info().rss
+        return stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {name: stats.as_dict() for name, stats in self.stages.items()}
+            errors = dict(self.errors)
+            last_errors = dict(self.last_errors)
+        return {'stages': stages, 'errors': errors, 'last_errors': last_errors}
+
+    def visit(self, on_stage: Optional[Callable[[str, StageStats], None]] = None,
+              on_error: Optional[Callable[[str, int], None]] = None):
+        """Recorre etapas y errores bajo el lock sin copiarlos (exportadores)"""
+        with self._lock:
+            if on_stage is not None:
+                for name, stats in self.stages.items():
+                    on_stage(name, stats)
+            if on_error is not None:
+                for where, count in self.errors.items():
+                    on_error(where, count)
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.errors.clear()
+            self.last_errors.clear()
+
+
+class SamplingProfiler:
+    """Perfilador por muestreo de todos los hilos (``sys._current_frames``).
+
+    Un hilo propio toma la pila de cada hilo ``hz`` veces por segundo y
+    acumula pilas plegadas (``a;b;c N``), el formato que leen flamegraph.pl
+    y speedscope. A diferencia de cProfile no instrumenta cada llamada y ve
+    también el hilo del monitor y los ejecutores.
+    """
+
+    def __init__(self, hz: float = 100.0, max_depth: int = 64):
+        self.interval = 1.0 / hz
+        self.max_depth = max_depth
+        self.samples = Counter()
+        self.sample_count = 0
+        self.started_at = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        with self._lock:
+            self.samples.clear()
+            self.sample_count = 0
+        self.started_at = time.time()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def toggle(self) -> bool:
+        """Arranca o detiene; devuelve si queda activo"""
+        if self.running:
+            self.stop()
+            return False
+        self.start()
+        return True
+
+    def _run(self):
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            stacks = []
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                stacks.append(';'.join(reversed(stack)))
+            with self._lock:
+                self.samples.update(stacks)
+                self.sample_count += 1
+
+    def collapsed(self) -> str:
+        """Pilas plegadas, una por línea, de la más frecuente a la menos"""
+        with self._lock:
+            common = self.samples.most_common()
+        return ''.join(f"{stack} {count}\n" for stack, count in common)
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """Escribe el perfil actual (sin detenerlo) y devuelve la ruta"""
+        path = path or time.strftime('profile-%Y%m%d-%H%M%S.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+        return path
+
+
+# Instancia compartida por todo el proceso
+instruments = Instrumentation()
@@ -0,0 +1,153 @@
+# src/metrics_exporter.py - Exportador OpenMetrics (/metrics) de los datos ya recolectados
+import math
+import threading
+from typing import Optional, Tuple
+
+from .instrumentation import Instrumentation, StageStats, instruments
+from .monitors.hardware_monitor import HardwareMonitor
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+PREFIX = 'arctic_'
+
+GB = 1024 ** 3
+
+# OpenMetrics escribe así los valores no finitos (repr daría nan/inf)
+_NON_FINITE = {math.inf: b'+Inf\n', -math.inf: b'-Inf\n'}
+
+# (clave de get_quick_stats, métrica, ayuda, escala)
+GAUGES = (
+    ('cpu_usage', 'cpu_usage_percent', 'CPU load averaged over the smoothing window', 1),
+    ('cpu_temp', 'cpu_temperature_celsius', 'CPU package temperature', 1),
+    ('gpu_usage', 'gpu_usage_percent', 'GPU core load averaged over the smoothing window', 1),
+    ('gpu_temp', 'gpu_temperature_celsius', 'GPU core temperature', 1),
+    ('ram_used_gb', 'memory_used_bytes', 'Memory in use', GB),
+    ('ram_total_gb', 'memory_total_bytes', 'Total memory', GB),
+    ('ram_usage', 'memory_usage_percent', 'Memory in use as a percentage of total', 1),
+)
+
+
+def _header(name: str, kind: str, help_text: str, unit: Optional[str] = None) -> bytes:
+    lines = f"# TYPE {PREFIX}{name} {kind}\n"
+    if unit:
+        lines += f"# UNIT {PREFIX}{name} {unit}\n"
+    return (lines + f"# HELP {PREFIX}{name} {help_text}\n").encode('utf-8')
+
+
+def _unit(name: str) -> Optional[str]:
+    for unit in ('percent', 'celsius', 'bytes', 'seconds'):
+        if name.endswith('_' + unit):
+            return unit
+    return None
+
+
+class OpenMetricsExporter:
+    """Serializa ``get_quick_stats`` y la instrumentación en texto OpenMetrics.
+
+    Cabeceras ``# TYPE/UNIT/HELP`` y prefijos de cada muestra (nombre y
+    etiquetas) se codifican una vez; cada scrape solo escribe los valores en
+    un ``bytearray`` reutilizado, sin crear objetos por muestra más allá del
+    propio número formateado. La única copia es el ``bytes`` de la respuesta.
+    """
+
+    def __init__(self, monitor: HardwareMonitor, instrumentation: Instrumentation = instruments,
+                 buffer_size: int = 8192):
+        self.monitor = monitor
+        self.instrumentation = instrumentation
+        self._buffer = bytearray(buffer_size)
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._labels = {}  # (métrica, valor de la etiqueta) -> prefijo codificado
+        self.scrape_count = 0
+
+        self._gauges = [(key, _header(name, 'gauge', help_text, _unit(name)),
+                         f"{PREFIX}{name} ".encode('utf-8'), scale)
+                        for key, name, help_text, scale in GAUGES]
+        self._core_header = _header('cpu_core_load_percent', 'gauge', 'Load per CPU core', 'percent')
+        self._core_labels = []  # Prefijo por índice de núcleo
+        self._process = (
+            ('cpu_seconds', _header('process_cpu_seconds', 'counter', 'CPU time used by the monitor', 'seconds'),
+             f"{PREFIX}process_cpu_seconds_total ".encode('utf-8')),
+            ('rss_bytes', _header('process_resident_memory_bytes', 'gauge', 'Resident memory of the monitor', 'bytes'),
+             f"{PREFIX}process_resident_memory_bytes ".encode('utf-8')),
+            ('threads', _header('process_threads', 'gauge', 'Threads in the monitor process'),
+             f"{PREFIX}process_threads ".encode('utf-8')),
+        )
+        self._stage_headers = (
+            _header('stage_runs', 'counter', 'Timed executions per pipeline stage'),
+            _header('stage_duration_seconds', 'counter', 'Time spent per pipeline stage', 'seconds'),
+        )
+        self._error_header = _header('errors', 'counter', 'Errors caught and ignored, by location')
+
+    def _label(self, metric: str, label: str, value: str) -> bytes:
+        """Prefijo ``metrica{label="valor"} `` cacheado"""
+        key = (metric, value)
+        prefix = self._labels.get(key)
+        if prefix is None:
+            escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+            prefix = self._labels[key] = f'{PREFIX}{metric}{{{label}="{escaped}"}} '.encode('utf-8')
+        return prefix
+
+    def _write(self, data: bytes):
+        end = self._pos + len(data)
+        self._buffer[self._pos:end] = data  # Crece solo si el buffer se queda corto
+        self._pos = end
+
+    def _sample(self, prefix: bytes, value):
+        self._write(prefix)
+        if value == value and value not in _NON_FINITE:
+            self._write(b'%r\n' % value)
+        else:
+            self._write(_NON_FINITE.get(value, b'NaN\n'))
+
+    # Se llaman bajo el lock de la instrumentación: solo escriben en el buffer
+
+    def _stage_runs(self, name: str, stats: StageStats):
+        self._sample(self._label('stage_runs_total', 'stage', name), stats.count)
+
+    def _stage_seconds(self, name: str, stats: StageStats):
+        self._sample(self._label('stage_duration_seconds_total', 'stage', name), stats.total)
+
+    def _error_count(self, where: str, count: int):
+        self._sample(self._label('errors_total', 'where', where), count)
+
+    def render(self) -> bytes:
+        stats = self.monitor.get_quick_stats()
+        process = self.instrumentation.process_stats()
+        with self._lock:
+            self._pos = 0
+            for key, header, prefix, scale in self._gauges:
+                self._write(header)
+                value = stats.get(key)
+                if value is not None:
+                    self._sample(prefix, float(value) * scale)
+
+            self._write(self._core_header)
+            core_labels = self._core_labels
+            for core, load in enumerate(stats.get('cpu_core_loads') or ()):
+                if core == len(core_labels):
+                    core_labels.append(self._label('cpu_core_load_percent', 'core', str(core)))
+                self._sample(core_labels[core], float(load))
+
+            for key, header, prefix in self._process:
+                value = process.get(key)
+                if value is not None:
+                    self._write(header)
+                    self._sample(prefix, value)
+
+            # Una pasada por familia: OpenMetrics exige sus muestras contiguas
+            runs_header, seconds_header = self._stage_headers
+            self._write(runs_header)
+            self.instrumentation.visit(on_stage=self._stage_runs)
+            self._write(seconds_header)
+            self.instrumentation.visit(on_stage=self._stage_seconds)
+            self._write(self._error_header)
+            self.instrumentation.visit(on_error=self._error_count)
+
+            self._write(b'# EOF\n')
+            self.scrape_count += 1
+            with memoryview(self._buffer) as view:
+                return bytes(view[:self._pos])
+
+    def route(self) -> Tuple[str, bytes]:
+        """Manejador para ``StatusServer.add_route('/metrics', ...)``"""
+        return CONTENT_TYPE, self.render()
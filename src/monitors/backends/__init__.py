@@ -0,0 +1,44 @@
+# src/monitors/backends - Fuentes de datos intercambiables para HardwareMonitor
+import os
+import platform
+from typing import Optional
+
+from .base import SensorBackend
+from .lhm_http_backend import DEFAULT_LHM_URL, LHMHTTPBackend
+from .linux_backend import LinuxBackend
+from .process_backend import CollectorTimeout, ProcessBackend
+from .replay_backend import JsonlRecorder, ReplayBackend
+from .wmi_backend import WMI_AVAILABLE, WMIBackend
+
+
+def create_default_backend(name: Optional[str] = None) -> SensorBackend:
+    """Crea el backend pedido (o ARCTIC_BACKEND) o el nativo de la plataforma"""
+    name = name or os.environ.get('ARCTIC_BACKEND')
+    if name == 'lhm-http':
+        return LHMHTTPBackend(os.environ.get('LHM_URL', DEFAULT_LHM_URL))
+    if name == 'wmi':
+        return WMIBackend()
+    if name == 'linux':
+        return LinuxBackend()
+    if name == 'replay':
+        path = os.environ.get('ARCTIC_REPLAY')
+        if not path:
+            raise ValueError("ARCTIC_BACKEND=replay requiere ARCTIC_REPLAY=<grabación .ring o .jsonl>")
+        speed = os.environ.get('ARCTIC_REPLAY_SPEED', '1')
+        try:
+            speed = float(speed)
+        except ValueError:
+            raise ValueError(f"ARCTIC_REPLAY_SPEED no es un número: {speed!r}") from None
+        return ReplayBackend(path, speed, loop=True)
+    if name:
+        raise ValueError(f"Backend desconocido: {name}")
+
+    if WMI_AVAILABLE:
+        return WMIBackend()
+    if platform.system() == 'Linux':
+        return LinuxBackend()
+    raise ImportError("HardwareMonitor requiere WMI y Windows, o Linux.")
+
+
+__all__ = ['SensorBackend', 'WMIBackend', 'LinuxBackend', 'LHMHTTPBackend', 'ReplayBackend',
+           'JsonlRecorder', 'ProcessBackend', 'CollectorTimeout', 'create_default_backend']
@@ -0,0 +1,37 @@
+# src/monitors/backends/base.py - Interfaz común de los backends de sensores
+from typing import AbstractSet, Any, Dict, Optional
+
+
+class SensorBackend:
+    """Fuente de lecturas de hardware para ``HardwareMonitor``.
+
+    ``open``/``read``/``close`` se llaman siempre desde el hilo de
+    monitoreo. ``read`` devuelve el mismo dict que ``get_quick_stats``
+    (``cpu_usage``, ``cpu_temp``, ``gpu_usage``, ``gpu_temp``,
+    ``ram_used_gb``, ``ram_total_gb``, ``ram_usage``), con el uso
+    instantáneo (el suavizado lo hace el monitor) y ``None`` en las
+    métricas que el backend no puede obtener. ``groups`` (ver
+    ``monitors.groups``) limita la lectura a esos grupos de sensores; un
+    backend puede devolver más métricas de las pedidas, nunca menos.
+
+    ``presmoothed`` indica que las lecturas ya vienen suavizadas (una
+    sesión grabada): el monitor las publica tal cual en vez de volver a
+    promediarlas.
+    """
+
+    name = 'base'
+    presmoothed = False
+
+    def open(self):
+        """Prepara recursos (conexiones, descriptores) en el hilo actual"""
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Lee los grupos ``groups`` (None = todos)"""
+        raise NotImplementedError
+
+    def close(self):
+        """Libera los recursos abiertos en ``open``"""
+
+    def get_topology(self) -> Optional[Dict[str, Any]]:
+        """Topología de hardware descubierta, si el backend la conoce"""
+        return None
@@ -0,0 +1,161 @@
+# src/monitors/backends/lhm_http_backend.py - Backend HTTP (data.json) de LibreHardwareMonitor
+import json
+from typing import AbstractSet, Any, Dict, List, Optional
+
+from ..sensor_index import ROLES, classify_sensor, readings_to_stats
+from .base import SensorBackend
+
+DEFAULT_LHM_URL = "http://localhost:8085"
+
+# Tipo de sensor según el nodo de grupo (versiones de LHM sin campo "Type")
+_GROUP_TYPES = {'Load': 'Load', 'Temperatures': 'Temperature', 'Data': 'Data'}
+_HARDWARE_ICONS = {'cpu.png': 'cpu', 'nvidia.png': 'gpunvidia', 'ati.png': 'gpuamd', 'amd.png': 'gpuamd'}
+
+
+def parse_value(text: str) -> Optional[float]:
+    """'55,3 °C' / '20.0 %' -> float"""
+    try:
+        return float(text.split(None, 1)[0].replace(',', '.'))
+    except (IndexError, ValueError):
+        return None
+
+
+def _hardware_type(node: Dict[str, Any]) -> Optional[str]:
+    hardware_id = node.get('HardwareId')
+    if hardware_id:
+        if 'cpu' in hardware_id:
+            return 'cpu'
+        if hardware_id.startswith('/gpu-nvidia'):
+            return 'gpunvidia'
+        if hardware_id.startswith('/gpu-amd'):
+            return 'gpuamd'
+        return 'other'
+    image = node.get('ImageURL', '')
+    if image.startswith('images_icon/'):
+        return _HARDWARE_ICONS.get(image[len('images_icon/'):])
+    return None
+
+
+class LHMHTTPBackend(SensorBackend):
+    """Sondea el data.json del servidor web de LHM.
+
+    Usa una sesión HTTP keep-alive. La primera respuesta se recorre entera
+    para construir un índice plano (rol -> ruta de índices en el árbol); en
+    los ticks siguientes solo se siguen esas rutas. Si el cuerpo no cambió
+    respecto al anterior no se vuelve a parsear. El servidor siempre
+    devuelve el árbol completo, así que ``groups`` solo recorta la
+    conversión (y evita el psutil de respaldo de la memoria).
+    """
+
+    name = 'lhm-http'
+
+    def __init__(self, url: str = DEFAULT_LHM_URL, timeout: float = 1.0):
+        self.url = url.rstrip('/') + '/data.json'
+        self.timeout = timeout
+        self.session = None
+        self._entries = None  # [(ruta, rol, texto)]
+        self._last_body = None
+        self._last_stats = None
+        self._last_groups = None
+
+        self.index_builds = 0
+        self.parse_count = 0
+
+    def open(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+    def close(self):
+        if self.session:
+            self.session.close()
+            self.session = None
+
+    def _build_index(self, tree: Dict[str, Any]):
+        """Recorre el árbol completo una vez y guarda las rutas útiles"""
+        hardware = []  # [(tipo, ruta, nodo)]
+
+        def find_hardware(node, path):
+            hw_type = _hardware_type(node)
+            if hw_type:
+                hardware.append((hw_type, path, node))
+            for i, child in enumerate(node.get('Children', ())):
+                find_hardware(child, path + (i,))
+
+        find_hardware(tree, ())
+
+        kinds = {}
+        cpus = [h for h in hardware if h[0] == 'cpu']
+        gpus = [h for h in hardware if h[0] == 'gpunvidia'] or [h for h in hardware if h[0] == 'gpuamd']
+        if cpus:
+            kinds[cpus[0][1]] = 'cpu'
+        if gpus:  # Prioridad NVIDIA > AMD
+            kinds[gpus[0][1]] = 'gpu'
+
+        entries = []
+        for _, hw_path, hw_node in hardware:
+            kind = kinds.get(hw_path)
+            for g, group in enumerate(hw_node.get('Children', ())):
+                for s, sensor in enumerate(group.get('Children', ())):
+                    sensor_type = sensor.get('Type') or _GROUP_TYPES.get(group.get('Text'))
+                    if not sensor_type:
+                        continue
+                    role = classify_sensor(kind, sensor_type, sensor['Text'])
+                    if role:
+                        entries.append((hw_path + (g, s), role, sensor['Text']))
+
+        self._entries = entries
+        self.index_builds += 1
+
+    def _walk(self, tree: Dict[str, Any]) -> Optional[Dict[str, List[float]]]:
+        """Sigue solo las rutas indexadas; None si el árbol cambió"""
+        readings = {role: [] for role in ROLES}
+        try:
+            for path, role, text in self._entries:
+                node = tree
+                for i in path:
+                    node = node['Children'][i]
+                if node['Text'] != text:
+                    return None
+                value = parse_value(node['Value'])
+                if value is not None:
+                    readings[role].append(value)
+        except (IndexError, KeyError):
+            return None
+        return readings
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        try:
+            response = self.session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception:
+            raise ConnectionError("Error accediendo al servidor web de LHM")
+
+        body = response.content
+        if body == self._last_body and self._last_stats is not None and self._last_groups == groups:
+            return dict(self._last_stats)
+
+        tree = json.loads(body)
+        self.parse_count += 1
+        if self._entries is None:
+            self._build_index(tree)
+        readings = self._walk(tree)
+        if readings is None:
+            # Hardware o versión de LHM distinta: reconstruir el índice
+            self._build_index(tree)
+            readings = self._walk(tree)
+            if readings is None:
+                self._entries = None  # Volver a indexar en la siguiente lectura
+                raise ValueError("Árbol de sensores de LHM con formato inesperado")
+
+        stats = readings_to_stats(readings, groups)
+        self._last_body, self._last_stats, self._last_groups = body, stats, groups
+        return dict(stats)
+
+    def get_topology(self) -> Optional[Dict[str, Any]]:
+        if self._entries is None:
+            return None
+        return {'url': self.url, 'sensors': {role: sum(1 for e in self._entries if e[1] == role)
+                                             for role in ROLES}}
@@ -0,0 +1,134 @@
+# src/monitors/backends/linux_backend.py - Backend nativo Linux (procfs + hwmon)
+import glob
+import os
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence
+
+from ..groups import LOAD, MEMORY, TEMPERATURE
+from .base import SensorBackend
+
+# Drivers hwmon por orden de preferencia y etiquetas de temperatura a usar
+CPU_HWMON_NAMES = ('k10temp', 'zenpower', 'coretemp', 'cpu_thermal')
+CPU_TEMP_LABELS = ('Tctl', 'Tdie', 'Tccd1', 'Package id 0')
+GPU_HWMON_NAMES = ('amdgpu', 'nouveau', 'radeon')
+GPU_TEMP_LABELS = ('edge',)
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class LinuxBackend(SensorBackend):
+    """Lee /proc/stat, /proc/meminfo y /sys/class/hwmon.
+
+    Los ficheros se abren una vez en ``open`` y se releen con ``os.pread``
+    desde el offset 0, así que un tick cuesta unas pocas llamadas al sistema.
+    """
+
+    name = 'linux'
+
+    def __init__(self, proc_root: str = '/proc', sys_root: str = '/sys'):
+        if not hasattr(os, 'pread') or not os.path.exists(os.path.join(proc_root, 'stat')):
+            raise ImportError("LinuxBackend requiere /proc y os.pread.")
+
+        self.proc_root = proc_root
+        self.sys_root = sys_root
+        self._stat_fd = None
+        self._meminfo_fd = None
+        self._cpu_temp_fds = []
+        self._gpu_temp_fds = []
+        self._gpu_busy_fd = None
+        self._prev_cpu = None
+        # Línea agregada + una por núcleo (~100 bytes cada una)
+        self._stat_size = 256 + 128 * (os.cpu_count() or 1)
+
+    def open(self):
+        self._stat_fd = os.open(os.path.join(self.proc_root, 'stat'), os.O_RDONLY)
+        self._meminfo_fd = os.open(os.path.join(self.proc_root, 'meminfo'), os.O_RDONLY)
+        self._cpu_temp_fds = self._open_temps(CPU_HWMON_NAMES, CPU_TEMP_LABELS)
+        self._gpu_temp_fds = self._open_temps(GPU_HWMON_NAMES, GPU_TEMP_LABELS)
+
+        busy = sorted(glob.glob(os.path.join(self.sys_root, 'class/drm/card*/device/gpu_busy_percent')))
+        self._gpu_busy_fd = os.open(busy[0], os.O_RDONLY) if busy else None
+        self._prev_cpu = None
+
+    def close(self):
+        fds = [self._stat_fd, self._meminfo_fd, self._gpu_busy_fd] + self._cpu_temp_fds + self._gpu_temp_fds
+        for fd in fds:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._stat_fd = self._meminfo_fd = self._gpu_busy_fd = None
+        self._cpu_temp_fds, self._gpu_temp_fds = [], []
+
+    def _open_temps(self, names: Sequence[str], labels: Sequence[str]) -> List[int]:
+        """Abre las entradas temp*_input del primer driver hwmon preferido"""
+        chips = {}
+        for hwmon in sorted(glob.glob(os.path.join(self.sys_root, 'class/hwmon/hwmon*'))):
+            chips.setdefault(_read_text(os.path.join(hwmon, 'name')), hwmon)
+
+        for name in names:
+            hwmon = chips.get(name)
+            if hwmon is None:
+                continue
+            inputs = sorted(glob.glob(os.path.join(hwmon, 'temp*_input')))
+            selected = [path for path in inputs
+                        if _read_text(path.replace('_input', '_label')) in labels]
+            return [os.open(path, os.O_RDONLY) for path in (selected or inputs[:1])]
+        return []
+
+    def _read_temp(self, fds: List[int]) -> Optional[float]:
+        temps = [int(os.pread(fd, 16, 0)) / 1000.0 for fd in fds]
+        return sum(temps) / len(temps) if temps else None
+
+    def _read_loads(self, stats: Dict[str, Any]):
+        # CPU: líneas "cpu" y "cpuN" de /proc/stat ("cpu user nice system idle iowait ...")
+        stat = os.pread(self._stat_fd, self._stat_size, 0)
+        counters = []  # [(idle, total)]: agregado y luego cada núcleo
+        for line in stat.split(b'\n'):
+            if not line.startswith(b'cpu'):
+                break
+            fields = [int(v) for v in line.split()[1:9]]
+            counters.append((fields[3] + fields[4], sum(fields)))
+
+        loads = []
+        if self._prev_cpu is not None and len(self._prev_cpu) == len(counters):
+            for (idle, total), (prev_idle, prev_total) in zip(counters, self._prev_cpu):
+                delta_total = total - prev_total
+                loads.append((1.0 - (idle - prev_idle) / delta_total) * 100 if delta_total > 0 else 0.0)
+        self._prev_cpu = counters
+        stats['cpu_usage'] = loads[0] if loads else None
+        stats['cpu_core_loads'] = loads[1:]
+
+        gpu_usage = None
+        if self._gpu_busy_fd is not None:
+            gpu_usage = float(int(os.pread(self._gpu_busy_fd, 16, 0)))
+        stats['gpu_usage'] = gpu_usage
+
+    def _read_memory(self, stats: Dict[str, Any]):
+        # Memoria (kB)
+        meminfo = os.pread(self._meminfo_fd, 4096, 0)
+        mem_total_kb = int(meminfo[meminfo.index(b'MemTotal:') + 9:].split(None, 1)[0])
+        mem_available_kb = int(meminfo[meminfo.index(b'MemAvailable:') + 13:].split(None, 1)[0])
+        ram_total_gb = mem_total_kb / (1024**2)
+        ram_used_gb = (mem_total_kb - mem_available_kb) / (1024**2)
+        stats['ram_used_gb'] = ram_used_gb
+        stats['ram_total_gb'] = ram_total_gb
+        stats['ram_usage'] = (ram_used_gb / ram_total_gb * 100) if ram_total_gb > 0 else 0
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Solo se releen los ficheros de los grupos pedidos"""
+        stats = {}
+        if groups is None or LOAD in groups:
+            self._read_loads(stats)
+        if groups is None or TEMPERATURE in groups:
+            stats['cpu_temp'] = self._read_temp(self._cpu_temp_fds)
+            stats['gpu_temp'] = self._read_temp(self._gpu_temp_fds)
+        if groups is None or MEMORY in groups:
+            self._read_memory(stats)
+        return stats
@@ -0,0 +1,186 @@
+# src/monitors/backends/process_backend.py - Backend en un proceso aparte con vigilancia de plazos
+import multiprocessing
+import time
+from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple
+
+from ...instrumentation import instruments
+from .base import SensorBackend
+
+
+class CollectorTimeout(TimeoutError):
+    """El proceso recolector no respondió dentro del plazo (o aún está arrancando)"""
+
+
+def _worker(conn, factory: Callable[..., SensorBackend], args: Tuple, kwargs: Dict[str, Any]):
+    """Proceso recolector: abre el backend y responde a cada petición de lectura"""
+    backend = factory(*args, **kwargs)
+    try:
+        try:
+            backend.open()
+        except Exception as e:
+            conn.send(('error', f"{type(e).__name__}: {e}"))
+            return
+        conn.send(('ready', (backend.get_topology(), backend.presmoothed)))
+        while True:
+            groups = conn.recv()
+            try:
+                message = ('ok', backend.read(groups))
+            except Exception as e:
+                message = ('error', f"{type(e).__name__}: {e}")
+            conn.send(message)
+    except (EOFError, OSError):
+        pass  # El proceso principal cerró la tubería
+    finally:
+        backend.close()
+
+
+class ProcessBackend(SensorBackend):
+    """Ejecuta otro backend (WMI/COM de LHM, p.ej.) en un proceso recolector.
+
+    Cada ``read`` envía los grupos pedidos por una ``Pipe`` y espera la
+    muestra como mucho ``deadline`` segundos. Si el proveedor se cuelga,
+    el vigilante mata el proceso, lanza uno nuevo (que abre el backend en
+    paralelo) y la lectura falla con ``CollectorTimeout``: el monitor
+    conserva los últimos valores y el display sigue actualizándose en vez
+    de quedarse congelado junto con la consulta. ``close`` nunca espera a
+    un proceso colgado más de ``deadline``.
+
+    El arranque (importar, COM, primera enumeración) tampoco bloquea: cada
+    ``read`` espera al recolector como mucho ``deadline`` y, si aún no está
+    listo, falla con ``CollectorTimeout`` sin matarlo; solo se reinicia si
+    tarda más de ``start_timeout`` en total.
+
+    ``factory(*args, **kwargs)`` crea el backend dentro del proceso
+    recolector, así que debe poder importarse desde él (Windows arranca
+    los procesos con ``spawn``).
+    """
+
+    name = 'process'
+
+    def __init__(self, factory: Callable[..., SensorBackend], args: Tuple = (),
+                 kwargs: Optional[Dict[str, Any]] = None, deadline: float = 2.0,
+                 start_timeout: float = 15.0):
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.deadline = deadline
+        self.start_timeout = start_timeout  # Arranque en frío: importar, COM, primera enumeración
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._conn = None
+        self._ready = False
+        self._started_at = 0.0  # time.monotonic() del último arranque
+        self._topology = None
+
+        self.reads = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def _spawn(self):
+        parent, child = self._context.Pipe()
+        process = self._context.Process(target=_worker, args=(child, self.factory, self.args, self.kwargs),
+                                        name='arctic-collector', daemon=True)
+        process.start()
+        child.close()
+        self._process, self._conn, self._ready = process, parent, False
+        self._started_at = time.monotonic()
+
+    def _kill(self):
+        """Termina el proceso recolector sin esperar a que responda"""
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if conn is not None:
+            conn.close()
+        if process is not None:
+            process.kill()
+            process.join(timeout=self.deadline)
+
+    def _restart(self):
+        self._kill()
+        self.restarts += 1
+        self._spawn()
+
+    def _receive(self, timeout: float):
+        """Siguiente mensaje del recolector; lo reinicia si no llega a tiempo o murió"""
+        if self._poll(timeout):
+            try:
+                return self._conn.recv()
+            except (EOFError, OSError):
+                self._restart()
+                raise RuntimeError("El proceso recolector terminó inesperadamente") from None
+        self._timed_out(f"Sin respuesta del recolector en {timeout:.1f}s; reiniciado")
+
+    def _poll(self, timeout: float) -> bool:
+        """True si hay mensaje o la tubería se cerró (``recv`` lo dirá)"""
+        try:
+            return self._conn.poll(timeout)
+        except (EOFError, OSError):
+            return True
+
+    def _timed_out(self, message: str):
+        self.timeouts += 1
+        instruments.error('collector.timeout')
+        self._restart()
+        raise CollectorTimeout(message)
+
+    def _unwrap(self, message):
+        status, payload = message
+        if status == 'error':
+            raise RuntimeError(payload)
+        return payload
+
+    def _wait_ready(self):
+        """Espera al arranque como mucho ``deadline`` por lectura y ``start_timeout`` en total"""
+        if self._ready:
+            return
+        remaining = self._started_at + self.start_timeout - time.monotonic()
+        if not self._poll(max(0.0, min(remaining, self.deadline))):
+            if remaining > self.deadline:
+                raise CollectorTimeout("El proceso recolector aún está arrancando")  # Sin reiniciarlo
+            self._timed_out(f"El recolector no arrancó en {self.start_timeout:.1f}s; reiniciado")
+        message = self._receive(0)
+        if message[0] != 'ready':
+            self._restart()  # Falló al abrir el backend: probar de nuevo en la siguiente lectura
+            self._unwrap(message)
+        # ``factory`` puede ser una función (create_default_backend): el recolector lo dice
+        self._topology, self.presmoothed = message[1]
+        self._ready = True
+
+    def open(self):
+        if self._process is None:
+            self._spawn()
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        if self._process is None:
+            self._spawn()
+        self._wait_ready()
+        with instruments.stage('collect.worker'):
+            try:
+                self._conn.send(groups)
+            except (BrokenPipeError, OSError):
+                self._restart()
+                raise RuntimeError("El proceso recolector terminó inesperadamente") from None
+            data = self._unwrap(self._receive(self.deadline))
+        self.reads += 1
+        return data
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()  # El recolector sale al ver EOF
+            except OSError:
+                pass
+            self._conn = None
+        process, self._process = self._process, None
+        if process is not None:
+            process.join(timeout=self.deadline)
+            if process.is_alive():
+                process.kill()
+                process.join(timeout=self.deadline)
+
+    def get_topology(self) -> Optional[Dict[str, Any]]:
+        return self._topology
+
+    def stats(self) -> Dict[str, Any]:
+        return {'reads': self.reads, 'timeouts': self.timeouts, 'restarts': self.restarts,
+                'pid': self._process.pid if self._process is not None else None}
@@ -0,0 +1,191 @@
+# src/monitors/backends/replay_backend.py - Reproduce una sesión grabada como si fueran sensores
+import bisect
+import json
+import math
+import time
+from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple
+
+from ...history.ring_file import RingFile
+from ..groups import METRIC_GROUPS
+from .base import SensorBackend
+
+
+# Claves de sensores que se reproducen; el resto (``sampled_at``, ``seq``...) lo pone el monitor
+REPLAYED_KEYS = frozenset(METRIC_GROUPS)
+
+
+def _clean(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Solo claves de sensores, nan -> None y ``ram_total_gb`` derivado si la grabación no lo trae"""
+    data = {key: (None if isinstance(value, float) and math.isnan(value) else value)
+            for key, value in values.items() if key in REPLAYED_KEYS}
+    used, usage = data.get('ram_used_gb'), data.get('ram_usage')
+    if data.get('ram_total_gb') is None and used and usage:
+        data['ram_total_gb'] = used / usage * 100
+    return data
+
+
+class _RingSource:
+    """Registros de un ``RingFile`` leídos bajo demanda (sin cargarlos en memoria)"""
+
+    def __init__(self, path: str):
+        self.ring = RingFile(path, readonly=True)
+        self.length = len(self.ring)
+        self.columns = self.ring.columns
+
+    def timestamp(self, index: int) -> float:
+        return self.ring.record(index)[0]
+
+    def sample(self, index: int) -> Tuple[float, Dict[str, Any]]:
+        record = self.ring.record(index)
+        return record[0], dict(zip(self.columns, record[1:]))
+
+    def close(self):
+        self.ring.close()
+
+
+class _JsonlSource:
+    """Una muestra por línea: ``{"t": epoch, "cpu_usage": ..., ...}``.
+
+    Es el formato de ``JsonlRecorder`` y sirve para volcados capturados de
+    LHM/WMI ya convertidos a claves de ``get_quick_stats``. Sin ``t`` las
+    líneas se espacian un segundo.
+    """
+
+    def __init__(self, path: str):
+        self.samples = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    data = json.loads(line)
+                    t = data.pop('t', None)
+                    self.samples.append((float(t) if t is not None else float(len(self.samples)), data))
+        self.length = len(self.samples)
+
+    def timestamp(self, index: int) -> float:
+        return self.samples[index][0]
+
+    def sample(self, index: int) -> Tuple[float, Dict[str, Any]]:
+        return self.samples[index]
+
+    def close(self):
+        pass
+
+
+class _Timestamps:
+    """Secuencia perezosa de instantes para ``bisect`` sobre la fuente"""
+
+    def __init__(self, source):
+        self.source = source
+
+    def __len__(self):
+        return self.source.length
+
+    def __getitem__(self, index):
+        return self.source.timestamp(index)
+
+
+class ReplayBackend(SensorBackend):
+    """Reproduce un historial (``.ring``) o un volcado JSONL como backend.
+
+    ``speed`` 1.0 es tiempo real, 100 reproduce cien veces más rápido y
+    0 (o None) entrega el siguiente registro en cada ``read`` sin esperar
+    a nada. En los modos temporizados cada ``read`` devuelve el último
+    registro cuyo instante ya se alcanzó, como un sensor real sondeado a
+    cualquier intervalo. Al terminar repite desde el principio si ``loop``;
+    si no, sigue devolviendo el último registro y ``finished`` pasa a True.
+
+    Las grabaciones guardan los valores ya suavizados por el monitor
+    (``presmoothed``), así que se publican sin volver a promediarlos.
+    ``replay_time`` es el instante grabado del último registro entregado.
+    """
+
+    name = 'replay'
+    presmoothed = True
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, loop: bool = False,
+                 clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self._clock = clock
+        self._source = None
+        self._index = -1
+        self._origin = None  # (reloj, instante del primer registro)
+        self.replay_time = None  # type: Optional[float]
+        self.finished = False
+        self.read_count = 0
+        self.loops = 0
+
+    def open(self):
+        source = _JsonlSource(self.path) if self.path.endswith('.jsonl') else _RingSource(self.path)
+        if not source.length:
+            source.close()
+            raise ValueError(f"{self.path} no contiene muestras")
+        self._source = source
+        self._timestamps = _Timestamps(source)
+        self._restart()
+
+    def close(self):
+        if self._source:
+            self._source.close()
+            self._source = None
+
+    def _restart(self):
+        self._index = -1
+        self._origin = None
+        self.finished = False
+
+    def _next_index(self) -> int:
+        last = self._source.length - 1
+        if not self.speed:
+            return self._index + 1
+
+        now = self._clock()
+        if self._origin is None:
+            self._origin = (now, self._source.timestamp(0))
+        target = self._origin[1] + (now - self._origin[0]) * self.speed
+        # Último registro con instante <= objetivo (nunca retrocede)
+        index = bisect.bisect_right(self._timestamps, target, lo=max(0, self._index)) - 1
+        if index >= last and self._index == last:
+            return last + 1  # El último ya se entregó: fin de la grabación
+        return max(self._index, min(index, last), 0)
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Devuelve siempre la muestra grabada completa (``groups`` no ahorra nada aquí)"""
+        index = self._next_index()
+        if index >= self._source.length:
+            if self.loop:
+                self.loops += 1
+                self._restart()
+                index = self._next_index()
+            else:
+                self.finished = True
+                index = self._source.length - 1
+        elif index == self._source.length - 1 and not self.loop:
+            self.finished = True
+
+        self._index = index
+        self.read_count += 1
+        self.replay_time, values = self._source.sample(index)
+        return _clean(values)
+
+    def get_topology(self) -> Optional[Dict[str, Any]]:
+        if self._source is None:
+            return None
+        return {'replay': self.path, 'samples': self._source.length, 'position': self._index,
+                'replay_time': self.replay_time}
+
+
+class JsonlRecorder:
+    """Listener de ``HardwareMonitor`` que vuelca cada muestra a JSONL (para ``ReplayBackend``)"""
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self._file = open(path, 'a', encoding='utf-8')
+        self._clock = clock
+
+    def __call__(self, data: Dict[str, Any]):
+        self._file.write(json.dumps(dict(data, t=self._clock())) + '\n')
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,68 @@
+# src/monitors/backends/wmi_backend.py - Backend WMI/LibreHardwareMonitor (Windows)
+import importlib.util
+import platform
+from typing import AbstractSet, Any, Callable, Dict, Optional
+
+from ..sensor_index import SensorIndex, readings_to_stats
+from ..topology import TopologyCache
+from ..wmi_session import WMISession
+from .base import SensorBackend
+
+# Solo se comprueba que estén instalados: WMISession los importa en el hilo de monitoreo
+WMI_AVAILABLE = (platform.system() == 'Windows' and importlib.util.find_spec('pythoncom') is not None
+                 and importlib.util.find_spec('wmi') is not None)
+
+
+class WMIBackend(SensorBackend):
+    """Lee sensores de LibreHardwareMonitor a través de WMI"""
+
+    name = 'wmi'
+
+    def __init__(self, session_factory: Optional[Callable[[], WMISession]] = None,
+                 topology_ttl: Optional[float] = 300.0):
+        if session_factory is None and not WMI_AVAILABLE:
+            raise ImportError("WMIBackend requiere WMI y Windows.")
+
+        # La sesión se crea dentro del hilo de monitoreo (COM es por hilo)
+        self.session_factory = session_factory or WMISession
+        self.session = None
+        self.topology_cache = TopologyCache(ttl=topology_ttl)
+        self.sensor_index = SensorIndex()
+
+    def open(self):
+        self.session = self.session_factory()
+
+    def close(self):
+        if self.session:
+            self.session.close()
+
+    def get_topology(self) -> Optional[Dict[str, Any]]:
+        topology = self.topology_cache.topology
+        return topology.as_dict() if topology else None
+
+    def read(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Recolecta datos de hardware (solo los sensores de ``groups``)"""
+        lhm_client = self.session.client()
+        try:
+            # Identificar hardware (cacheado; cada reconexión fuerza re-enumerar)
+            topology = self.topology_cache.get(lhm_client, self.session.connect_count)
+            if self.sensor_index.topology is not topology:
+                previous_unknown = self.sensor_index.unknown_parents
+                self.sensor_index.build(lhm_client, topology)
+                # Hardware nuevo (o LHM recargado): re-enumerar en el próximo tick
+                if self.sensor_index.unknown_parents - previous_unknown:
+                    self.topology_cache.invalidate()
+
+            # Obtener solo los sensores seleccionados, en una consulta
+            readings = self.sensor_index.fetch(lhm_client, groups)
+        except Exception:
+            # Conexión muerta (LHM reiniciado): reconectar en el próximo tick
+            self.session.invalidate()
+            raise ConnectionError("Error accediendo a sensores WMI")
+
+        if readings is None:
+            # Algún sensor desapareció: reconstruir topología e índice
+            self.topology_cache.invalidate()
+            raise ConnectionError("Sensores WMI cambiaron")
+
+        return readings_to_stats(readings, groups)
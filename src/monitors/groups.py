@@ -0,0 +1,29 @@
+# src/monitors/groups.py - Grupos de sensores que se pueden pedir por separado al backend
+from typing import FrozenSet, Iterable
+
+LOAD = 'load'
+TEMPERATURE = 'temperature'
+MEMORY = 'memory'
+DISK = 'disk'
+
+# Métricas de get_quick_stats por grupo
+GROUP_METRICS = {
+    LOAD: ('cpu_usage', 'cpu_core_loads', 'gpu_usage'),
+    TEMPERATURE: ('cpu_temp', 'gpu_temp'),
+    MEMORY: ('ram_used_gb', 'ram_total_gb', 'ram_usage'),
+    DISK: ('disk_path', 'disk_usage', 'disk_used_gb', 'disk_free_gb', 'disk_total_gb'),
+}
+METRIC_GROUPS = {metric: group for group, metrics in GROUP_METRICS.items() for metric in metrics}
+
+# Grupos que lee el backend de sensores; el disco lo lee el monitor con psutil
+SENSOR_GROUPS = frozenset((LOAD, TEMPERATURE, MEMORY))
+ALL_GROUPS = frozenset(GROUP_METRICS)
+NO_GROUPS = frozenset()
+
+# Segundos entre lecturas de cada grupo: las cargas cambian rápido, el resto despacio
+DEFAULT_PERIODS = {LOAD: 0.5, TEMPERATURE: 2.0, MEMORY: 5.0, DISK: 60.0}
+
+
+def groups_for(metrics: Iterable[str]) -> FrozenSet[str]:
+    """Grupos necesarios para obtener ``metrics`` (las desconocidas se ignoran)"""
+    return frozenset(METRIC_GROUPS[metric] for metric in metrics if metric in METRIC_GROUPS)
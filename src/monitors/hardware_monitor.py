@@ -1,37 +1,95 @@
 # src/monitors/hardware_monitor.py - Versión Final Simplificada
-import platform
-import statistics
+import functools
+import os
 import threading
 import time
-from collections import deque
-from typing import Dict, Any
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, Hashable, Mapping, Optional
+
+from ..instrumentation import instruments
+from ..scheduler import Scheduler
+from .backends import SensorBackend, create_default_backend
+from .groups import ALL_GROUPS, DEFAULT_PERIODS, DISK, METRIC_GROUPS, NO_GROUPS, SENSOR_GROUPS
+from .snapshot import Snapshot
+from .window import TimeWindow
+
+# Segundos de promedio por métrica (el resto se publica sin suavizar)
+DEFAULT_WINDOWS = {'cpu_usage': 5.0, 'gpu_usage': 5.0}
+
+DEFAULT_DISK_PATH = 'C:' if os.name == 'nt' else '/'
+
+
+def read_disk(path: str = DEFAULT_DISK_PATH) -> Dict[str, Any]:
+    """Métricas del grupo ``disk`` para ``path`` (psutil)"""
+    import psutil
+
+    disk = psutil.disk_usage(path)
+    return {
+        'disk_path': path,
+        'disk_usage': (disk.used / disk.total) * 100,
+        'disk_used_gb': disk.used / (1024**3),
+        'disk_free_gb': disk.free / (1024**3),
+        'disk_total_gb': disk.total / (1024**3),
+    }
 
-try:
-    import pythoncom
-    import wmi
-    WMI_AVAILABLE = platform.system() == 'Windows'
-except ImportError:
-    WMI_AVAILABLE = False
 
 class HardwareMonitor:
-    """Monitor de hardware simplificado"""
+    """Monitor de hardware simplificado.
 
-    def __init__(self):
-        if not WMI_AVAILABLE:
-            raise ImportError("HardwareMonitor requiere WMI y Windows.")
-        
+    Los consumidores (modo del display, exportador, historial) declaran con
+    ``subscribe`` qué grupos de sensores necesitan y solo se lee su unión;
+    sin suscripciones el hilo de monitoreo queda parado en un ``Event``
+    hasta la siguiente. Mientras nadie se haya suscrito se leen todos los
+    sensores (el disco solo si alguien lo pide).
+
+    Cada grupo tiene su propio periodo (``DEFAULT_PERIODS``: cargas cada
+    0.5 s, temperaturas 2 s, memoria 5 s, disco 60 s) en un ``Scheduler``:
+    en cada vencimiento se piden al backend solo los grupos vencidos, en
+    una única lectura, y se combinan con los últimos valores del resto.
+    ``sampled_at`` guarda el ``time.time()`` de la última lectura de cada
+    métrica.
+
+    Cada muestra se publica como un ``Snapshot`` inmutable que sustituye
+    al anterior de golpe: ``get_quick_stats``/``get_snapshot`` no bloquean
+    ni copian, y ``snapshot.seq`` dice si llegó algo nuevo.
+    """
+
+    def __init__(self, backend: Optional[SensorBackend] = None,
+                 window_seconds: Optional[Dict[str, float]] = None,
+                 interval: Optional[float] = None, periods: Optional[Dict[str, float]] = None,
+                 disk_path: str = DEFAULT_DISK_PATH):
+        # Sin backend explícito se usa el nativo (WMI en Windows, procfs en Linux)
+        self.backend = backend or create_default_backend()
+        self.disk_path = disk_path
+        # Segundos entre lecturas por grupo; ``interval`` fija el mismo para todos
+        self.periods = dict(DEFAULT_PERIODS)
+        self.periods.update(periods or {})
+        if interval is not None:
+            self.periods = dict.fromkeys(self.periods, interval)
         self.running = False
         self.thread = None
-        self.current_data = {
+        self._snapshot = Snapshot(0, {
             'cpu_usage': 0, 'cpu_temp': None,
             'gpu_usage': 0, 'gpu_temp': None,
             'ram_usage': 0
-        }
-        self.data_lock = threading.Lock()
+        })
+        self.listeners = []  # Reciben cada muestra publicada (hilo del backend)
+        self.subscriptions = None  # type: Optional[Dict[Hashable, FrozenSet[str]]]
+        self._subscribe_lock = threading.Lock()  # Solo escritores; ``groups`` lee sin lock
+        self._wake = threading.Event()  # Suscripciones cambiadas o stop()
+        self.paused_count = 0
+        self.group_reads = dict.fromkeys(self.periods, 0)
         
-        # Samples para promedios
-        self.cpu_usage_samples = deque(maxlen=5)
-        self.gpu_usage_samples = deque(maxlen=5)
+        # Un trabajo por grupo que solo lo marca como vencido; poll() lee los marcados
+        self._due = set()
+        self._scheduler = Scheduler()
+        groups = self.groups
+        for group, period in self.periods.items():
+            self._scheduler.add_job(group, period, functools.partial(self._due.add, group),
+                                    enabled=group in groups)
+        
+        # Ventanas por tiempo para promedios
+        self.windows = {metric: TimeWindow(seconds)
+                        for metric, seconds in (window_seconds or DEFAULT_WINDOWS).items()}
 
     def start(self) -> bool:
         """Inicia el monitor"""
@@ -49,117 +107,170 @@ class HardwareMonitor:
     def stop(self):
         """Detiene el monitor"""
         self.running = False
+        self._wake.set()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=3.0)
 
     def _monitor_loop(self):
         """Bucle principal de monitoreo"""
-        while self.running:
-            try:
-                data = self._collect_data()
-                with self.data_lock:
-                    self.current_data = data
-            except Exception:
-                pass  # Continuar en caso de error
-            
-            time.sleep(1.0)
-
-    def _collect_data(self) -> Dict[str, Any]:
-        """Recolecta datos de hardware"""
+        self.backend.open()
         try:
-            pythoncom.CoInitialize()
-            lhm_client = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-
-            # Identificar hardware
-            cpu_identifier, gpu_identifier = None, None
-            nvidia_gpu_id, amd_gpu_id = None, None
-
-            for hw in lhm_client.Hardware():
-                hw_type_lower = hw.HardwareType.lower()
-                if 'cpu' in hw_type_lower:
-                    cpu_identifier = hw.Identifier
-                elif 'gpunvidia' in hw_type_lower:
-                    nvidia_gpu_id = hw.Identifier
-                elif 'gpuamd' in hw_type_lower:
-                    amd_gpu_id = hw.Identifier
-            
-            # Prioridad NVIDIA > AMD
-            gpu_identifier = nvidia_gpu_id or amd_gpu_id
-            
-            # Obtener sensores
-            temp_sensors = lhm_client.query("SELECT * FROM Sensor WHERE SensorType='Temperature'")
-            load_sensors = lhm_client.query("SELECT * FROM Sensor WHERE SensorType='Load'")
-            data_sensors = lhm_client.query("SELECT * FROM Sensor WHERE SensorType='Data'")  # Para memoria
-            all_sensors = temp_sensors + load_sensors + data_sensors
-
-        except Exception:
-            raise ConnectionError("Error accediendo a sensores WMI")
+            while self.running:
+                try:
+                    self.poll()
+                except Exception as e:
+                    instruments.error('monitor.sample', e)  # Continuar en caso de error
+                
+                # Dormir hasta el siguiente grupo vencido; sin grupos suscritos no
+                # hay plazo y se espera a una suscripción (sin sondeo). Un cambio
+                # de suscripción despierta antes.
+                delay = self.next_poll()
+                if delay is None:
+                    self.paused_count += 1
+                if self._wake.wait(delay):
+                    self._wake.clear()
         finally:
-            pythoncom.CoUninitialize()
+            self.backend.close()
 
-        # Procesar datos
-        cpu_load, cpu_temp, gpu_load, gpu_temps = None, None, None, None
-        memory_used_gb, memory_total_gb = None, None
-        
-        cpu_temp_sensors = {"CCD1 (Tdie)": None, "Core (Tctl/Tdie)": None}
-        cpu_core_loads = []
-        gpu_temp_sensors = {"GPU Core": None, "GPU Hot Spot": None}
-
-        for sensor in all_sensors:
-            # CPU
-            if cpu_identifier and sensor.Parent == cpu_identifier:
-                if sensor.SensorType == 'Load' and 'cpu core' in sensor.Name.lower():
-                    cpu_core_loads.append(sensor.Value)
-                elif sensor.SensorType == 'Temperature' and sensor.Name in cpu_temp_sensors:
-                    cpu_temp_sensors[sensor.Name] = sensor.Value
-
-            # GPU
-            elif gpu_identifier and sensor.Parent == gpu_identifier:
-                if sensor.SensorType == 'Load' and 'gpu core' in sensor.Name.lower():
-                    gpu_load = sensor.Value
-                elif sensor.SensorType == 'Temperature' and sensor.name in gpu_temp_sensors:
-                    gpu_temp_sensors[sensor.Name] = sensor.Value
-            
-            # MEMORIA - buscar sensores específicos de LibreHardwareMonitor
-            elif sensor.SensorType == 'Data':                
-                # Probar diferentes variaciones de nombres
-                if sensor.Name == 'Memory Used':
-                    memory_used_gb = sensor.Value
-                elif sensor.Name == 'Memory Available':
-                    memory_available_gb = sensor.Value
-                    if memory_used_gb is not None:
-                        memory_total_gb = memory_used_gb + memory_available_gb
-        
-        # Calcular promedios CPU
-        if cpu_core_loads:
-            cpu_load = statistics.mean(cpu_core_loads)
-            
-        cpu_temp = ((cpu_temp_sensors.get("CCD1 (Tdie)") + cpu_temp_sensors.get("Core (Tctl/Tdie)"))/2)
-        gpu_temp = gpu_temp_sensors.get("GPU Core") or gpu_temp_sensors.get("GPU Hot Spot")
-        # Agregar a muestras para promedio
-        if cpu_load is not None: 
-            self.cpu_usage_samples.append(cpu_load)
-        if gpu_load is not None: 
-            self.gpu_usage_samples.append(gpu_load)
-        
-        # Si no pudimos obtener memoria de LibreHardwareMonitor, usar psutil como fallback
-        if memory_used_gb is None or memory_total_gb is None:
-            import psutil
-            ram_info = psutil.virtual_memory()
-            memory_used_gb = ram_info.used / (1024**3)
-            memory_total_gb = ram_info.total / (1024**3)
-
-        return {
-            'cpu_usage': statistics.mean(self.cpu_usage_samples) if self.cpu_usage_samples else 0,
-            'cpu_temp': cpu_temp,
-            'gpu_usage': statistics.mean(self.gpu_usage_samples) if self.gpu_usage_samples else 0,
-            'gpu_temp': gpu_temp,
-            'ram_used_gb': memory_used_gb,
-            'ram_total_gb': memory_total_gb,
-            'ram_usage': (memory_used_gb / memory_total_gb * 100) if memory_total_gb > 0 else 0,
-        }
-
-    def get_quick_stats(self) -> Dict[str, Any]:
-        """Obtiene estadísticas actuales"""
-        with self.data_lock:
-            return self.current_data.copy()
\ No newline at end of file
+    def poll(self) -> Optional[Mapping[str, Any]]:
+        """Lee los grupos vencidos en una sola muestra (None si no vencía ninguno)"""
+        self._scheduler.run_pending()
+        if not self._due:
+            return None
+        due = frozenset(self._due)
+        self._due.clear()
+        return self.sample(due)
+
+    def next_poll(self) -> Optional[float]:
+        """Segundos hasta que venza el siguiente grupo (None = nada suscrito)"""
+        deadline = self._scheduler.next_deadline()
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def set_interval(self, interval: float):
+        """Mismo periodo de muestreo para todos los grupos"""
+        for group in self.periods:
+            self.set_period(group, interval)
+
+    def set_period(self, group: str, period: float):
+        self.periods[group] = period
+        self._scheduler.set_period(group, period)
+        self._wake.set()
+
+    def sample(self, groups: Optional[AbstractSet[str]] = None) -> Mapping[str, Any]:
+        """Lee ``groups`` (por defecto los suscritos) y publica la muestra (hilo del backend)"""
+        with instruments.stage('collect'):
+            data = self._collect_data(groups)
+        # Un solo escritor: el hilo de monitoreo o el ejecutor del runtime
+        snapshot = Snapshot(self._snapshot.seq + 1, data)
+        self._snapshot = snapshot
+        data = snapshot.values
+        for listener in self.listeners:
+            try:
+                listener(data)
+            except Exception as e:
+                instruments.error('monitor.listener', e)
+        return data
+
+    # --- Suscripciones ---
+
+    @property
+    def groups(self) -> FrozenSet[str]:
+        """Grupos de sensores que alguien necesita ahora mismo"""
+        subscriptions = self.subscriptions
+        if subscriptions is None:
+            return SENSOR_GROUPS
+        return frozenset().union(*subscriptions.values()) if subscriptions else NO_GROUPS
+
+    def subscribe(self, consumer: Hashable, groups: AbstractSet[str]):
+        """Declara (o sustituye) los grupos que necesita ``consumer``; vacío = ninguno"""
+        unknown = set(groups) - ALL_GROUPS
+        if unknown:
+            raise ValueError(f"Grupos de sensores desconocidos: {', '.join(sorted(unknown))}")
+        with self._subscribe_lock:
+            subscriptions = dict(self.subscriptions or {})
+            subscriptions[consumer] = frozenset(groups)
+            self.subscriptions = subscriptions
+            self._sync_groups()
+
+    def unsubscribe(self, consumer: Hashable):
+        with self._subscribe_lock:
+            subscriptions = dict(self.subscriptions or {})
+            subscriptions.pop(consumer, None)
+            self.subscriptions = subscriptions
+            self._sync_groups()
+
+    def _sync_groups(self):
+        """Activa los trabajos de los grupos suscritos (los recién activados vencen ya).
+
+        Se llama con ``_subscribe_lock``: dos suscripciones simultáneas no
+        pueden dejar el planificador con los grupos de una versión anterior.
+        """
+        groups = self.groups
+        for group in self.periods:
+            self._scheduler.set_enabled(group, group in groups)
+        self._wake.set()
+
+    def add_listener(self, listener: Callable[[Mapping[str, Any]], None]):
+        """Registra una función que recibe cada muestra (no debe bloquear)"""
+        self.listeners = self.listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[Mapping[str, Any]], None]):
+        self.listeners = [fn for fn in self.listeners if fn is not listener]
+
+    def _collect_data(self, groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Lee ``groups`` (por defecto los suscritos) y los combina con los últimos valores del resto"""
+        if groups is None:
+            groups = self.groups
+        sensor_groups = groups & SENSOR_GROUPS
+        data = {}  # type: Dict[str, Any]
+        if sensor_groups:
+            data = self.backend.read(None if sensor_groups == SENSOR_GROUPS else sensor_groups)
+        if DISK in groups:
+            try:
+                data.update(read_disk(self.disk_path))
+            except Exception as e:
+                instruments.error('monitor.disk', e)  # El resto de la muestra sigue valiendo
+        for group in groups:
+            self.group_reads[group] = self.group_reads.get(group, 0) + 1
+        loads = data.get('cpu_core_loads')
+        if loads is not None:
+            data['cpu_core_loads'] = tuple(loads)  # La muestra publicada no se modifica
+        now = time.monotonic()
+
+        # Agregar a muestras para promedio (solo métricas de los grupos leídos)
+        presmoothed = self.backend.presmoothed
+        for metric, window in self.windows.items():
+            if metric not in data and METRIC_GROUPS.get(metric) not in groups:
+                continue
+            value = data.get(metric)
+            if value is not None:
+                window.add(value, now)
+            else:
+                window.expire(now)
+            if presmoothed and value is not None:
+                continue  # Ya promediado al grabarlo; la ventana solo alimenta las gráficas
+            data[metric] = window.mean() if window.count else 0
+
+        stamp = time.time()
+        merged = dict(self._snapshot.values)
+        sampled_at = dict(merged.get('sampled_at') or {})
+        sampled_at.update(dict.fromkeys(data, stamp))
+        merged.update(data)
+        merged['sampled_at'] = sampled_at
+        return merged
+
+    def get_window(self, metric: str) -> Optional[TimeWindow]:
+        """Ventana de muestras de una métrica (None si no se promedia)"""
+        return self.windows.get(metric)
+
+    def get_topology(self) -> Optional[Dict[str, Any]]:
+        """Obtiene la topología de hardware descubierta (None si aún no hay)"""
+        return self.backend.get_topology()
+
+    def get_snapshot(self) -> Snapshot:
+        """Última muestra publicada (sin lock; comparar ``seq`` para detectar datos nuevos)"""
+        return self._snapshot
+
+    def get_quick_stats(self) -> Mapping[str, Any]:
+        """Obtiene estadísticas actuales (vista de solo lectura, sin copia)"""
+        return self._snapshot.values
\ No newline at end of file
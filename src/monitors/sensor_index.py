@@ -0,0 +1,161 @@
+# src/monitors/sensor_index.py - Índice de sensores precalculado para consultas dirigidas
+from typing import AbstractSet, Any, Dict, List, Optional
+
+from .groups import LOAD, MEMORY, TEMPERATURE
+from .topology import HardwareTopology
+
+# Roles de sensor que consume el monitor
+CPU_CORE_LOAD = 'cpu-core-load'
+CPU_TDIE = 'cpu-tdie'
+CPU_TCTL = 'cpu-tctl'
+GPU_CORE_LOAD = 'gpu-core-load'
+GPU_CORE_TEMP = 'gpu-core-temp'
+GPU_HOTSPOT_TEMP = 'gpu-hotspot-temp'
+MEMORY_USED = 'memory-used'
+MEMORY_AVAILABLE = 'memory-available'
+
+ROLES = (CPU_CORE_LOAD, CPU_TDIE, CPU_TCTL, GPU_CORE_LOAD, GPU_CORE_TEMP,
+         GPU_HOTSPOT_TEMP, MEMORY_USED, MEMORY_AVAILABLE)
+
+ROLE_GROUPS = {
+    CPU_CORE_LOAD: LOAD, GPU_CORE_LOAD: LOAD,
+    CPU_TDIE: TEMPERATURE, CPU_TCTL: TEMPERATURE, GPU_CORE_TEMP: TEMPERATURE, GPU_HOTSPOT_TEMP: TEMPERATURE,
+    MEMORY_USED: MEMORY, MEMORY_AVAILABLE: MEMORY,
+}
+
+_CPU_TEMPS = {"CCD1 (Tdie)": CPU_TDIE, "Core (Tctl/Tdie)": CPU_TCTL}
+_GPU_TEMPS = {"GPU Core": GPU_CORE_TEMP, "GPU Hot Spot": GPU_HOTSPOT_TEMP}
+_MEMORY = {"Memory Used": MEMORY_USED, "Memory Available": MEMORY_AVAILABLE}
+
+
+def classify_sensor(hardware_kind: Optional[str], sensor_type: str, name: str) -> Optional[str]:
+    """Asigna un rol a un sensor (solo al construir el índice, nunca por tick).
+
+    ``hardware_kind`` es 'cpu', 'gpu' o None para el resto del hardware.
+    """
+    if hardware_kind == 'cpu':
+        if sensor_type == 'Load' and 'cpu core' in name.lower():
+            return CPU_CORE_LOAD
+        if sensor_type == 'Temperature':
+            return _CPU_TEMPS.get(name)
+    elif hardware_kind == 'gpu':
+        if sensor_type == 'Load' and 'gpu core' in name.lower():
+            return GPU_CORE_LOAD
+        if sensor_type == 'Temperature':
+            return _GPU_TEMPS.get(name)
+    elif sensor_type == 'Data':
+        return _MEMORY.get(name)
+    return None
+
+
+class SensorIndex:
+    """Mapa Identifier -> rol construido una vez por topología.
+
+    Por tick solo se piden ``Identifier`` y ``Value`` de los sensores
+    seleccionados en una única consulta WQL, limitada a los grupos pedidos
+    (una consulta precalculada por combinación de grupos).
+    """
+
+    def __init__(self):
+        self.topology = None
+        self.roles = {}  # Identifier -> rol
+        self.unknown_parents = set()
+        self.wql = None
+        self._queries = {}  # grupos -> (WQL, sensores esperados)
+        self.build_count = 0
+
+    def build(self, lhm_client, topology: HardwareTopology):
+        """Enumera todos los sensores una vez y selecciona los que interesan"""
+        hardware_kinds = {}
+        if topology.cpu_identifier:
+            hardware_kinds[topology.cpu_identifier] = 'cpu'
+        if topology.gpu_identifier:
+            hardware_kinds[topology.gpu_identifier] = 'gpu'
+
+        roles = {}
+        unknown_parents = set()
+        for sensor in lhm_client.query("SELECT Identifier, Parent, Name, SensorType FROM Sensor"):
+            if not topology.knows(sensor.Parent):
+                unknown_parents.add(sensor.Parent)
+            role = classify_sensor(hardware_kinds.get(sensor.Parent), sensor.SensorType, sensor.Name)
+            if role:
+                roles[sensor.Identifier] = role
+
+        self.topology = topology
+        self.roles = roles
+        self.unknown_parents = unknown_parents
+        self._queries = {}
+        self.wql = self._query(None)[0]
+        self.build_count += 1
+
+    def _query(self, groups: Optional[AbstractSet[str]]):
+        """(WQL, número de sensores) para ``groups`` (None = todos)"""
+        key = frozenset(groups) if groups is not None else None
+        query = self._queries.get(key)
+        if query is None:
+            identifiers = [identifier for identifier, role in self.roles.items()
+                           if key is None or ROLE_GROUPS[role] in key]
+            wql = None
+            if identifiers:
+                where = " OR ".join(f"Identifier='{identifier}'" for identifier in identifiers)
+                wql = f"SELECT Identifier, Value FROM Sensor WHERE {where}"
+            query = self._queries[key] = (wql, len(identifiers))
+        return query
+
+    def invalidate(self):
+        self.topology = None
+
+    def fetch(self, lhm_client, groups: Optional[AbstractSet[str]] = None) -> Optional[Dict[str, List[float]]]:
+        """Lee los sensores seleccionados de ``groups``; None si alguno ha desaparecido"""
+        readings = {role: [] for role in ROLES}
+        wql, expected = self._query(groups)
+        if not wql:
+            return readings
+
+        rows = lhm_client.query(wql)
+        if len(rows) != expected:
+            return None
+
+        roles = self.roles
+        for row in rows:
+            readings[roles[row.Identifier]].append(row.Value)
+        return readings
+
+
+def readings_to_stats(readings: Dict[str, List[float]],
+                      groups: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+    """Convierte lecturas por rol al dict de ``get_quick_stats`` (solo los grupos pedidos)"""
+    stats = {}
+    if groups is None or LOAD in groups:
+        cpu_core_loads = readings[CPU_CORE_LOAD]
+        gpu_loads = readings[GPU_CORE_LOAD]
+        stats['cpu_usage'] = sum(cpu_core_loads) / len(cpu_core_loads) if cpu_core_loads else None
+        stats['cpu_core_loads'] = list(cpu_core_loads)
+        stats['gpu_usage'] = gpu_loads[-1] if gpu_loads else None
+
+    if groups is None or TEMPERATURE in groups:
+        cpu_temps = readings[CPU_TDIE] + readings[CPU_TCTL]
+        gpu_temps = readings[GPU_CORE_TEMP] or readings[GPU_HOTSPOT_TEMP]
+        stats['cpu_temp'] = sum(cpu_temps) / len(cpu_temps) if cpu_temps else None
+        stats['gpu_temp'] = gpu_temps[0] if gpu_temps else None
+
+    if groups is not None and MEMORY not in groups:
+        return stats
+    memory_used_gb, memory_total_gb = None, None
+
+    # MEMORIA - sensores específicos de LibreHardwareMonitor
+    if readings[MEMORY_USED] and readings[MEMORY_AVAILABLE]:
+        memory_used_gb = readings[MEMORY_USED][0]
+        memory_total_gb = memory_used_gb + readings[MEMORY_AVAILABLE][0]
+
+    # Si no pudimos obtener memoria de LibreHardwareMonitor, usar psutil como fallback
+    if memory_used_gb is None or memory_total_gb is None:
+        import psutil
+        ram_info = psutil.virtual_memory()
+        memory_used_gb = ram_info.used / (1024**3)
+        memory_total_gb = ram_info.total / (1024**3)
+
+    stats['ram_used_gb'] = memory_used_gb
+    stats['ram_total_gb'] = memory_total_gb
+    stats['ram_usage'] = (memory_used_gb / memory_total_gb * 100) if memory_total_gb > 0 else 0
+    return stats
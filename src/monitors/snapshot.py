@@ -0,0 +1,49 @@
+# src/monitors/snapshot.py - Muestra publicada por HardwareMonitor: inmutable, se lee sin bloqueo
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional
+
+
+class Snapshot:
+    """Muestra completa ya combinada, publicada de una sola vez.
+
+    El monitor crea un ``Snapshot`` nuevo por muestra y lo publica
+    reasignando un atributo (operación atómica), así los lectores nunca
+    toman un lock ni copian: el objeto que obtienen no cambia después.
+    ``values`` es una vista de solo lectura del dict interno; los valores
+    anidados (``cpu_core_loads``, ``sampled_at``) tampoco se modifican
+    una vez publicados. ``seq`` crece con cada publicación: un lector que
+    recuerde el último ``seq`` sabe si hay datos nuevos sin comparar nada.
+    """
+
+    __slots__ = ('seq', 'published_at', 'values')
+
+    def __init__(self, seq: int, values: Dict[str, Any], published_at: Optional[float] = None):
+        object.__setattr__(self, 'seq', seq)
+        object.__setattr__(self, 'published_at', time.time() if published_at is None else published_at)
+        object.__setattr__(self, 'values', MappingProxyType(values))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Snapshot es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Snapshot es inmutable")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.values[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"Snapshot(seq={self.seq}, {dict(self.values)!r})"
+
@@ -0,0 +1,77 @@
+# src/monitors/topology.py - Caché de la topología de hardware de LibreHardwareMonitor
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class HardwareTopology:
+    """Identificadores de hardware resueltos en una enumeración"""
+
+    def __init__(self, hardware: Dict[str, str], discovered_at: float):
+        self.hardware = hardware  # Identifier -> HardwareType
+        self.discovered_at = discovered_at
+        self.cpu_identifier = None
+        self.nvidia_gpu_id = None
+        self.amd_gpu_id = None
+
+        for identifier, hw_type in hardware.items():
+            hw_type_lower = hw_type.lower()
+            if 'cpu' in hw_type_lower:
+                self.cpu_identifier = identifier
+            elif 'gpunvidia' in hw_type_lower:
+                self.nvidia_gpu_id = identifier
+            elif 'gpuamd' in hw_type_lower:
+                self.amd_gpu_id = identifier
+
+    @property
+    def gpu_identifier(self) -> Optional[str]:
+        # Prioridad NVIDIA > AMD
+        return self.nvidia_gpu_id or self.amd_gpu_id
+
+    def knows(self, identifier: str) -> bool:
+        return identifier in self.hardware
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'cpu_identifier': self.cpu_identifier,
+            'gpu_identifier': self.gpu_identifier,
+            'nvidia_gpu_id': self.nvidia_gpu_id,
+            'amd_gpu_id': self.amd_gpu_id,
+            'hardware': dict(self.hardware),
+            'discovered_at': self.discovered_at,
+        }
+
+
+class TopologyCache:
+    """Resuelve la topología una vez y la mantiene hasta que algo la invalide.
+
+    Se invalida al cambiar de conexión (``connection_id`` distinto), al
+    vencer el TTL o explícitamente con ``invalidate`` (p.ej. cuando una
+    consulta de sensores devuelve un ``Parent`` desconocido).
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._topology = None
+        self._connection_id = None
+        self.refresh_count = 0
+
+    @property
+    def topology(self) -> Optional[HardwareTopology]:
+        return self._topology
+
+    def get(self, lhm_client, connection_id: Any = None) -> HardwareTopology:
+        """Devuelve la topología cacheada o la vuelve a enumerar"""
+        now = self._clock()
+        topology = self._topology
+        if (topology is None or connection_id != self._connection_id
+                or (self.ttl is not None and now - topology.discovered_at >= self.ttl)):
+            hardware = {hw.Identifier: hw.HardwareType for hw in lhm_client.Hardware()}
+            topology = HardwareTopology(hardware, now)
+            self._topology = topology
+            self._connection_id = connection_id
+            self.refresh_count += 1
+        return topology
+
+    def invalidate(self):
+        self._topology = None
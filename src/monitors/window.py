@@ -0,0 +1,118 @@
+# src/monitors/window.py - Agregados de ventana deslizante por tiempo
+import math
+from array import array
+from collections import deque
+from typing import List, Optional, Tuple
+
+
+class TimeWindow:
+    """Ventana deslizante por tiempo sobre un ring buffer de ``array``.
+
+    Mantiene suma, mínimo y máximo de las muestras de los últimos
+    ``seconds`` segundos en O(1) amortizado por muestra, más una EWMA
+    con constante de tiempo ``tau`` (por defecto la longitud de la
+    ventana), de modo que el suavizado no depende del intervalo de sondeo.
+    """
+
+    def __init__(self, seconds: float, capacity: int = 256, tau: Optional[float] = None):
+        self.seconds = seconds
+        self.capacity = capacity
+        self.tau = tau if tau is not None else seconds
+
+        self._values = array('d', bytes(8 * capacity))
+        self._times = array('d', bytes(8 * capacity))
+        self._start = 0    # Índice de la muestra más antigua
+        self._count = 0
+        self._seq = 0      # Número de muestras añadidas en total
+        self._sum = 0.0
+
+        # Colas monótonas de (seq, valor) para min/max
+        self._min = deque()
+        self._max = deque()
+
+        self._ewma = None
+        self._last_time = None
+
+    def add(self, value: float, now: float):
+        """Añade una muestra tomada en ``now`` (segundos, reloj monótono)"""
+        self.expire(now)
+        if self._count == self.capacity:
+            self._pop_oldest()
+
+        index = (self._start + self._count) % self.capacity
+        self._values[index] = value
+        self._times[index] = now
+        self._count += 1
+        self._sum += value
+
+        seq = self._seq
+        self._seq += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+        if self._ewma is None:
+            self._ewma = value
+        else:
+            alpha = 1.0 - math.exp(-(now - self._last_time) / self.tau) if self.tau > 0 else 1.0
+            self._ewma += alpha * (value - self._ewma)
+        self._last_time = now
+
+    def expire(self, now: float):
+        """Descarta las muestras más viejas que la ventana"""
+        cutoff = now - self.seconds
+        while self._count and self._times[self._start] <= cutoff:
+            self._pop_oldest()
+
+    def _pop_oldest(self):
+        self._sum -= self._values[self._start]
+        self._start = (self._start + 1) % self.capacity
+        self._count -= 1
+
+        oldest_seq = self._seq - self._count
+        if self._min and self._min[0][0] < oldest_seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] < oldest_seq:
+            self._max.popleft()
+        if not self._count:
+            self._sum = 0.0  # Evita arrastrar error de redondeo
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def mean(self) -> Optional[float]:
+        return self._sum / self._count if self._count else None
+
+    def min(self) -> Optional[float]:
+        return self._min[0][1] if self._count else None
+
+    def max(self) -> Optional[float]:
+        return self._max[0][1] if self._count else None
+
+    def ewma(self) -> Optional[float]:
+        return self._ewma
+
+    def last(self) -> Optional[float]:
+        if not self._count:
+            return None
+        return self._values[(self._start + self._count - 1) % self.capacity]
+
+    def since(self, seq: int) -> Tuple[List[float], int]:
+        """Muestras añadidas desde ``seq`` que siguen en el buffer y el ``seq`` siguiente.
+
+        La muestra número ``n`` vive siempre en ``n % capacity``, así que se
+        puede leer sin bloqueo desde otro hilo; las que ya expiraron no se
+        devuelven (``siguiente - seq - len(valores)`` = perdidas).
+        """
+        current, count = self._seq, self._count
+        start = max(seq, current - count)
+        values, capacity = self._values, self.capacity
+        return [values[n % capacity] for n in range(start, current)], current
@@ -0,0 +1,88 @@
+# src/monitors/wmi_session.py - Sesión WMI persistente para LibreHardwareMonitor
+import time
+from typing import Any, Callable
+
+LHM_NAMESPACE = "root\\LibreHardwareMonitor"
+
+
+class WMISession:
+    """Mantiene una conexión WMI viva entre ticks del hilo de monitoreo.
+
+    COM se inicializa una sola vez por hilo (``open``/``close`` deben llamarse
+    desde el hilo que consulta). Si una consulta falla se llama a
+    ``invalidate`` y la reconexión se reintenta con backoff exponencial.
+    """
+
+    def __init__(self, namespace: str = LHM_NAMESPACE, wmi_module: Any = None,
+                 com_module: Any = None, initial_backoff: float = 1.0,
+                 max_backoff: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        if wmi_module is None or com_module is None:
+            import pythoncom
+            import wmi
+            wmi_module = wmi_module or wmi
+            com_module = com_module or pythoncom
+
+        self.namespace = namespace
+        self._wmi = wmi_module
+        self._com = com_module
+        self._clock = clock
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self._client = None
+        self._com_initialized = False
+        self._backoff = 0.0
+        self._next_attempt = 0.0
+
+        self.connect_count = 0
+        self.failure_count = 0
+
+    def open(self):
+        """Inicializa COM en el hilo actual"""
+        if not self._com_initialized:
+            self._com.CoInitialize()
+            self._com_initialized = True
+
+    def close(self):
+        """Libera la conexión y desinicializa COM"""
+        self._client = None
+        if self._com_initialized:
+            self._com_initialized = False
+            self._com.CoUninitialize()
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    def client(self):
+        """Devuelve la conexión activa, reconectando si hace falta"""
+        if self._client is not None:
+            return self._client
+
+        now = self._clock()
+        if now < self._next_attempt:
+            raise ConnectionError("Reconexión WMI en espera (backoff)")
+
+        self.open()
+        try:
+            self._client = self._wmi.WMI(namespace=self.namespace)
+        except Exception:
+            self._schedule_retry(now)
+            raise ConnectionError("No se pudo conectar a LibreHardwareMonitor")
+
+        self.connect_count += 1
+        self._backoff = 0.0
+        return self._client
+
+    def invalidate(self):
+        """Marca la conexión como muerta (p.ej. LHM reiniciado)"""
+        self._client = None
+        self._schedule_retry(self._clock())
+
+    def _schedule_retry(self, now: float):
+        self.failure_count += 1
+        if self._backoff:
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+        else:
+            self._backoff = self.initial_backoff
+        self._next_attempt = now + self._backoff
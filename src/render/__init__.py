@@ -0,0 +1,6 @@
+# src/render - Composición de frames para el OLED
+from .templates import DISK_TEMPLATE, HARDWARE_TEMPLATE, FrameTemplate, load_template
+from .text import disk_display_values, disk_frame, disk_values, display_values, hardware_frame
+
+__all__ = ['display_values', 'hardware_frame', 'disk_frame', 'disk_values', 'disk_display_values',
+           'FrameTemplate', 'load_template', 'HARDWARE_TEMPLATE', 'DISK_TEMPLATE']
@@ -0,0 +1,207 @@
+# src/render/bitmap.py - Frames de mapa de bits (image-data) para el OLED con atlas de glifos
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BITMAP_EVENT = "BITMAP"
+DEFAULT_SIZE = (128, 40)  # Arctis Nova Pro / Apex: 128x40
+
+GLYPH_WIDTH, GLYPH_HEIGHT = 5, 7
+CELL_WIDTH, CELL_HEIGHT = GLYPH_WIDTH + 1, GLYPH_HEIGHT + 1  # Con separación
+
+# Fuente 5x7 clásica: 5 columnas por carácter, bit 0 = fila superior
+FONT_5X7 = {
+    ' ': (0x00, 0x00, 0x00, 0x00, 0x00), '!': (0x00, 0x00, 0x5F, 0x00, 0x00),
+    '%': (0x23, 0x13, 0x08, 0x64, 0x62), '-': (0x08, 0x08, 0x08, 0x08, 0x08),
+    '.': (0x00, 0x60, 0x60, 0x00, 0x00), '/': (0x20, 0x10, 0x08, 0x04, 0x02),
+    ':': (0x00, 0x36, 0x36, 0x00, 0x00), '>': (0x00, 0x41, 0x22, 0x14, 0x08),
+    '?': (0x02, 0x01, 0x51, 0x09, 0x06), '°': (0x00, 0x06, 0x09, 0x09, 0x06),
+    '0': (0x3E, 0x51, 0x49, 0x45, 0x3E), '1': (0x00, 0x42, 0x7F, 0x40, 0x00),
+    '2': (0x42, 0x61, 0x51, 0x49, 0x46), '3': (0x21, 0x41, 0x45, 0x4B, 0x31),
+    '4': (0x18, 0x14, 0x12, 0x7F, 0x10), '5': (0x27, 0x45, 0x45, 0x45, 0x39),
+    '6': (0x3C, 0x4A, 0x49, 0x49, 0x30), '7': (0x01, 0x71, 0x09, 0x05, 0x03),
+    '8': (0x36, 0x49, 0x49, 0x49, 0x36), '9': (0x06, 0x49, 0x49, 0x29, 0x1E),
+    'A': (0x7E, 0x11, 0x11, 0x11, 0x7E), 'B': (0x7F, 0x49, 0x49, 0x49, 0x36),
+    'C': (0x3E, 0x41, 0x41, 0x41, 0x22), 'D': (0x7F, 0x41, 0x41, 0x22, 0x1C),
+    'E': (0x7F, 0x49, 0x49, 0x49, 0x41), 'F': (0x7F, 0x09, 0x09, 0x09, 0x01),
+    'G': (0x3E, 0x41, 0x49, 0x49, 0x7A), 'H': (0x7F, 0x08, 0x08, 0x08, 0x7F),
+    'I': (0x00, 0x41, 0x7F, 0x41, 0x00), 'J': (0x20, 0x40, 0x41, 0x3F, 0x01),
+    'K': (0x7F, 0x08, 0x14, 0x22, 0x41), 'L': (0x7F, 0x40, 0x40, 0x40, 0x40),
+    'M': (0x7F, 0x02, 0x0C, 0x02, 0x7F), 'N': (0x7F, 0x04, 0x08, 0x10, 0x7F),
+    'O': (0x3E, 0x41, 0x41, 0x41, 0x3E), 'P': (0x7F, 0x09, 0x09, 0x09, 0x06),
+    'Q': (0x3E, 0x41, 0x51, 0x21, 0x5E), 'R': (0x7F, 0x09, 0x19, 0x29, 0x46),
+    'S': (0x46, 0x49, 0x49, 0x49, 0x31), 'T': (0x01, 0x01, 0x7F, 0x01, 0x01),
+    'U': (0x3F, 0x40, 0x40, 0x40, 0x3F), 'V': (0x1F, 0x20, 0x40, 0x20, 0x1F),
+    'W': (0x3F, 0x40, 0x38, 0x40, 0x3F), 'X': (0x63, 0x14, 0x08, 0x14, 0x63),
+    'Y': (0x07, 0x08, 0x70, 0x08, 0x07), 'Z': (0x61, 0x51, 0x49, 0x45, 0x43),
+    # Iconos con los mismos caracteres que usan los frames de texto
+    '⇾': (0x08, 0x08, 0x3E, 0x1C, 0x08), '🌡': (0x00, 0x70, 0x7F, 0x70, 0x00),
+}
+
+
+class GlyphAtlas:
+    """Glifos rasterizados una vez en un array ``(n, CELL_HEIGHT, CELL_WIDTH)``.
+
+    ``indices(texto)`` se cachea por cadena, así los textos que se repiten
+    (etiquetas) no se vuelven a traducir, y ``strip`` compone una línea con
+    una indexación y un reshape.
+    """
+
+    def __init__(self, font: Dict[str, tuple] = FONT_5X7):
+        chars = sorted(font)
+        self.index = {char: i for i, char in enumerate(chars)}
+        self.glyphs = np.zeros((len(chars), CELL_HEIGHT, CELL_WIDTH), dtype=np.uint8)
+        for char, columns in font.items():
+            for x, bits in enumerate(columns):
+                for y in range(CELL_HEIGHT):
+                    if bits >> y & 1:
+                        self.glyphs[self.index[char], y, x] = 1
+        self._unknown = self.index['?']
+        self._cache = {}  # texto -> array de índices
+
+    def indices(self, text: str):
+        cached = self._cache.get(text)
+        if cached is None:
+            get, unknown = self.index.get, self._unknown
+            cached = np.array([get(char, get(char.upper(), unknown)) for char in text], dtype=np.intp)
+            if len(self._cache) < 4096:
+                self._cache[text] = cached
+        return cached
+
+    def strip(self, text: str):
+        """Texto como array ``(CELL_HEIGHT, len * CELL_WIDTH)``"""
+        glyphs = self.glyphs[self.indices(text)]
+        return glyphs.transpose(1, 0, 2).reshape(CELL_HEIGHT, -1)
+
+
+_ATLAS = None
+
+
+def default_atlas() -> GlyphAtlas:
+    global _ATLAS
+    if _ATLAS is None:
+        _ATLAS = GlyphAtlas()
+    return _ATLAS
+
+
+class BitmapCanvas:
+    """Lienzo monocromo (una fila de ``uint8`` 0/1 por píxel) con empaquetado incremental.
+
+    ``encode`` compara el lienzo con el del último frame codificado y solo
+    vuelve a empaquetar (``np.packbits``) las filas que cambiaron; si no
+    cambió ninguna devuelve ``None`` para que no se reenvíe nada.
+    """
+
+    def __init__(self, width: int = DEFAULT_SIZE[0], height: int = DEFAULT_SIZE[1],
+                 atlas: Optional[GlyphAtlas] = None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("El modo bitmap requiere numpy (pip install numpy)")
+        if width % 8:
+            raise ValueError("El ancho debe ser múltiplo de 8")
+        self.width = width
+        self.height = height
+        self.atlas = atlas or default_atlas()
+        self.pixels = np.zeros((height, width), dtype=np.uint8)
+        self._previous = np.zeros_like(self.pixels)
+        self._packed = np.zeros((height, width // 8), dtype=np.uint8)
+        self._payload = None
+
+        self.encoded = 0
+        self.unchanged = 0
+        self.rows_packed = 0
+
+    @property
+    def key(self) -> str:
+        """Clave del frame GameSense para este tamaño (``image-data-128x40``)"""
+        return f"image-data-{self.width}x{self.height}"
+
+    def clear(self):
+        self.pixels.fill(0)
+
+    def text(self, x: int, y: int, text: str) -> int:
+        """Dibuja ``text`` con su esquina superior izquierda en (x, y); devuelve el x final"""
+        strip = self.atlas.strip(text)
+        height = min(CELL_HEIGHT, self.height - y)
+        width = min(strip.shape[1], self.width - x)
+        if height > 0 and width > 0:
+            self.pixels[y:y + height, x:x + width] |= strip[:height, :width]
+        return x + strip.shape[1]
+
+    def fill(self, x: int, y: int, width: int, height: int, value: int = 1):
+        self.pixels[y:y + height, x:x + width] = value
+
+    def frame_rect(self, x: int, y: int, width: int, height: int):
+        """Rectángulo de 1 píxel de borde"""
+        pixels = self.pixels
+        pixels[y, x:x + width] = 1
+        pixels[y + height - 1, x:x + width] = 1
+        pixels[y:y + height, x] = 1
+        pixels[y:y + height, x + width - 1] = 1
+
+    def bar(self, x: int, y: int, width: int, height: int, fraction: float):
+        """Barra horizontal con borde, rellena según ``fraction`` (0..1)"""
+        self.fill(x, y, width, height, 0)
+        self.frame_rect(x, y, width, height)
+        filled = int(round(max(0.0, min(1.0, fraction)) * (width - 2)))
+        if filled:
+            self.fill(x + 1, y + 1, filled, height - 2)
+
+    def blit(self, x: int, y: int, image):
+        """Copia un array 0/1 (icono, widget) en (x, y), recortado al lienzo"""
+        height = min(image.shape[0], self.height - y)
+        width = min(image.shape[1], self.width - x)
+        self.pixels[y:y + height, x:x + width] = image[:height, :width]
+
+    def encode(self) -> Optional[List[int]]:
+        """Bytes ``image-data`` (filas, MSB = píxel izquierdo); None si nada cambió"""
+        dirty = np.flatnonzero((self.pixels != self._previous).any(axis=1))
+        if self._payload is not None and not len(dirty):
+            self.unchanged += 1
+            return None
+        if self._payload is None:
+            dirty = np.arange(self.height)
+        self._packed[dirty] = np.packbits(self.pixels[dirty], axis=1)
+        self._previous[dirty] = self.pixels[dirty]
+        self._payload = self._packed.ravel().tolist()
+        self.encoded += 1
+        self.rows_packed += len(dirty)
+        return self._payload
+
+    def frame(self) -> Dict[str, Any]:
+        """Frame GameSense con el último bitmap codificado (sin recodificar)"""
+        payload = self.encode()
+        if payload is None:
+            payload = self._payload
+        return {self.key: payload}
+
+
+def hardware_bitmap(canvas: BitmapCanvas, cpu_usage, cpu_temp, gpu_usage, gpu_temp,
+                    ram_used_gb, ram_total_gb, ram_percent=0, **_) -> BitmapCanvas:
+    """Modo hardware en bitmap: etiqueta, valores y barra de uso por fila"""
+    canvas.clear()
+    bar_x = 84
+    bar_width = canvas.width - bar_x
+    rows = (
+        ("CPU", f"{cpu_usage:>3}% {cpu_temp:>2}°", cpu_usage),
+        ("GPU", f"{gpu_usage:>3}% {gpu_temp:>2}°", gpu_usage),
+        ("RAM", f"{ram_used_gb:4.1f}/{ram_total_gb:.0f}G", ram_percent),
+    )
+    pitch = canvas.height // len(rows)
+    for i, (label, text, percent) in enumerate(rows):
+        y = i * pitch + (pitch - CELL_HEIGHT) // 2 + 1
+        x = canvas.text(0, y, label)
+        canvas.text(x + 2, y, text)
+        canvas.bar(bar_x, y - 1, bar_width, GLYPH_HEIGHT + 2, (percent or 0) / 100.0)
+    return canvas
+
+
+def bitmap_handler(width: int = DEFAULT_SIZE[0], height: int = DEFAULT_SIZE[1]) -> Dict[str, Any]:
+    """Handler de ``bind_game_event`` para frames ``image-data`` dinámicos"""
+    return {
+        "device-type": f"screened-{width}x{height}", "zone": "one", "mode": "screen",
+        "datas": [{"has-text": False, "image-data": [0] * (width * height // 8)}],
+    }
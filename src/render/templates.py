@@ -0,0 +1,151 @@
+# src/render/templates.py - Plantillas de las 3 líneas del OLED compiladas una sola vez
+import operator
+import re
+import string
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+
+LINE_KEYS = ('line1', 'line2', 'line3')
+
+# Misma sintaxis que str.format: {campo[!conversión][:formato]}
+HARDWARE_LAYOUT = (
+    "CPU ⇾ {cpu_usage:>2}%🌡{cpu_temp:>2}°C",
+    "GPU ⇾ {gpu_usage:>2}%🌡{gpu_temp:>2}°C",
+    "RAM ⇾ {ram_used_gb:.1f}/{ram_total_gb:.0f}GB",
+)
+# Campo de la plantilla -> métrica de get_quick_stats de la que sale (ver display_values)
+HARDWARE_FIELD_METRICS = {
+    'cpu_usage': 'cpu_usage', 'cpu_temp': 'cpu_temp',
+    'gpu_usage': 'gpu_usage', 'gpu_temp': 'gpu_temp',
+    'ram_used_gb': 'ram_used_gb', 'ram_total_gb': 'ram_total_gb', 'ram_percent': 'ram_usage',
+}
+HARDWARE_FIELDS = tuple(HARDWARE_FIELD_METRICS)
+# Valores con los tipos de display_values para probar la plantilla al cargarla
+HARDWARE_SAMPLE = {'cpu_usage': 0, 'cpu_temp': 0, 'gpu_usage': 0, 'gpu_temp': 0,
+                   'ram_used_gb': 0.0, 'ram_total_gb': 16.0, 'ram_percent': 0.0}
+
+DISK_LAYOUT = (
+    "DISK {path} {usage_percent:.0f}%",
+    "Used: {used_gb:.0f}GB",
+    "Free: {free_gb:.0f}GB",
+)
+DISK_FIELD_METRICS = {
+    'path': 'disk_path', 'usage_percent': 'disk_usage',
+    'used_gb': 'disk_used_gb', 'free_gb': 'disk_free_gb', 'total_gb': 'disk_total_gb',
+}
+DISK_FIELDS = tuple(DISK_FIELD_METRICS)
+DISK_SAMPLE = {'path': 'C:', 'usage_percent': 0.0, 'used_gb': 0.0, 'free_gb': 0.0, 'total_gb': 0.0}
+
+# Mini-lenguaje de formato de str.format (sin comillas ni barras: va dentro de un f-string)
+_SPEC = re.compile(r'[<>=^+\- #0-9,_.a-zA-Z%]*')
+
+
+class FrameTemplate:
+    """Plantilla de líneas compilada a funciones con un f-string.
+
+    El texto se analiza una vez con ``string.Formatter().parse`` y cada
+    línea se compila a ``lambda _0, _1...: f'...'`` más un ``itemgetter``
+    de sus campos, así ``render`` no vuelve a interpretar la plantilla ni
+    paga ``str.format``. Los nombres de campo no llegan al código generado
+    (se pasan por posición) y los formatos solo admiten los caracteres del
+    mini-lenguaje de ``format``. Si los valores de una línea no cambiaron
+    desde el último ``render`` se reutiliza el texto anterior. Los campos
+    se validan al compilar (``fields``) y, con ``sample``, cada línea se
+    formatea una vez con valores de ejemplo (``{path:.0f}`` o ``{cpu_usage:zz}``
+    fallan aquí), para que un error en la plantilla se vea al arrancar y
+    no en cada tick.
+    """
+
+    def __init__(self, lines: Sequence[str], fields: Optional[Iterable[str]] = None,
+                 keys: Sequence[str] = LINE_KEYS, sample: Optional[Mapping[str, Any]] = None):
+        if len(lines) > len(keys):
+            raise ValueError(f"La plantilla tiene {len(lines)} líneas; máximo {len(keys)}")
+        allowed = set(fields) if fields is not None else None
+        lines = list(lines) + [""] * (len(keys) - len(lines))
+        self.source = tuple(lines)
+        self.fields = set()
+        self._lines = [self._compile(key, line, allowed) for key, line in zip(keys, lines)]
+        self._cache = [None] * len(self._lines)  # (valores, texto) por línea
+        if sample is not None:
+            self._try(sample)
+
+    def _compile(self, key: str, line: str, allowed):
+        names = []  # Campos usados en la línea
+        parts = []
+        try:
+            parsed = list(string.Formatter().parse(line))
+        except ValueError as e:
+            raise ValueError(f"{key}: {e}") from None
+        for literal, field, spec, conversion in parsed:
+            parts.append(literal.replace('{', '{{').replace('}', '}}'))
+            if field is None:
+                continue
+            if not field.isidentifier():
+                raise ValueError(f"{key}: campo no válido {{{field}}}")
+            if allowed is not None and field not in allowed:
+                raise ValueError(f"{key}: campo desconocido {{{field}}} (disponibles: {', '.join(sorted(allowed))})")
+            if spec and '{' in spec:
+                raise ValueError(f"{key}: formatos anidados no soportados en {{{field}}}")
+            if not _SPEC.fullmatch(spec or '') or conversion not in (None, 'r', 's', 'a'):
+                raise ValueError(f"{key}: formato no válido en {{{field}}}")
+            if field not in names:
+                names.append(field)
+            parts.append('{_%d%s%s}' % (names.index(field), '!' + conversion if conversion else '',
+                                        ':' + spec if spec else ''))
+        self.fields.update(names)
+
+        body = ''.join(parts)
+        if not names:
+            return key, None, None, body.format()
+        if len(names) == 1:
+            name = names[0]
+            getter = lambda values: (values[name],)  # noqa: E731 - itemgetter de uno no da tupla
+        else:
+            getter = operator.itemgetter(*names)
+        arguments = ', '.join(f'_{i}' for i in range(len(names)))
+        format_line = eval(compile(f"lambda {arguments}: f{body!r}", f"<{key}>", 'eval'), {})
+        return key, getter, format_line, None
+
+    def _try(self, sample: Mapping[str, Any]):
+        """Formatea cada línea con ``sample`` sin tocar la caché; ValueError si alguna falla"""
+        for key, getter, format_line, _ in self._lines:
+            if getter is None:
+                continue
+            try:
+                format_line(*getter(sample))
+            except (ValueError, TypeError, KeyError) as e:
+                raise ValueError(f"{key}: formato no aplicable a los valores ({e})") from None
+
+    def render(self, values: Dict[str, Any]) -> Dict[str, str]:
+        """Frame ``{line1: ..., line2: ..., line3: ...}`` con ``values``"""
+        frame = {}
+        cache = self._cache
+        for i, (key, getter, format_line, constant) in enumerate(self._lines):
+            if getter is None:
+                frame[key] = constant
+                continue
+            args = getter(values)
+            cached = cache[i]
+            if cached is not None and cached[0] == args:
+                frame[key] = cached[1]
+            else:
+                text = format_line(*args)
+                cache[i] = (args, text)
+                frame[key] = text
+        return frame
+
+    def __call__(self, **values) -> Dict[str, str]:
+        return self.render(values)
+
+
+def load_template(path: str, fields: Optional[Iterable[str]] = None,
+                  sample: Optional[Mapping[str, Any]] = None) -> FrameTemplate:
+    """Plantilla desde un fichero de texto: una línea del OLED por línea (máx. 3)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return FrameTemplate(lines, fields, sample=sample)
+
+
+HARDWARE_TEMPLATE = FrameTemplate(HARDWARE_LAYOUT, HARDWARE_FIELDS, sample=HARDWARE_SAMPLE)
+DISK_TEMPLATE = FrameTemplate(DISK_LAYOUT, DISK_FIELDS, sample=DISK_SAMPLE)
@@ -0,0 +1,59 @@
+# src/render/text.py - Frames de texto (3 líneas) para el OLED
+from typing import Any, Dict, Optional
+
+from .templates import DISK_TEMPLATE, HARDWARE_TEMPLATE, FrameTemplate
+
+
+def display_values(hw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convierte ``get_quick_stats`` a los valores que se muestran"""
+    return {
+        'cpu_usage': int(hw.get('cpu_usage', 0) or 0),
+        'cpu_temp': int(hw.get('cpu_temp', 0) or 0) if hw.get('cpu_temp') else 0,
+        'gpu_usage': int(hw.get('gpu_usage', 0) or 0),
+        'gpu_temp': int(hw.get('gpu_temp', 0) or 0) if hw.get('gpu_temp') else 0,
+        # RAM desde LibreHardwareMonitor
+        'ram_used_gb': hw.get('ram_used_gb', 0) or 0,
+        'ram_total_gb': hw.get('ram_total_gb', 0) or 16,
+        'ram_percent': hw.get('ram_usage', 0) or 0,
+    }
+
+
+def hardware_frame(cpu_usage, cpu_temp, gpu_usage, gpu_temp, ram_used_gb, ram_total_gb,
+                   ram_percent=0, template: Optional[FrameTemplate] = None, **_) -> Dict[str, str]:
+    """Frame del modo hardware (plantilla ``HARDWARE_LAYOUT`` salvo otra compilada)"""
+    return (template or HARDWARE_TEMPLATE).render({
+        'cpu_usage': cpu_usage, 'cpu_temp': cpu_temp, 'gpu_usage': gpu_usage, 'gpu_temp': gpu_temp,
+        'ram_used_gb': ram_used_gb, 'ram_total_gb': ram_total_gb, 'ram_percent': ram_percent,
+    })
+
+
+def disk_values(path: str = 'C:') -> Dict[str, Any]:
+    """Uso del disco ``path`` con los campos de ``DISK_FIELDS``"""
+    import psutil
+
+    disk = psutil.disk_usage(path)
+    return {
+        'path': path,
+        'usage_percent': (disk.used / disk.total) * 100,
+        'used_gb': disk.used / (1024**3),
+        'free_gb': disk.free / (1024**3),
+        'total_gb': disk.total / (1024**3),
+    }
+
+
+def disk_display_values(hw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Campos de ``DISK_FIELDS`` desde el grupo ``disk`` del monitor (None si aún no se leyó)"""
+    if hw.get('disk_usage') is None:
+        return None
+    return {
+        'path': hw['disk_path'],
+        'usage_percent': hw['disk_usage'],
+        'used_gb': hw['disk_used_gb'],
+        'free_gb': hw['disk_free_gb'],
+        'total_gb': hw['disk_total_gb'],
+    }
+
+
+def disk_frame(path: str = 'C:', template: Optional[FrameTemplate] = None) -> Dict[str, str]:
+    """Frame del modo disco (disco principal)"""
+    return (template or DISK_TEMPLATE).render(disk_values(path))
@@ -0,0 +1,117 @@
+# src/render/widgets.py - Sparklines y gráficos de barras sobre las ventanas de muestras del monitor
+import abc
+from typing import Optional
+
+from .bitmap import CELL_HEIGHT, BitmapCanvas
+
+try:
+    import numpy as np
+except ImportError:
+    pass  # Sin numpy no hay modo bitmap (ver ``bitmap.NUMPY_AVAILABLE``)
+
+
+class ColumnGraph(abc.ABC):
+    """Gráfico de una columna por muestra que se desplaza a la izquierda.
+
+    Lee las muestras nuevas directamente del ``TimeWindow`` del monitor
+    (``since(seq)``), desplaza la imagen tantas columnas como muestras
+    llegaron y dibuja solo esas columnas a la derecha: el coste por tick
+    depende de las muestras nuevas y del tamaño del widget, nunca de la
+    longitud del historial. Las muestras que expiraron antes de leerse
+    quedan como columnas vacías para conservar la escala de tiempo. Las
+    subclases deciden cómo se pinta cada columna (``_columns``).
+    """
+
+    def __init__(self, window, width: int, height: int, low: float = 0.0, high: float = 100.0):
+        self.window = window
+        self.width = width
+        self.height = height
+        self.low = low
+        self.high = high
+        self.image = np.zeros((height, width), dtype=np.uint8)
+        self._rows = np.arange(height)[:, None]  # Para dibujar columnas de golpe
+        self._seq = window.seq - window.count  # La primera actualización dibuja lo que ya hay
+        self._last_y = None
+
+        self.columns_drawn = 0
+        self.missed = 0
+
+    def _y(self, values):
+        """Fila de cada valor (0 = arriba), recortada al rango [low, high]"""
+        span = (self.high - self.low) or 1.0
+        scaled = (np.asarray(values, dtype=np.float64) - self.low) / span
+        return ((1.0 - np.clip(scaled, 0.0, 1.0)) * (self.height - 1)).round().astype(np.intp)
+
+    @abc.abstractmethod
+    def _columns(self, ys, previous: Optional[int]):
+        """Píxeles ``(height, len(ys))`` de las columnas nuevas (``previous``: fila de la anterior)"""
+
+    def update(self) -> int:
+        """Añade las muestras nuevas; devuelve cuántas columnas se desplazó"""
+        values, seq = self.window.since(self._seq)
+        shift = min(seq - self._seq, self.width)
+        self.missed += max(0, seq - self._seq - len(values))
+        self._seq = seq
+        if shift <= 0:
+            return 0
+
+        image = self.image
+        image[:, :-shift] = image[:, shift:]
+        image[:, -shift:] = 0
+        values = values[-shift:]
+        if values:
+            ys = self._y(values)
+            gap = shift - len(values)  # Columnas de muestras perdidas (quedan vacías)
+            image[:, self.width - len(values):] = self._columns(ys, None if gap else self._last_y)
+            self._last_y = int(ys[-1])
+        else:
+            self._last_y = None
+        self.columns_drawn += shift
+        return shift
+
+    def draw(self, canvas: BitmapCanvas, x: int, y: int):
+        canvas.blit(x, y, self.image)
+
+
+class Sparkline(ColumnGraph):
+    """Línea continua: cada columna une su valor con el de la anterior"""
+
+    def _columns(self, ys, previous: Optional[int]):
+        before = np.empty_like(ys)
+        before[1:] = ys[:-1]
+        before[0] = ys[0] if previous is None else previous
+        top = np.minimum(ys, before)
+        bottom = np.maximum(ys, before)
+        rows = self._rows
+        return ((rows >= top) & (rows <= bottom)).astype(np.uint8)
+
+
+class BarGraph(ColumnGraph):
+    """Barras verticales rellenas desde abajo"""
+
+    def _columns(self, ys, previous: Optional[int]):
+        return (self._rows >= ys).astype(np.uint8)
+
+
+def graph_bitmap(canvas: BitmapCanvas, graphs, cpu_usage, gpu_usage, **_) -> BitmapCanvas:
+    """Modo gráfico: CPU y GPU con su valor actual y su historial en sparkline.
+
+    ``graphs`` es ``{'cpu_usage': ColumnGraph, 'gpu_usage': ColumnGraph}``;
+    los gráficos se actualizan aquí y solo se copian al lienzo.
+    """
+    canvas.clear()
+    rows = (("CPU", cpu_usage, graphs['cpu_usage']), ("GPU", gpu_usage, graphs['gpu_usage']))
+    pitch = canvas.height // len(rows)
+    for i, (label, usage, graph) in enumerate(rows):
+        y = i * pitch
+        canvas.text(0, y + (pitch - 2 * CELL_HEIGHT) // 2, label)
+        canvas.text(0, y + pitch // 2, f"{usage:>3}%")
+        graph.update()
+        graph.draw(canvas, canvas.width - graph.width, y + (pitch - graph.height) // 2)
+    return canvas
+
+
+def usage_graphs(monitor, width: int = 96, height: int = 18, kind=Sparkline):
+    """Gráficos de CPU y GPU sobre las ventanas de ``HardwareMonitor``"""
+    return {metric: kind(monitor.get_window(metric), width, height)
+            for metric in ('cpu_usage', 'gpu_usage')}
@@ -0,0 +1,135 @@
+# src/scheduler.py - Planificador por plazos con despertar inmediato
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+
+class _Job:
+    def __init__(self, name: str, period: float, callback: Callable[[], None], enabled: bool):
+        self.name = name
+        self.period = period
+        self.callback = callback
+        self.enabled = enabled
+        self.deadline = None
+        self.generation = 0  # Invalida entradas viejas del heap
+
+
+class Scheduler:
+    """Heap de plazos sobre reloj monótono más un evento de despertar.
+
+    Cada trabajo se ejecuta cada ``period`` segundos sin acumular deriva;
+    entre plazos el hilo duerme exactamente hasta el siguiente. ``run_now``
+    y ``set_enabled`` pueden llamarse desde otros hilos (p.ej. hotkeys)
+    y despiertan el bucle al momento.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 wait: Optional[Callable[[Optional[float]], None]] = None,
+                 max_wait: Optional[float] = None):
+        self._clock = clock
+        self._wake = threading.Event()
+        self._wait = wait or self._wait_event
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._heap = []
+        self._jobs = {}  # nombre -> _Job
+        self._seq = itertools.count()
+        self._stopped = False
+
+        self.wakeups = 0
+        self.runs = 0
+
+    def _wait_event(self, timeout: Optional[float]):
+        self._wake.wait(timeout)
+
+    def _push(self, job: _Job, deadline: float):
+        job.deadline = deadline
+        job.generation += 1
+        heapq.heappush(self._heap, (deadline, next(self._seq), job.generation, job))
+
+    def add_job(self, name: str, period: float, callback: Callable[[], None],
+                enabled: bool = True, delay: float = 0.0):
+        """Registra un trabajo periódico (primera ejecución tras ``delay``)"""
+        with self._lock:
+            job = _Job(name, period, callback, enabled)
+            self._jobs[name] = job
+            if enabled:
+                self._push(job, self._clock() + delay)
+        self.wake()
+
+    def set_enabled(self, name: str, enabled: bool, run_now: bool = True):
+        """Activa/desactiva un trabajo; al activarlo se ejecuta de inmediato"""
+        with self._lock:
+            job = self._jobs[name]
+            if job.enabled == enabled:
+                return
+            job.enabled = enabled
+            if enabled:
+                self._push(job, self._clock() if run_now else self._clock() + job.period)
+            else:
+                job.generation += 1
+        self.wake()
+
+    def set_period(self, name: str, period: float):
+        with self._lock:
+            job = self._jobs[name]
+            job.period = period
+            if job.enabled and job.deadline is not None:
+                self._push(job, min(job.deadline, self._clock() + period))
+        self.wake()
+
+    def run_now(self, name: str):
+        """Adelanta la próxima ejecución de un trabajo activo a ahora"""
+        with self._lock:
+            job = self._jobs[name]
+            if job.enabled:
+                self._push(job, self._clock())
+        self.wake()
+
+    def wake(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stopped = True
+        self.wake()
+
+    def next_deadline(self) -> Optional[float]:
+        with self._lock:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _discard_stale(self):
+        heap = self._heap
+        while heap and (not heap[0][3].enabled or heap[0][2] != heap[0][3].generation):
+            heapq.heappop(heap)
+
+    def run_pending(self) -> Optional[float]:
+        """Ejecuta los trabajos vencidos; devuelve el siguiente plazo"""
+        while True:
+            with self._lock:
+                self._discard_stale()
+                if not self._heap or self._heap[0][0] > self._clock():
+                    return self._heap[0][0] if self._heap else None
+                deadline, _, _, job = heapq.heappop(self._heap)
+                # Plazo fijo (sin deriva); si vamos atrasados, saltar al presente
+                next_deadline = deadline + job.period
+                now = self._clock()
+                self._push(job, next_deadline if next_deadline > now else now + job.period)
+
+            self.runs += 1
+            job.callback()
+
+    def run(self):
+        """Bucle: ejecuta lo vencido y duerme hasta el siguiente plazo"""
+        self._stopped = False
+        while not self._stopped:
+            # Limpiar antes de ejecutar: un wake() posterior no se pierde
+            self._wake.clear()
+            deadline = self.run_pending()
+            timeout = None if deadline is None else max(0.0, deadline - self._clock())
+            if self.max_wait is not None:
+                timeout = self.max_wait if timeout is None else min(timeout, self.max_wait)
+            self._wait(timeout)
+            self.wakeups += 1
@@ -0,0 +1,192 @@
+# src/sharedmem.py - Últimos valores de sensores en memoria compartida (seqlock) para otros procesos
+import argparse
+import math
+import os
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_NAME = 'arctic_monitor_stats'
+MAGIC = b'ARCM'
+VERSION = 1
+MAX_CORES = 64
+
+# Orden fijo de los valores (las claves de get_quick_stats); añadir solo al final y subir VERSION
+FIELDS = ('cpu_usage', 'cpu_temp', 'gpu_usage', 'gpu_temp',
+          'ram_used_gb', 'ram_total_gb', 'ram_usage',
+          'disk_usage', 'disk_used_gb', 'disk_free_gb', 'disk_total_gb')
+
+# Disposición (little-endian, alineada a 8 bytes):
+#   0  magic 4s | version H | campos H
+#   8  seq Q         impar mientras el escritor está a mitad de una publicación
+#   16 publicado d   time.time() de la muestra
+#   24 núcleos I | reservado I
+#   32 valores d * len(FIELDS)       NaN = sin dato
+#      leídos  d * len(FIELDS)       time.time() de la última lectura de cada valor (NaN = nunca)
+#      cargas  d * MAX_CORES         cpu_core_loads (solo las ``núcleos`` primeras)
+HEADER = struct.Struct('<4sHH')
+SEQ = struct.Struct('<Q')
+SEQ_OFFSET = 8
+PAYLOAD = struct.Struct(f'<dII{len(FIELDS)}d{len(FIELDS)}d{MAX_CORES}d')
+PAYLOAD_OFFSET = 16
+SIZE = PAYLOAD_OFFSET + PAYLOAD.size
+
+_NAN = math.nan
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Abre un bloque existente sin que el ``resource_tracker`` lo borre al salir"""
+    try:
+        return shared_memory.SharedMemory(name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name)
+    if os.name == 'posix':
+        # Antes de 3.13 el tracker de este proceso desenlazaría el bloque del escritor
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class SharedStatsWriter:
+    """Listener de ``HardwareMonitor`` que publica cada muestra en memoria compartida.
+
+    Un seqlock protege la publicación: el contador ``seq`` pasa a impar,
+    se escriben todos los valores con un único ``pack_into`` y vuelve a
+    par. Los lectores no toman locks ni hacen syscalls por lectura y
+    reintentan si el contador cambió mientras copiaban. Solo debe haber un
+    escritor por bloque (el hilo del monitor).
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME):
+        try:
+            self._shm = shared_memory.SharedMemory(name, create=True, size=SIZE)
+        except FileExistsError:
+            # Bloque de una ejecución anterior que no se cerró: reutilizarlo si cabe
+            self._shm = shared_memory.SharedMemory(name)
+            if self._shm.size < SIZE:
+                size = self._shm.size
+                self._shm.close()
+                raise ValueError(f"El bloque {name} existe con {size} bytes (necesita {SIZE})")
+        self.name = name
+        self._buf = self._shm.buf
+        self._seq = 0
+        SEQ.pack_into(self._buf, SEQ_OFFSET, 0)
+        HEADER.pack_into(self._buf, 0, MAGIC, VERSION, len(FIELDS))
+
+    def __call__(self, data: Mapping[str, Any]):
+        values = []
+        stamps = []
+        sampled_at = data.get('sampled_at') or {}
+        for field in FIELDS:
+            value = data.get(field)
+            values.append(_NAN if value is None else float(value))
+            stamps.append(sampled_at.get(field, _NAN))
+        loads = data.get('cpu_core_loads') or ()
+        cores = min(len(loads), MAX_CORES)
+        loads = list(loads[:cores]) + [0.0] * (MAX_CORES - cores)
+
+        buf = self._buf
+        seq = self._seq
+        SEQ.pack_into(buf, SEQ_OFFSET, seq + 1)  # Impar: publicación en curso
+        PAYLOAD.pack_into(buf, PAYLOAD_OFFSET, time.time(), cores, 0, *values, *stamps, *loads)
+        SEQ.pack_into(buf, SEQ_OFFSET, seq + 2)
+        self._seq = seq + 2
+
+    @property
+    def published(self) -> int:
+        return self._seq // 2
+
+    def close(self):
+        """Libera y borra el bloque (los lectores abiertos conservan su vista)"""
+        self._buf = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedStatsReader:
+    """Lector de ``SharedStatsWriter`` para cualquier proceso local.
+
+    Se adjunta una vez al bloque; después cada ``read`` son solo copias en
+    memoria. ``seq`` (número de muestras publicadas) permite saltarse la
+    lectura si no hubo nada nuevo.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME, retries: int = 100):
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        self.retries = retries
+        self.retried = 0  # Lecturas repetidas por coincidir con una publicación
+        magic, version, fields = HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION or fields != len(FIELDS):
+            self.close()
+            raise ValueError(f"El bloque {name} no es de Arctic Monitor v{VERSION}")
+
+    @property
+    def seq(self) -> int:
+        """Muestras publicadas hasta ahora (0 = aún ninguna)"""
+        return SEQ.unpack_from(self._buf, SEQ_OFFSET)[0] // 2
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """Copia consistente de la última muestra (None si aún no hay ninguna o no se pudo)"""
+        buf = self._buf
+        for attempt in range(self.retries):
+            before = SEQ.unpack_from(buf, SEQ_OFFSET)[0]
+            if not before & 1:
+                payload = PAYLOAD.unpack_from(buf, PAYLOAD_OFFSET)
+                if SEQ.unpack_from(buf, SEQ_OFFSET)[0] == before:
+                    return self._decode(before // 2, payload) if before else None
+            self.retried += 1
+            if attempt >= 3:
+                time.sleep(0)  # Ceder al escritor si lo interrumpieron a mitad
+        return None
+
+    @staticmethod
+    def _decode(seq: int, payload) -> Dict[str, Any]:
+        n = len(FIELDS)
+        published_at, cores = payload[0], payload[1]
+        values = payload[3:3 + n]
+        stamps = payload[3 + n:3 + 2 * n]
+        stats = {field: None if value != value else value for field, value in zip(FIELDS, values)}
+        stats['cpu_core_loads'] = list(payload[3 + 2 * n:3 + 2 * n + cores])
+        stats['sampled_at'] = {field: stamp for field, stamp in zip(FIELDS, stamps) if stamp == stamp}
+        stats['seq'] = seq
+        stats['published_at'] = published_at
+        return stats
+
+    def close(self):
+        self._buf = None
+        self._shm.close()
+
+
+def main():
+    """Muestra los valores publicados por un monitor en marcha (``python -m src.sharedmem``)"""
+    parser = argparse.ArgumentParser(description="Lee las estadísticas compartidas de Arctic Monitor")
+    parser.add_argument('--name', default=DEFAULT_NAME)
+    parser.add_argument('--interval', type=float, default=1.0)
+    args = parser.parse_args()
+
+    reader = SharedStatsReader(args.name)
+    seq = None
+    try:
+        while True:
+            if reader.seq != seq:
+                stats = reader.read()
+                if stats:
+                    seq = stats['seq']
+                    values = ' '.join(f"{field}={stats[field]:.1f}" for field in FIELDS
+                                      if stats[field] is not None)
+                    print(f"[{seq}] {values}")
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# src/status_server.py - Endpoint HTTP local con el estado del monitor (JSON)
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Tuple, Union
+
+DEFAULT_STATUS_PORT = 8086  # LibreHardwareMonitor usa 8085
+
+# Una ruta devuelve un dict (se sirve como JSON) o (content_type, bytes)
+Route = Callable[[], Union[Dict[str, Any], Tuple[str, bytes]]]
+
+
+class StatusServer:
+    """Servidor HTTP mínimo, solo en localhost, para consultar el monitor.
+
+    Cada ruta es una función sin argumentos que se llama en el hilo del
+    servidor; debe ser rápida y no bloquear el pipeline (leer contadores,
+    no tomar muestras).
+    """
+
+    def __init__(self, port: int = DEFAULT_STATUS_PORT, host: str = '127.0.0.1'):
+        self.routes = {}  # type: Dict[str, Route]
+        self.request_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, content_type, body = server._handle(self.path.split('?', 1)[0])
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def add_route(self, path: str, handler: Route):
+        self.routes['/' + path.strip('/')] = handler
+
+    def _handle(self, path: str) -> Tuple[int, str, bytes]:
+        self.request_count += 1
+        handler = self.routes.get('/' + path.strip('/'))
+        if handler is None:
+            body = json.dumps({"error": f"Unknown path {path}", "routes": sorted(self.routes)})
+            return 404, 'application/json', body.encode('utf-8')
+        try:
+            result = handler()
+        except Exception as e:
+            return 500, 'application/json', json.dumps({"error": str(e)}).encode('utf-8')
+        if isinstance(result, tuple):
+            return (200,) + result
+        return 200, 'application/json', json.dumps(result, default=str).encode('utf-8')
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StatusServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='status', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()